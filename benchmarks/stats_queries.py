@@ -0,0 +1,128 @@
+"""StatsManager 판별 기록 조회 벤치마크 (합성 데이터)
+
+임시 DB의 sessions 테이블에 1년 동안 고르게 흩어진 판 기록(난이도 3종,
+모드 4종, 지수 분포 점수)을 채운 뒤 분위수/히스토그램/일별 추세 조회
+시간을 측정한다.
+
+    python benchmarks/stats_queries.py                # 200만 판
+    python benchmarks/stats_queries.py --rows 500000 --max-ms 200
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from managers.stats_manager import StatsManager  # noqa: E402
+
+
+DIFFICULTIES = ('easy', 'normal', 'hard')
+MODES = ('classic', 'portal', 'survival', 'time_attack')
+HISTORY_DAYS = 365  # 기록이 흩어진 기간
+MEAN_SCORE = 80  # 점수 지수 분포 평균
+INSERT_CHUNK = 100_000
+
+
+def fill_sessions(manager: StatsManager, rows: int, seed: int = 0) -> None:
+    """
+    sessions 테이블을 합성 기록으로 채움 (시간 순서대로 삽입)
+
+    Args:
+        manager: 대상 통계 매니저
+        rows: 기록 수
+        seed: 난수 시드
+    """
+    rng = np.random.default_rng(seed)
+    now = datetime.now()
+    ages = np.sort(rng.random(rows) * HISTORY_DAYS * 86400)[::-1]  # 오래된 기록부터
+    difficulties = rng.integers(len(DIFFICULTIES), size=rows)
+    modes = rng.integers(len(MODES), size=rows)
+    scores = rng.exponential(MEAN_SCORE, size=rows).astype(int)
+    playtimes = rng.uniform(10, 300, size=rows)
+
+    conn = manager._connection()
+    for start in range(0, rows, INSERT_CHUNK):
+        end = min(start + INSERT_CHUNK, rows)
+        with conn:
+            conn.executemany(
+                "INSERT INTO sessions (played_at, difficulty, mode, score, playtime, food_eaten) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                ((
+                    (now - timedelta(seconds=float(ages[i]))).isoformat(),
+                    DIFFICULTIES[difficulties[i]], MODES[modes[i]], int(scores[i]),
+                    float(playtimes[i]), int(scores[i]) // 10,
+                ) for i in range(start, end)))
+
+
+def measure(function, *args, repeat: int = 3, **kwargs) -> float:
+    """
+    조회 시간 측정 (첫 호출로 캐시를 데운 뒤 repeat번 중 최솟값)
+
+    Returns:
+        걸린 시간 (ms)
+    """
+    function(*args, **kwargs)
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function(*args, **kwargs)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def run(rows: int, seed: int = 0, max_ms: float = None) -> bool:
+    """
+    벤치마크 실행
+
+    Args:
+        rows: 합성 기록 수
+        seed: 난수 시드
+        max_ms: 조회 하나가 이보다 오래 걸리면 실패 (None이면 검사 안 함)
+
+    Returns:
+        모든 조회가 max_ms 안에 끝났는지 여부
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        manager = StatsManager(os.path.join(directory, 'bench_stats.db'))
+        started = time.perf_counter()
+        fill_sessions(manager, rows, seed)
+        print(f"{rows:,} sessions inserted in {time.perf_counter() - started:.1f}s")
+
+        queries = [
+            ("p50/p95 hard, 30 days", manager.get_score_percentiles, ('hard', (50, 95)),
+             {'days': 30}),
+            ("p50/p95 hard/classic, 30 days", manager.get_score_percentiles, ('hard', (50, 95)),
+             {'mode': 'classic', 'days': 30}),
+            ("p50/p95 hard, all time", manager.get_score_percentiles, ('hard', (50, 95)), {}),
+            ("histogram hard, 30 days", manager.get_score_histogram, ('hard', 50), {'days': 30}),
+            ("daily trend, 30 days", manager.get_daily_trend, (30,), {}),
+            ("daily trend hard, 30 days", manager.get_daily_trend, (30, 'hard'), {}),
+        ]
+        passed = True
+        for name, function, args, kwargs in queries:
+            elapsed = measure(function, *args, **kwargs)
+            slow = max_ms is not None and elapsed > max_ms
+            passed = passed and not slow
+            print(f"{name:32s} {elapsed:8.1f} ms{'  SLOW' if slow else ''}")
+        print("p50/p95 hard, 30 days =", manager.get_score_percentiles('hard', (50, 95), days=30))
+        manager.close()
+    return passed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2_000_000, help="합성 기록 수")
+    parser.add_argument('--seed', type=int, default=0, help="난수 시드")
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help="조회 하나의 허용 시간 (넘으면 종료 코드 1)")
+    args = parser.parse_args()
+    sys.exit(0 if run(args.rows, args.seed, args.max_ms) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,16 +1,48 @@
 """설정 관리 클래스"""
+import atexit
 import json
 import os
+import tempfile
+import threading
+import time
+import weakref
+
+
+CONFIG_SAVE_DELAY = 1.0  # 마지막 변경 후 파일에 기록하기까지 대기 시간 (초)
+CONFIG_WATCH_INTERVAL = 1.0  # 외부 수정 확인(mtime) 최소 간격 (초)
+
+_managers = weakref.WeakSet()  # 종료 시/같은 파일 로드 시 기록할 인스턴스
 
 
 class ConfigManager:
-    def __init__(self, config_file='config.json'):
-        """설정 관리자 초기화"""
+    def __init__(self, config_file='config.json', save_delay=CONFIG_SAVE_DELAY):
+        """
+        설정 관리자 초기화
+        
+        set()은 메모리의 값만 바꾸고, 변경이 save_delay초 동안 없으면
+        백그라운드 타이머가 한 번에 기록한다 (flush() 또는 종료 시에도 기록).
+        
+        Args:
+            config_file: 설정 파일 경로
+            save_delay: 디바운스 간격 (초)
+        """
         self.config_file = config_file
+        self.save_delay = save_delay
+        self._lock = threading.RLock()
+        self._timer = None
+        self._dirty_keys = set()  # 아직 기록하지 않은 키
+        self._mtime = None  # 마지막으로 읽거나 쓴 파일의 mtime (외부 수정 감지용)
+        self._last_check = time.monotonic()
         self.config = self.load_config()
+        _managers.add(self)
     
     def load_config(self):
-        """설정 파일 로드"""
+        """설정 파일 로드 (같은 파일의 기록 대기 중인 변경이 있으면 먼저 기록)"""
+        path = os.path.abspath(self.config_file)
+        for manager in list(_managers):
+            if manager is not self and os.path.abspath(manager.config_file) == path:
+                manager.flush()
+        
         default_config = {
             'difficulty': 'normal',
             'portal_mode': False,
@@ -20,6 +52,7 @@ class ConfigManager:
         
         try:
             if os.path.exists(self.config_file):
+                self._mtime = os.stat(self.config_file).st_mtime_ns
                 with open(self.config_file, 'r') as f:
                     loaded_config = json.load(f)
                     # 기본값과 병합 (누락된 키 처리)
@@ -30,21 +63,83 @@ class ConfigManager:
         return default_config
     
     def save_config(self):
-        """설정 파일 저장"""
+        """설정 파일 저장 (임시 파일에 쓴 뒤 교체하므로 중간에 중단돼도 안전)"""
+        with self._lock:
+            data = json.dumps(self.config, indent=4)
+            self._dirty_keys.clear()
+        directory = os.path.dirname(os.path.abspath(self.config_file))
+        temp_path = None
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=4)
-        except IOError as e:
+            fd, temp_path = tempfile.mkstemp(prefix='.config-', suffix='.tmp', dir=directory)
+            with os.fdopen(fd, 'w') as f:
+                f.write(data)
+            os.replace(temp_path, self.config_file)
+            self._mtime = os.stat(self.config_file).st_mtime_ns
+        except (IOError, OSError) as e:
             print(f"설정 파일 저장 실패: {e}")
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    def flush(self):
+        """기록 대기 중인 변경을 바로 파일에 기록"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty_keys:
+                return
+            self.save_config()
+    
+    def is_dirty(self):
+        """기록 대기 중인 변경이 있는지 확인"""
+        return bool(self._dirty_keys)
     
     def get(self, key, default=None):
         """설정값 가져오기"""
         return self.config.get(key, default)
     
     def set(self, key, value):
-        """설정값 변경 및 저장"""
-        self.config[key] = value
-        self.save_config()
+        """설정값 변경 (파일 기록은 디바운스 후 백그라운드에서)"""
+        with self._lock:
+            self.config[key] = value
+            self._dirty_keys.add(key)
+            # 연속 변경은 마지막 변경 후 save_delay초에 한 번만 기록
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.save_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def check_external_changes(self, force=False):
+        """
+        설정 파일이 외부에서 수정됐는지 확인하고 다시 읽기
+        
+        mtime은 CONFIG_WATCH_INTERVAL마다 한 번만 확인한다. 기록 대기 중인
+        키는 메모리 값을 유지한다.
+        
+        Args:
+            force: 확인 간격과 상관없이 바로 확인
+        
+        Returns:
+            값이 바뀐 키 목록
+        """
+        now = time.monotonic()
+        if not force and now - self._last_check < CONFIG_WATCH_INTERVAL:
+            return []
+        self._last_check = now
+        try:
+            mtime = os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            return []
+        if mtime == self._mtime:
+            return []
+        
+        with self._lock:
+            previous = self.config
+            loaded = self.load_config()
+            pending = {key: previous[key] for key in self._dirty_keys}
+            self.config = {**loaded, **pending}
+            return [key for key in self.config if self.config.get(key) != previous.get(key)]
     
     def get_difficulty(self):
         """난이도 반환"""
@@ -64,3 +159,10 @@ class ConfigManager:
         current = self.is_portal_mode()
         self.set('portal_mode', not current)
         return not current
+
+
+@atexit.register
+def flush_all_configs():
+    """프로세스 종료 시 기록 대기 중인 설정 모두 기록"""
+    for manager in list(_managers):
+        manager.flush()
@@ -7,3 +7,4 @@ sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
 # pygame headless 모드 설정
 os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
@@ -1,12 +1,16 @@
 """게임에서 사용되는 상수 정의"""
 
+# 보드 설정 (논리 해상도 - 창이 커지면 RenderTarget이 확대)
+GRID_SIZE = 20  # 각 블록의 크기 (픽셀)
+GRID_WIDTH = 30  # 가로 칸 수
+GRID_HEIGHT = 30  # 세로 칸 수
+BOARD_WIDTH = GRID_WIDTH * GRID_SIZE  # 600
+BOARD_HEIGHT = GRID_HEIGHT * GRID_SIZE  # 600
+
 # 화면 설정
 INFO_PANEL_HEIGHT = 40  # 정보 패널 높이
-WINDOW_WIDTH = 600
-WINDOW_HEIGHT = 600 + INFO_PANEL_HEIGHT  # 패널 포함
-GRID_SIZE = 20  # 각 블록의 크기 (픽셀)
-GRID_WIDTH = 600 // GRID_SIZE  # 30
-GRID_HEIGHT = 600 // GRID_SIZE  # 30
+WINDOW_WIDTH = BOARD_WIDTH
+WINDOW_HEIGHT = BOARD_HEIGHT + INFO_PANEL_HEIGHT  # 패널 포함
 
 # 색상 (RGB)
 BLACK = (0, 0, 0)
@@ -43,6 +47,11 @@ DIFFICULTIES = {
     }
 }
 
+# 렌더링/시뮬레이션 루프
+RENDER_FPS = 60  # 화면 갱신 속도 (게임 속도와 무관)
+MAX_TICKS_PER_FRAME = 5  # 한 프레임에 따라잡을 최대 로직 틱 수 (긴 지연 후 폭주 방지)
+INPUT_QUEUE_SIZE = 3  # 틱 사이에 보관할 최대 방향 입력 수
+
 # 게임 설정 (기본값 - Normal)
 INITIAL_FPS = 10  # 초기 속도
 MAX_FPS = 20  # 최대 속도
@@ -53,6 +62,7 @@ GOLDEN_APPLE_PROBABILITY = 0.1  # 10% 확률
 GOLDEN_APPLE_SCORE = 50  # 점수
 GOLDEN_APPLE_TIMEOUT = 10  # 10초 후 사라짐
 NORMAL_FOOD_SCORE = 10  # 일반 먹이 점수
+MAX_FOOD_SPAWN_ATTEMPTS = 100  # 빈 칸 인덱스 없이 생성 시 랜덤 시도 횟수
 
 # 방향
 UP = (0, -1)
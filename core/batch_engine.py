@@ -0,0 +1,482 @@
+"""NumPy 기반 배치 시뮬레이터 (N개의 게임을 벡터 연산으로 동시에 진행)"""
+from typing import List, Optional, Tuple
+import numpy as np
+from constants import (
+    GRID_WIDTH, GRID_HEIGHT, DIFFICULTIES, UP, DOWN, LEFT, RIGHT,
+    GOLDEN_APPLE_PROBABILITY, GOLDEN_APPLE_SCORE, GOLDEN_APPLE_TIMEOUT,
+    NORMAL_FOOD_SCORE
+)
+
+
+# 방향 인덱스 (actions 배열 값)
+ACTION_NONE = -1
+ACTION_UP = 0
+ACTION_DOWN = 1
+ACTION_LEFT = 2
+ACTION_RIGHT = 3
+DIRECTIONS = (UP, DOWN, LEFT, RIGHT)
+_DX = np.array([d[0] for d in DIRECTIONS], dtype=np.int16)
+_DY = np.array([d[1] for d in DIRECTIONS], dtype=np.int16)
+_OPPOSITE = np.array([ACTION_DOWN, ACTION_UP, ACTION_RIGHT, ACTION_LEFT], dtype=np.int8)
+
+# step() 결과 이벤트 코드
+BATCH_EVENT_NONE = 0
+BATCH_EVENT_EAT = 1
+BATCH_EVENT_GAME_OVER = 2
+
+# 게임 오버 원인 코드
+REASON_NONE = 0
+REASON_WALL = 1
+REASON_OBSTACLE = 2
+REASON_SELF = 3
+REASON_BOARD_FULL = 4
+
+COMBO_BONUS = 5  # ScoreManager 콤보 보너스
+COMBO_TIMEOUT = 10.0  # ScoreManager 콤보 제한 시간 (초)
+_FOOD_SAMPLE_ATTEMPTS = 8  # 빈 칸 랜덤 샘플링 시도 횟수 (이후 전체 탐색)
+
+
+class BatchGameState:
+    """
+    N개의 보드를 NumPy 배열로 보관하는 배치 게임 상태
+
+    GameState.step()과 같은 규칙(이동, 벽/Portal, 장애물/자기 충돌, 먹기, 콤보,
+    Golden Apple, 속도 증가)을 따른다. 시간은 틱마다 1 / current_fps초씩 흐르는
+    시뮬레이션 시간으로 계산하므로 실행 속도와 무관하게 결과가 재현된다.
+
+    step()은 살아 있는 게임만 골라내는 대신 전체 게임에 대해 마스크로 계산하고,
+    모든 중간값을 미리 할당한 작업 버퍼에 out=/np.take(out=, mode='clip')/np.put으로
+    써서 매 틱 새 배열을 만들지 않는다. 연산마다 입력/출력 dtype을 맞추고 (다르면
+    np.copyto로 먼저 변환) ufunc의 형 변환 버퍼도 생기지 않게 한다. 먹기/Golden
+    Apple 재생성/초기화처럼 일부 게임에만 일어나는 처리는 해당 게임의 인덱스 배열을
+    만든다.
+    """
+
+    def __init__(self, num_games: int, difficulty: str = 'normal', portal_mode: bool = False,
+                 seed: Optional[int] = None, width: int = GRID_WIDTH, height: int = GRID_HEIGHT,
+                 golden_apple_probability: float = GOLDEN_APPLE_PROBABILITY):
+        """
+        배치 게임 상태 초기화
+
+        Args:
+            num_games: 동시에 진행할 게임 수
+            difficulty: 난이도 (easy, normal, hard)
+            portal_mode: Portal 모드 활성화 여부
+            seed: 난수 시드
+            width: 그리드 가로 칸 수
+            height: 그리드 세로 칸 수
+            golden_apple_probability: Golden Apple 생성 확률
+        """
+        self.num_games = num_games
+        self.difficulty = difficulty
+        self.portal_mode = portal_mode
+        self.width = width
+        self.height = height
+        self.golden_apple_probability = golden_apple_probability
+        self.rng = np.random.default_rng(seed)
+
+        settings = DIFFICULTIES[difficulty]
+        self.initial_fps = settings['initial_fps']
+        self.speed_increase_interval = settings['speed_increase_interval']
+        self.max_fps = settings['max_fps']
+        self.obstacle_count = settings['obstacles']
+
+        n = num_games
+        self.capacity = width * height + 1
+
+        # 몸통 링 버퍼 (head_ptr 위치가 머리, 뒤로 length개가 몸통)
+        self.body_x = np.zeros((n, self.capacity), dtype=np.int16)
+        self.body_y = np.zeros((n, self.capacity), dtype=np.int16)
+        self.head_ptr = np.zeros(n, dtype=np.int32)
+        self.length = np.zeros(n, dtype=np.int32)
+        self.direction = np.zeros(n, dtype=np.int8)
+        self.growing = np.zeros(n, dtype=bool)
+
+        # 점유 그리드 (뱀 마디 수, 장애물 여부)
+        self.occupancy = np.zeros((n, height, width), dtype=np.uint8)
+        self.obstacles = np.zeros((n, height, width), dtype=bool)
+
+        # 먹이
+        self.food_x = np.zeros(n, dtype=np.int16)
+        self.food_y = np.zeros(n, dtype=np.int16)
+        self.food_golden = np.zeros(n, dtype=bool)
+        self.food_spawn_time = np.zeros(n, dtype=np.float64)
+
+        # 점수/속도/시간
+        self.score = np.zeros(n, dtype=np.int64)
+        self.food_eaten = np.zeros(n, dtype=np.int32)
+        self.combo_active = np.zeros(n, dtype=bool)
+        self.last_food_time = np.zeros(n, dtype=np.float64)
+        self.current_fps = np.zeros(n, dtype=np.int32)
+        self.sim_time = np.zeros(n, dtype=np.float64)
+        self.tick = np.zeros(n, dtype=np.int64)
+
+        # 게임 오버
+        self.done = np.zeros(n, dtype=bool)
+        self.reason = np.zeros(n, dtype=np.int8)
+
+        # 평탄화 뷰 (np.take/np.put으로 게임별 칸을 한 번에 읽고 씀)
+        self.body_x_flat = self.body_x.reshape(-1)
+        self.body_y_flat = self.body_y.reshape(-1)
+        self.occupancy_flat = self.occupancy.reshape(-1)
+        self.obstacles_flat = self.obstacles.reshape(-1)
+        rows = np.arange(n, dtype=np.intp)
+        self.row_slots = rows * self.capacity  # 게임별 링 버퍼 시작 위치
+        self.row_cells = rows * (width * height)  # 게임별 그리드 시작 위치
+
+        # step() 작업 버퍼 (매 틱 재사용)
+        self._events = np.zeros(n, dtype=np.int8)
+        self._actions = np.zeros(n, dtype=np.int8)
+        self._alive = np.zeros(n, dtype=bool)
+        self._moving = np.zeros(n, dtype=bool)
+        self._hit = np.zeros(n, dtype=bool)
+        self._mask = np.zeros(n, dtype=bool)
+        self._mask2 = np.zeros(n, dtype=bool)
+        self._new_x = np.zeros(n, dtype=np.int16)
+        self._new_y = np.zeros(n, dtype=np.int16)
+        self._tail_x = np.zeros(n, dtype=np.int16)
+        self._tail_y = np.zeros(n, dtype=np.int16)
+        self._direction = np.zeros(n, dtype=np.intp)  # 방향 테이블 조회용 인덱스
+        self._int8 = np.zeros(n, dtype=np.int8)
+        self._int16 = np.zeros(n, dtype=np.int16)
+        self._int32 = np.zeros(n, dtype=np.int32)
+        self._uint8 = np.zeros(n, dtype=np.uint8)
+        self._float64 = np.zeros(n, dtype=np.float64)
+        self._index = np.zeros(n, dtype=np.intp)
+        self._slot = np.zeros(n, dtype=np.intp)
+        self._tail_slot = np.zeros(n, dtype=np.intp)
+        self._cell = np.zeros(n, dtype=np.intp)
+        self._tail_cell = np.zeros(n, dtype=np.intp)
+
+        self.reset()
+
+    # ------------------------------------------------------------------
+    # 초기화
+    # ------------------------------------------------------------------
+
+    def reset(self, indices=None) -> None:
+        """
+        게임 초기화
+
+        Args:
+            indices: 초기화할 게임 인덱스 (None이면 전체)
+        """
+        if indices is None:
+            idx = np.arange(self.num_games)
+        else:
+            idx = np.asarray(indices, dtype=np.intp).reshape(-1)
+        if idx.size == 0:
+            return
+
+        # Snake()와 같은 초기 몸통: 중앙에서 오른쪽을 향한 길이 3
+        center_x = self.width // 2
+        center_y = self.height // 2
+        self.occupancy[idx] = 0
+        self.obstacles[idx] = False
+        self.body_x[idx, 0] = center_x - 2
+        self.body_x[idx, 1] = center_x - 1
+        self.body_x[idx, 2] = center_x
+        self.body_y[idx, :3] = center_y
+        self.head_ptr[idx] = 2
+        self.length[idx] = 3
+        self.direction[idx] = ACTION_RIGHT
+        self.growing[idx] = False
+        for offset in range(3):
+            self.occupancy[idx, center_y, center_x - offset] = 1
+
+        self.score[idx] = 0
+        self.food_eaten[idx] = 0
+        self.combo_active[idx] = False
+        self.last_food_time[idx] = 0.0
+        self.current_fps[idx] = self.initial_fps
+        self.sim_time[idx] = 0.0
+        self.tick[idx] = 0
+        self.done[idx] = False
+        self.reason[idx] = REASON_NONE
+
+        # 장애물 (먹이보다 먼저 배치하여 먹이가 장애물을 피하도록 함)
+        for _ in range(self.obstacle_count):
+            cells = self._sample_free_cells(idx)
+            placed = cells >= 0
+            self.obstacles[idx[placed], cells[placed] // self.width, cells[placed] % self.width] = True
+
+        full = self._spawn_food(idx)
+        self._end_games(idx[full], REASON_BOARD_FULL)
+
+    # ------------------------------------------------------------------
+    # 진행
+    # ------------------------------------------------------------------
+
+    def step(self, actions=None) -> np.ndarray:
+        """
+        모든 게임을 한 틱 진행 (게임 오버된 보드는 그대로 유지)
+
+        Args:
+            actions: 게임별 방향 인덱스 배열 (ACTION_UP 등, ACTION_NONE은 유지)
+
+        Returns:
+            게임별 이벤트 코드 배열 (BATCH_EVENT_*, 내부 버퍼라 다음 step에서 덮어씀)
+        """
+        events = self._events
+        alive = self._alive
+        moving = self._moving
+        hit = self._hit
+        mask = self._mask
+        np.logical_not(self.done, out=alive)
+        events.fill(BATCH_EVENT_NONE)
+        np.copyto(events, BATCH_EVENT_GAME_OVER, where=self.done)
+
+        # 방향 변경 (반대 방향 무시)
+        if actions is not None:
+            np.copyto(self._actions, actions, casting='unsafe')
+            np.copyto(self._direction, self.direction)
+            np.take(_OPPOSITE, self._direction, out=self._int8, mode='clip')
+            np.not_equal(self._actions, self._int8, out=mask)
+            np.logical_and(mask, alive, out=mask)
+            np.greater_equal(self._actions, 0, out=self._mask2)
+            np.logical_and(mask, self._mask2, out=mask)
+            np.copyto(self.direction, self._actions, where=mask)
+
+        if not alive.any():
+            return events
+        np.add(self.tick, 1, out=self.tick, where=alive)
+
+        # Golden Apple 타이머 체크 (시간 경과 시 재생성)
+        if self.food_golden.any():
+            np.subtract(self.sim_time, self.food_spawn_time, out=self._float64)
+            np.greater_equal(self._float64, GOLDEN_APPLE_TIMEOUT, out=mask)
+            np.logical_and(mask, self.food_golden, out=mask)
+            np.logical_and(mask, alive, out=mask)
+            if mask.any():
+                self._spawn_food(np.flatnonzero(mask))
+
+        # 새 머리 위치
+        new_x, new_y = self._new_x, self._new_y
+        self._load_slots(self.head_ptr, self._slot)
+        np.take(self.body_x_flat, self._slot, out=new_x, mode='clip')
+        np.take(self.body_y_flat, self._slot, out=new_y, mode='clip')
+        np.copyto(self._direction, self.direction)
+        np.take(_DX, self._direction, out=self._int16, mode='clip')
+        np.add(new_x, self._int16, out=new_x)
+        np.take(_DY, self._direction, out=self._int16, mode='clip')
+        np.add(new_y, self._int16, out=new_y)
+
+        np.copyto(moving, alive)
+        if self.portal_mode:
+            np.remainder(new_x, self.width, out=new_x)
+            np.remainder(new_y, self.height, out=new_y)
+        else:
+            np.less(new_x, 0, out=hit)
+            np.greater_equal(new_x, self.width, out=mask)
+            np.logical_or(hit, mask, out=hit)
+            np.less(new_y, 0, out=mask)
+            np.logical_or(hit, mask, out=hit)
+            np.greater_equal(new_y, self.height, out=mask)
+            np.logical_or(hit, mask, out=hit)
+            np.logical_and(hit, moving, out=hit)
+            self._end_where(hit, REASON_WALL)
+            # 벽에 부딪힌/끝난 게임도 아래의 칸 조회가 보드 안을 가리키도록 (결과는 쓰지 않음)
+            np.clip(new_x, 0, self.width - 1, out=new_x)
+            np.clip(new_y, 0, self.height - 1, out=new_y)
+        cell = self._cell
+        self._load_cells(new_x, new_y, cell)
+
+        # 장애물 충돌
+        np.take(self.obstacles_flat, cell, out=hit, mode='clip')
+        np.logical_and(hit, moving, out=hit)
+        self._end_where(hit, REASON_OBSTACLE)
+
+        # 자기 충돌 (성장 중이 아니면 이번 틱에 비워지는 꼬리 칸은 제외)
+        tail_slot = self._tail_slot
+        np.copyto(tail_slot, self.head_ptr)
+        np.copyto(self._index, self.length)
+        np.subtract(tail_slot, self._index, out=tail_slot)
+        np.add(tail_slot, 1, out=tail_slot)
+        np.remainder(tail_slot, self.capacity, out=tail_slot)
+        np.add(tail_slot, self.row_slots, out=tail_slot)
+        tail_x, tail_y = self._tail_x, self._tail_y
+        np.take(self.body_x_flat, tail_slot, out=tail_x, mode='clip')
+        np.take(self.body_y_flat, tail_slot, out=tail_y, mode='clip')
+        into_tail = self._mask2
+        np.equal(new_x, tail_x, out=into_tail)
+        np.equal(new_y, tail_y, out=mask)
+        np.logical_and(into_tail, mask, out=into_tail)
+        np.logical_not(self.growing, out=mask)
+        np.logical_and(into_tail, mask, out=into_tail)
+        np.take(self.occupancy_flat, cell, out=self._uint8, mode='clip')
+        np.greater(self._uint8, 0, out=hit)
+        np.logical_not(into_tail, out=mask)
+        np.logical_and(hit, mask, out=hit)
+        np.logical_and(hit, moving, out=hit)
+        self._end_where(hit, REASON_SELF)
+
+        # 이동: 꼬리 제거 (성장 중이 아니면) 후 머리 추가
+        shrink = mask
+        np.logical_not(self.growing, out=shrink)
+        np.logical_and(shrink, moving, out=shrink)
+        tail_cell = self._tail_cell
+        self._load_cells(tail_x, tail_y, tail_cell)
+        np.take(self.occupancy_flat, tail_cell, out=self._uint8, mode='clip')
+        np.subtract(self._uint8, 1, out=self._uint8, where=shrink)
+        np.put(self.occupancy_flat, tail_cell, self._uint8, mode='clip')
+
+        grow = mask
+        np.logical_and(self.growing, moving, out=grow)
+        np.add(self.length, 1, out=self.length, where=grow)
+        np.logical_not(moving, out=mask)
+        np.logical_and(self.growing, mask, out=self.growing)
+
+        np.add(self.head_ptr, 1, out=self._int32)
+        np.remainder(self._int32, self.capacity, out=self._int32)
+        np.copyto(self.head_ptr, self._int32, where=moving)
+        self._load_slots(self.head_ptr, self._slot)
+        for flat, value in ((self.body_x_flat, new_x), (self.body_y_flat, new_y)):
+            np.take(flat, self._slot, out=self._int16, mode='clip')
+            np.copyto(self._int16, value, where=moving)
+            np.put(flat, self._slot, self._int16, mode='clip')
+        np.take(self.occupancy_flat, cell, out=self._uint8, mode='clip')
+        np.add(self._uint8, 1, out=self._uint8, where=moving)
+        np.put(self.occupancy_flat, cell, self._uint8, mode='clip')
+
+        # 먹이 먹기
+        ate = mask
+        np.equal(new_x, self.food_x, out=ate)
+        np.equal(new_y, self.food_y, out=self._mask2)
+        np.logical_and(ate, self._mask2, out=ate)
+        np.logical_and(ate, moving, out=ate)
+        if ate.any():
+            eaters = np.flatnonzero(ate)
+            self._eat_food(eaters)
+            events[eaters] = BATCH_EVENT_EAT
+            full = self._spawn_food(eaters)
+            self._end_games(eaters[full], REASON_BOARD_FULL)
+            events[eaters[full]] = BATCH_EVENT_GAME_OVER
+
+        # 시뮬레이션 시간 진행 (현재 속도 기준 한 틱)
+        np.copyto(self._float64, self.current_fps)
+        np.divide(1.0, self._float64, out=self._float64)
+        np.add(self.sim_time, self._float64, out=self.sim_time, where=moving)
+        return events
+
+    def _load_slots(self, ptr: np.ndarray, out: np.ndarray) -> None:
+        """게임별 링 버퍼 위치 ptr을 평탄화된 몸통 배열의 인덱스로 변환"""
+        np.copyto(out, ptr)
+        np.add(out, self.row_slots, out=out)
+
+    def _load_cells(self, x: np.ndarray, y: np.ndarray, out: np.ndarray) -> None:
+        """게임별 좌표 (x, y)를 평탄화된 그리드 배열의 인덱스로 변환"""
+        np.copyto(out, y)
+        np.multiply(out, self.width, out=out)
+        np.copyto(self._index, x)
+        np.add(out, self._index, out=out)
+        np.add(out, self.row_cells, out=out)
+
+    def _end_where(self, hit: np.ndarray, reason: int) -> None:
+        """hit인 게임을 게임 오버 처리하고 이번 틱 이동 대상에서 제외"""
+        np.logical_or(self.done, hit, out=self.done)
+        np.copyto(self.reason, reason, where=hit)
+        np.copyto(self._events, BATCH_EVENT_GAME_OVER, where=hit)
+        np.logical_not(hit, out=self._mask)
+        np.logical_and(self._moving, self._mask, out=self._moving)
+
+    def _eat_food(self, idx: np.ndarray) -> None:
+        """먹이를 먹은 게임의 성장/점수/콤보/속도 처리 (ScoreManager 규칙)"""
+        self.growing[idx] = True
+
+        golden = self.food_golden[idx]
+        gold_idx = idx[golden]
+        self.score[gold_idx] += GOLDEN_APPLE_SCORE
+
+        normal_idx = idx[~golden]
+        combo = (self.food_eaten[normal_idx] > 0) & \
+                (self.sim_time[normal_idx] - self.last_food_time[normal_idx] <= COMBO_TIMEOUT)
+        self.score[normal_idx] += NORMAL_FOOD_SCORE + COMBO_BONUS * combo
+        self.combo_active[normal_idx] = combo
+        self.last_food_time[normal_idx] = self.sim_time[normal_idx]
+
+        self.food_eaten[idx] += 1
+
+        # 속도 증가
+        speed_up = (self.food_eaten[idx] % self.speed_increase_interval == 0) & \
+                   (self.current_fps[idx] < self.max_fps)
+        self.current_fps[idx[speed_up]] += 1
+
+    def _end_games(self, idx: np.ndarray, reason: int) -> None:
+        """게임 오버 처리"""
+        if idx.size:
+            self.done[idx] = True
+            self.reason[idx] = reason
+
+    # ------------------------------------------------------------------
+    # 먹이 생성
+    # ------------------------------------------------------------------
+
+    def _sample_free_cells(self, idx: np.ndarray) -> np.ndarray:
+        """
+        게임별로 뱀/장애물이 없는 임의의 칸 샘플링
+
+        Returns:
+            평탄화된 칸 인덱스 배열 (빈 칸이 없으면 -1)
+        """
+        cells_per_board = self.width * self.height
+        result = np.full(idx.size, -1, dtype=np.int64)
+        pending = np.arange(idx.size)
+
+        # 빈 칸이 충분하면 랜덤 시도로 대부분 해결
+        for _ in range(_FOOD_SAMPLE_ATTEMPTS):
+            if pending.size == 0:
+                return result
+            boards = idx[pending]
+            cells = self.rng.integers(0, cells_per_board, size=pending.size)
+            y, x = cells // self.width, cells % self.width
+            free = (self.occupancy[boards, y, x] == 0) & ~self.obstacles[boards, y, x]
+            result[pending[free]] = cells[free]
+            pending = pending[~free]
+
+        # 보드가 거의 찬 경우 게임별 전체 탐색
+        for i in pending:
+            board = idx[i]
+            free_cells = np.flatnonzero((self.occupancy[board] == 0) & ~self.obstacles[board])
+            if free_cells.size:
+                result[i] = free_cells[self.rng.integers(free_cells.size)]
+        return result
+
+    def _spawn_food(self, idx: np.ndarray) -> np.ndarray:
+        """
+        먹이 생성
+
+        Returns:
+            보드가 가득 차서 생성하지 못한 게임 여부 배열
+        """
+        cells = self._sample_free_cells(idx)
+        full = cells < 0
+        placed = idx[~full]
+        cells = cells[~full]
+        self.food_x[placed] = cells % self.width
+        self.food_y[placed] = cells // self.width
+        self.food_golden[placed] = self.rng.random(placed.size) < self.golden_apple_probability
+        self.food_spawn_time[placed] = self.sim_time[placed]
+        return full
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def get_head(self, game: int) -> Tuple[int, int]:
+        """게임의 머리 위치 반환"""
+        ptr = self.head_ptr[game]
+        return int(self.body_x[game, ptr]), int(self.body_y[game, ptr])
+
+    def get_body(self, game: int) -> List[Tuple[int, int]]:
+        """게임의 몸통 위치 리스트 반환 (머리부터 꼬리까지)"""
+        ptrs = (self.head_ptr[game] - np.arange(self.length[game])) % self.capacity
+        return list(zip(self.body_x[game, ptrs].tolist(), self.body_y[game, ptrs].tolist()))
+
+    def get_food(self, game: int) -> Tuple[int, int]:
+        """게임의 먹이 위치 반환"""
+        return int(self.food_x[game]), int(self.food_y[game])
+
+    def get_obstacle_positions(self, game: int) -> List[Tuple[int, int]]:
+        """게임의 장애물 위치 리스트 반환"""
+        ys, xs = np.nonzero(self.obstacles[game])
+        return list(zip(xs.tolist(), ys.tolist()))
@@ -0,0 +1,461 @@
+"""강화학습용 환경 (Gymnasium 스타일 reset/step API, 디스플레이 불필요)"""
+from typing import Optional, Tuple
+import numpy as np
+from constants import GRID_WIDTH, GRID_HEIGHT, NORMAL_FOOD_SCORE, DIFFICULTIES
+from core.game_state import GameState, EVENT_GAME_OVER
+from core.batch_engine import (
+    BatchGameState, DIRECTIONS, ACTION_UP, ACTION_DOWN, ACTION_LEFT, ACTION_RIGHT
+)
+from managers.score_manager import ScoreManager
+
+
+# 관찰 종류
+OBS_GRID = 'grid'  # (채널, 높이, 너비) float32: 몸통, 머리, 먹이, 장애물
+OBS_FEATURES = 'features'  # (11,) float32: 위험(직진/우/좌), 방향, 먹이 방향
+OBS_RGB = 'rgb'  # (높이, 너비, 3) uint8: 오프스크린 Surface 렌더링
+
+GRID_CHANNELS = 4
+NUM_FEATURES = 11
+NUM_ACTIONS = 4  # ACTION_UP, ACTION_DOWN, ACTION_LEFT, ACTION_RIGHT
+
+# 방향 인덱스 기준 우회전/좌회전 방향
+_TURN_RIGHT = np.array([ACTION_RIGHT, ACTION_LEFT, ACTION_UP, ACTION_DOWN], dtype=np.int8)
+_TURN_LEFT = np.array([ACTION_LEFT, ACTION_RIGHT, ACTION_DOWN, ACTION_UP], dtype=np.int8)
+_DIRECTION_INDEX = {direction: i for i, direction in enumerate(DIRECTIONS)}
+_DX = np.array([d[0] for d in DIRECTIONS], dtype=np.int16)
+_DY = np.array([d[1] for d in DIRECTIONS], dtype=np.int16)
+
+# RGB 렌더링 색상
+_RGB_BODY = (0, 136, 0)
+_RGB_HEAD = (0, 255, 0)
+_RGB_FOOD = (255, 0, 0)
+_RGB_GOLDEN = (255, 215, 0)
+_RGB_OBSTACLE = (128, 128, 128)
+
+
+class RewardConfig:
+    """보상 설정 (ScoreManager 점수 변화 기반)"""
+
+    def __init__(self, score_scale: float = 1.0 / NORMAL_FOOD_SCORE,
+                 death_penalty: float = -1.0, step_penalty: float = 0.0):
+        """
+        보상 설정 초기화
+
+        Args:
+            score_scale: 점수 증가량에 곱하는 배율 (기본값: 일반 먹이 = 1.0)
+            death_penalty: 게임 오버 시 보상
+            step_penalty: 매 틱 더해지는 보상 (음수면 빨리 먹도록 유도)
+        """
+        self.score_scale = score_scale
+        self.death_penalty = death_penalty
+        self.step_penalty = step_penalty
+
+
+class SnakeEnv:
+    """
+    단일 게임 환경 (GameState 래퍼)
+
+    reset(seed) -> (obs, info), step(action) -> (obs, reward, terminated, truncated, info)
+    형식을 따르며, action은 ACTION_UP/DOWN/LEFT/RIGHT (0~3) 정수이다.
+    """
+
+    def __init__(self, difficulty: str = 'normal', portal_mode: bool = False,
+                 obs_type: str = OBS_FEATURES, reward_config: Optional[RewardConfig] = None,
+                 max_steps: int = 10000, rgb_cell_size: int = 4):
+        """
+        환경 초기화
+
+        Args:
+            difficulty: 난이도 (easy, normal, hard)
+            portal_mode: Portal 모드 활성화 여부
+            obs_type: 관찰 종류 (OBS_GRID, OBS_FEATURES, OBS_RGB)
+            reward_config: 보상 설정
+            max_steps: 에피소드 최대 틱 수 (초과 시 truncated)
+            rgb_cell_size: RGB 관찰에서 칸 하나의 픽셀 크기
+        """
+        if obs_type not in (OBS_GRID, OBS_FEATURES, OBS_RGB):
+            raise ValueError(f"알 수 없는 관찰 종류: {obs_type}")
+        self.obs_type = obs_type
+        self.reward_config = reward_config if reward_config is not None else RewardConfig()
+        self.max_steps = max_steps
+        self.rgb_cell_size = rgb_cell_size
+        self.state = GameState(difficulty, portal_mode, ScoreManager(None))
+        self._surface = None
+
+        if obs_type == OBS_GRID:
+            self.observation_shape = (GRID_CHANNELS, GRID_HEIGHT, GRID_WIDTH)
+        elif obs_type == OBS_FEATURES:
+            self.observation_shape = (NUM_FEATURES,)
+        else:
+            self.observation_shape = (GRID_HEIGHT * rgb_cell_size, GRID_WIDTH * rgb_cell_size, 3)
+        self.num_actions = NUM_ACTIONS
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[np.ndarray, dict]:
+        """
+        에피소드 초기화
+
+        Args:
+            seed: 난수 시드
+
+        Returns:
+            (관찰, 정보)
+        """
+        self.state.reset(seed)
+        return self._observe(), self._info()
+
+    def step(self, action: Optional[int]) -> Tuple[np.ndarray, float, bool, bool, dict]:
+        """
+        한 틱 진행
+
+        Args:
+            action: 방향 인덱스 (None이면 현재 방향 유지)
+
+        Returns:
+            (관찰, 보상, 종료 여부, 시간 초과 여부, 정보)
+        """
+        state = self.state
+        prev_score = state.score_manager.get_score()
+        direction = DIRECTIONS[action] if action is not None else None
+        event = state.step(direction)
+
+        config = self.reward_config
+        reward = (state.score_manager.get_score() - prev_score) * config.score_scale + config.step_penalty
+        terminated = event == EVENT_GAME_OVER
+        if terminated:
+            reward += config.death_penalty
+        truncated = not terminated and state.tick >= self.max_steps
+        return self._observe(), reward, terminated, truncated, self._info()
+
+    def _info(self) -> dict:
+        """에피소드 정보"""
+        state = self.state
+        return {
+            'score': state.score_manager.get_score(),
+            'length': len(state.snake.body),
+            'tick': state.tick,
+            'game_over_reason': state.game_over_reason,
+        }
+
+    # ------------------------------------------------------------------
+    # 관찰
+    # ------------------------------------------------------------------
+
+    def _observe(self) -> np.ndarray:
+        """관찰 생성"""
+        if self.obs_type == OBS_FEATURES:
+            return self._observe_features()
+        if self.obs_type == OBS_GRID:
+            return self._observe_grid()
+        return self._observe_rgb()
+
+    def _is_danger(self, position: Tuple[int, int]) -> bool:
+        """해당 칸으로 이동하면 게임 오버인지 확인"""
+        state = self.state
+        x, y = position
+        if state.portal_mode:
+            position = (x % GRID_WIDTH, y % GRID_HEIGHT)
+        elif not (0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT):
+            return True
+        if state.obstacle and state.obstacle.check_collision(position):
+            return True
+        return state.snake.occupies(position)
+
+    def _observe_features(self) -> np.ndarray:
+        """특징 벡터 관찰"""
+        state = self.state
+        head_x, head_y = state.snake.get_head()
+        direction = _DIRECTION_INDEX[state.snake.direction]
+        features = np.zeros(NUM_FEATURES, dtype=np.float32)
+
+        for i, turn in enumerate((direction, _TURN_RIGHT[direction], _TURN_LEFT[direction])):
+            dx, dy = DIRECTIONS[turn]
+            features[i] = self._is_danger((head_x + dx, head_y + dy))
+        features[3 + direction] = 1.0
+
+        food = state.food.get_position()
+        if food is not None:
+            features[7] = food[0] < head_x
+            features[8] = food[0] > head_x
+            features[9] = food[1] < head_y
+            features[10] = food[1] > head_y
+        return features
+
+    def _observe_grid(self) -> np.ndarray:
+        """그리드 텐서 관찰"""
+        state = self.state
+        grid = np.zeros((GRID_CHANNELS, GRID_HEIGHT, GRID_WIDTH), dtype=np.float32)
+        for x, y in state.snake.body:
+            if 0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT:
+                grid[0, y, x] = 1.0
+        head_x, head_y = state.snake.get_head()
+        if 0 <= head_x < GRID_WIDTH and 0 <= head_y < GRID_HEIGHT:
+            grid[1, head_y, head_x] = 1.0
+        food = state.food.get_position()
+        if food is not None:
+            grid[2, food[1], food[0]] = 1.0
+        for x, y in state.get_obstacle_positions():
+            grid[3, y, x] = 1.0
+        return grid
+
+    def _observe_rgb(self) -> np.ndarray:
+        """오프스크린 Surface에 그린 RGB 관찰 (pygame 필요, 디스플레이 불필요)"""
+        import pygame
+
+        cell = self.rgb_cell_size
+        if self._surface is None:
+            self._surface = pygame.Surface((GRID_WIDTH * cell, GRID_HEIGHT * cell))
+        surface = self._surface
+        surface.fill((0, 0, 0))
+
+        state = self.state
+        for x, y in state.get_obstacle_positions():
+            surface.fill(_RGB_OBSTACLE, (x * cell, y * cell, cell, cell))
+        for i, (x, y) in enumerate(state.snake.body):
+            surface.fill(_RGB_HEAD if i == 0 else _RGB_BODY, (x * cell, y * cell, cell, cell))
+        food = state.food.get_position()
+        if food is not None:
+            color = _RGB_GOLDEN if state.food.is_golden else _RGB_FOOD
+            surface.fill(color, (food[0] * cell, food[1] * cell, cell, cell))
+
+        # surfarray는 (너비, 높이, 3) 순서
+        return pygame.surfarray.array3d(surface).transpose(1, 0, 2)
+
+
+class SnakeVectorEnv:
+    """
+    동기식 벡터 환경 (BatchGameState 래퍼)
+
+    모든 게임을 같은 틱에 진행하며, 관찰/보상/종료 배열은 미리 할당된 버퍼에
+    덮어쓴다 (step이 반환하는 배열은 다음 step에서 재사용되므로 필요하면 복사할 것).
+    관찰 계산의 중간값도 작업 버퍼에 out=/np.take(out=, mode='clip')/np.put으로 쓰고
+    dtype을 맞춰 ufunc 형 변환 버퍼도 생기지 않게 하므로 매 틱 새 배열을 만들지
+    않는다 (에피소드가 끝난 환경의 초기화와 먹기 처리만 예외).
+    종료된 게임은 자동으로 초기화되며, 이때 반환되는 관찰은 새 에피소드의 첫 관찰이다.
+    """
+
+    def __init__(self, num_envs: int, difficulty: str = 'normal', portal_mode: bool = False,
+                 obs_type: str = OBS_FEATURES, reward_config: Optional[RewardConfig] = None,
+                 max_steps: int = 10000, seed: Optional[int] = None):
+        """
+        벡터 환경 초기화
+
+        Args:
+            num_envs: 환경 수
+            difficulty: 난이도 (easy, normal, hard)
+            portal_mode: Portal 모드 활성화 여부
+            obs_type: 관찰 종류 (OBS_GRID, OBS_FEATURES)
+            reward_config: 보상 설정
+            max_steps: 에피소드 최대 틱 수 (초과 시 truncated)
+            seed: 난수 시드
+        """
+        if obs_type not in (OBS_GRID, OBS_FEATURES):
+            raise ValueError(f"벡터 환경이 지원하지 않는 관찰 종류: {obs_type}")
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"알 수 없는 난이도: {difficulty}")
+        self.num_envs = num_envs
+        self.obs_type = obs_type
+        self.reward_config = reward_config if reward_config is not None else RewardConfig()
+        self.max_steps = max_steps
+        self.num_actions = NUM_ACTIONS
+        self.batch = BatchGameState(num_envs, difficulty, portal_mode, seed=seed)
+
+        # 미리 할당된 출력 버퍼
+        if obs_type == OBS_GRID:
+            self.observation_shape = (GRID_CHANNELS, GRID_HEIGHT, GRID_WIDTH)
+        else:
+            self.observation_shape = (NUM_FEATURES,)
+        self._obs = np.zeros((num_envs,) + self.observation_shape, dtype=np.float32)
+        self._rewards = np.zeros(num_envs, dtype=np.float32)
+        self._terminated = np.zeros(num_envs, dtype=bool)
+        self._truncated = np.zeros(num_envs, dtype=bool)
+        self._prev_score = np.zeros(num_envs, dtype=np.int64)
+        self._finished = np.zeros(num_envs, dtype=bool)
+
+        # 관찰 계산 작업 버퍼 (매 틱 재사용)
+        n = num_envs
+        batch = self.batch
+        self._obs_flat = self._obs.reshape(-1)
+        self._obs_rows = np.arange(n, dtype=np.intp) * int(np.prod(self.observation_shape))
+        self._score_delta = np.zeros(n, dtype=np.int64)
+        self._slot = np.zeros(n, dtype=np.intp)
+        self._index = np.zeros(n, dtype=np.intp)
+        self._coordinate = np.zeros(n, dtype=np.intp)
+        self._head_x = np.zeros(n, dtype=np.int16)
+        self._head_y = np.zeros(n, dtype=np.int16)
+        self._direction = np.zeros(n, dtype=np.intp)
+        self._turn = np.zeros(n, dtype=np.intp)
+        self._turn_int8 = np.zeros(n, dtype=np.int8)
+        self._x = np.zeros(n, dtype=np.int16)
+        self._y = np.zeros(n, dtype=np.int16)
+        self._step = np.zeros(n, dtype=np.int16)
+        self._occupied = np.zeros(n, dtype=np.uint8)
+        self._danger_mask = np.zeros(n, dtype=bool)
+        self._mask = np.zeros(n, dtype=bool)
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[np.ndarray, dict]:
+        """
+        모든 환경 초기화
+
+        Args:
+            seed: 난수 시드
+
+        Returns:
+            (관찰 배열, 정보)
+        """
+        if seed is not None:
+            self.batch.rng = np.random.default_rng(seed)
+        self.batch.reset()
+        self._prev_score[:] = 0
+        self._observe()
+        return self._obs, {}
+
+    def step(self, actions) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict]:
+        """
+        모든 환경을 한 틱 진행
+
+        Args:
+            actions: 환경별 방향 인덱스 배열
+
+        Returns:
+            (관찰, 보상, 종료 여부, 시간 초과 여부, 정보) - 배열은 내부 버퍼
+        """
+        batch = self.batch
+        batch.step(actions)
+
+        config = self.reward_config
+        rewards = self._rewards
+        np.subtract(batch.score, self._prev_score, out=self._score_delta)
+        np.copyto(rewards, self._score_delta, casting='unsafe')
+        rewards *= config.score_scale
+        rewards += config.step_penalty
+        np.copyto(self._terminated, batch.done)
+        np.add(rewards, config.death_penalty, out=rewards, where=self._terminated)
+        np.greater_equal(batch.tick, self.max_steps, out=self._truncated)
+        np.logical_not(self._terminated, out=self._mask)
+        np.logical_and(self._truncated, self._mask, out=self._truncated)
+        np.copyto(self._prev_score, batch.score)
+
+        # 종료된 환경 자동 초기화
+        finished = self._finished
+        np.logical_or(self._terminated, self._truncated, out=finished)
+        if finished.any():
+            batch.reset(np.flatnonzero(finished))
+            np.copyto(self._prev_score, 0, where=finished)
+
+        self._observe()
+        return self._obs, rewards, self._terminated, self._truncated, {}
+
+    # ------------------------------------------------------------------
+    # 관찰
+    # ------------------------------------------------------------------
+
+    def _observe(self) -> None:
+        """관찰 버퍼 갱신"""
+        if self.obs_type == OBS_FEATURES:
+            self._observe_features()
+        else:
+            self._observe_grid()
+
+    def _observe_grid(self) -> None:
+        """그리드 텐서 관찰 (채널: 몸통, 머리, 먹이, 장애물)"""
+        batch = self.batch
+        obs = self._obs
+        np.copyto(obs[:, 0], batch.occupancy, casting='unsafe')
+        obs[:, 1:3] = 0.0
+        self._load_head()
+        cells = GRID_HEIGHT * GRID_WIDTH
+        for channel, x, y in ((1, self._head_x, self._head_y), (2, batch.food_x, batch.food_y)):
+            self._flat_index(x, y, GRID_WIDTH, self._obs_rows, channel * cells)
+            np.put(self._obs_flat, self._index, 1.0, mode='clip')
+        np.copyto(obs[:, 3], batch.obstacles, casting='unsafe')
+
+    def _observe_features(self) -> None:
+        """특징 벡터 관찰"""
+        batch = self.batch
+        obs = self._obs
+        mask = self._mask
+        head_x, head_y = self._load_head()
+        direction = self._direction
+        np.copyto(direction, batch.direction)
+
+        np.copyto(obs[:, 0], self._danger(head_x, head_y, direction))
+        for i, table in ((1, _TURN_RIGHT), (2, _TURN_LEFT)):
+            np.take(table, direction, out=self._turn_int8, mode='clip')
+            np.copyto(self._turn, self._turn_int8)
+            np.copyto(obs[:, i], self._danger(head_x, head_y, self._turn))
+
+        obs[:, 3:7] = 0.0
+        np.add(self._obs_rows, 3, out=self._index)
+        np.add(self._index, direction, out=self._index)
+        np.put(self._obs_flat, self._index, 1.0, mode='clip')
+        for i, compare, food, head in ((7, np.less, batch.food_x, head_x),
+                                       (8, np.greater, batch.food_x, head_x),
+                                       (9, np.less, batch.food_y, head_y),
+                                       (10, np.greater, batch.food_y, head_y)):
+            compare(food, head, out=mask)
+            np.copyto(obs[:, i], mask)
+
+    def _load_head(self) -> Tuple[np.ndarray, np.ndarray]:
+        """게임별 머리 위치를 작업 버퍼에 읽어 반환"""
+        batch = self.batch
+        np.copyto(self._slot, batch.head_ptr)
+        np.add(self._slot, batch.row_slots, out=self._slot)
+        np.take(batch.body_x_flat, self._slot, out=self._head_x, mode='clip')
+        np.take(batch.body_y_flat, self._slot, out=self._head_y, mode='clip')
+        return self._head_x, self._head_y
+
+    def _flat_index(self, x: np.ndarray, y: np.ndarray, width: int, rows: np.ndarray,
+                    offset: int = 0) -> np.ndarray:
+        """
+        게임별 (x, y)를 평탄화 배열의 인덱스로 변환 (_index 버퍼에 씀)
+
+        Args:
+            x, y: 게임별 좌표
+            width: 행 너비
+            rows: 게임별 시작 위치
+            offset: 추가 오프셋 (채널 시작 위치 등)
+
+        Returns:
+            _index 버퍼 (rows + offset + y * width + x)
+        """
+        index = self._index
+        np.copyto(index, y)
+        np.multiply(index, width, out=index)
+        np.copyto(self._coordinate, x)
+        np.add(index, self._coordinate, out=index)
+        np.add(index, rows, out=index)
+        if offset:
+            np.add(index, offset, out=index)
+        return index
+
+    def _danger(self, head_x: np.ndarray, head_y: np.ndarray, direction: np.ndarray) -> np.ndarray:
+        """방향(intp 인덱스)으로 한 칸 이동했을 때 게임 오버인지 여부 (작업 버퍼를 반환)"""
+        batch = self.batch
+        x, y = self._x, self._y
+        danger, mask = self._danger_mask, self._mask
+        np.take(_DX, direction, out=self._step, mode='clip')
+        np.add(head_x, self._step, out=x)
+        np.take(_DY, direction, out=self._step, mode='clip')
+        np.add(head_y, self._step, out=y)
+        if batch.portal_mode:
+            np.remainder(x, batch.width, out=x)
+            np.remainder(y, batch.height, out=y)
+            danger.fill(False)
+        else:
+            np.less(x, 0, out=danger)
+            np.greater_equal(x, batch.width, out=mask)
+            np.logical_or(danger, mask, out=danger)
+            np.less(y, 0, out=mask)
+            np.logical_or(danger, mask, out=danger)
+            np.greater_equal(y, batch.height, out=mask)
+            np.logical_or(danger, mask, out=danger)
+            np.clip(x, 0, batch.width - 1, out=x)
+            np.clip(y, 0, batch.height - 1, out=y)
+
+        index = self._flat_index(x, y, batch.width, batch.row_cells)
+        np.take(batch.occupancy_flat, index, out=self._occupied, mode='clip')
+        np.greater(self._occupied, 0, out=mask)
+        np.logical_or(danger, mask, out=danger)
+        np.take(batch.obstacles_flat, index, out=mask, mode='clip')
+        np.logical_or(danger, mask, out=danger)
+        return danger
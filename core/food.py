@@ -5,42 +5,85 @@ from constants import *
 
 
 class Food:
-    def __init__(self):
-        """먹이 초기화"""
+    def __init__(self, free_cells=None, rng=None, clock=None):
+        """
+        먹이 초기화
+        
+        Args:
+            free_cells: 빈 칸 인덱스 (FreeCellIndex, 선택)
+            rng: 난수 생성기 (random.Random, None이면 random 모듈)
+            clock: 현재 시간(초)을 반환하는 함수 (None이면 time.time)
+        """
+        self.rng = rng if rng is not None else random
+        self.clock = clock if clock is not None else time.time
         self.position = None
         self.is_golden = False
-        self.spawn_time = time.time()
+        self.spawn_time = self.clock()
+        self.free_cells = free_cells
+        self._occupied_position = None  # free_cells에 등록된 위치
         self.spawn()
     
     def spawn(self, snake_body=None, obstacle_positions=None):
         """
         랜덤 위치에 먹이 생성 (뱀/장애물과 겹치지 않게)
         
+        free_cells가 있으면 빈 칸 인덱스에서 O(1)로 샘플링하며, 이때 뱀/장애물은
+        이미 인덱스에 반영되어 있으므로 인자는 무시된다.
+        
         Args:
             snake_body: 뱀의 몸통 위치 리스트
             obstacle_positions: 장애물 위치 리스트
+            
+        Returns:
+            bool: 생성 성공 여부 (보드가 가득 차면 False, position은 None)
         """
-        if snake_body is None:
-            snake_body = []
-        if obstacle_positions is None:
-            obstacle_positions = []
-        
-        occupied = set(snake_body + obstacle_positions)
+        if self.free_cells is not None:
+            if self._occupied_position is not None:
+                self.free_cells.release(self._occupied_position)
+                self._occupied_position = None
+            position = self.free_cells.sample(self.rng)
+            if position is not None:
+                self.free_cells.occupy(position)
+                self._occupied_position = position
+        else:
+            position = self._find_free_position(snake_body, obstacle_positions)
         
-        while True:
-            # 랜덤 위치 생성
-            x = random.randint(0, GRID_WIDTH - 1)
-            y = random.randint(0, GRID_HEIGHT - 1)
-            position = (x, y)
-            
-            # 뱀/장애물과 겹치지 않으면 해당 위치에 생성
-            if position not in occupied:
-                self.position = position
-                break
+        self.position = position
+        if position is None:
+            return False
         
         # 10% 확률로 Golden Apple 생성
-        self.is_golden = random.random() < GOLDEN_APPLE_PROBABILITY
-        self.spawn_time = time.time()
+        self.is_golden = self.rng.random() < GOLDEN_APPLE_PROBABILITY
+        self.spawn_time = self.clock()
+        return True
+    
+    def _find_free_position(self, snake_body, obstacle_positions):
+        """
+        빈 칸 인덱스 없이 빈 위치 찾기 (랜덤 시도 후 전체 탐색)
+        
+        Returns:
+            빈 위치 또는 None (보드가 가득 참)
+        """
+        occupied = set(snake_body or ())
+        occupied.update(obstacle_positions or ())
+        
+        # 빈 칸이 충분하면 랜덤 시도가 빠름
+        for _ in range(MAX_FOOD_SPAWN_ATTEMPTS):
+            x = self.rng.randint(0, GRID_WIDTH - 1)
+            y = self.rng.randint(0, GRID_HEIGHT - 1)
+            if (x, y) not in occupied:
+                return (x, y)
+        
+        # 보드가 거의 찬 경우 전체 탐색
+        available = [
+            (x, y)
+            for y in range(GRID_HEIGHT)
+            for x in range(GRID_WIDTH)
+            if (x, y) not in occupied
+        ]
+        if not available:
+            return None
+        return self.rng.choice(available)
     
     def get_position(self):
         """먹이 위치 반환"""
@@ -58,6 +101,6 @@ class Food:
             bool: 재생성이 필요하면 True
         """
         if self.is_golden:
-            elapsed = time.time() - self.spawn_time
+            elapsed = self.clock() - self.spawn_time
             return elapsed >= GOLDEN_APPLE_TIMEOUT
         return False
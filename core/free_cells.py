@@ -0,0 +1,111 @@
+"""빈 칸 인덱스 (먹이/파워업/장애물 생성 위치를 O(1)로 샘플링)"""
+import random
+from typing import Iterator, Optional, Tuple
+from constants import GRID_WIDTH, GRID_HEIGHT
+
+
+class FreeCellIndex:
+    """
+    그리드의 빈 칸을 관리하는 인덱스
+
+    모든 칸을 하나의 배열에 두고 앞쪽 `free_count`개를 빈 칸으로 유지한다
+    (swap-remove). 칸 -> 배열 위치 맵을 함께 두어 점유/해제/샘플링이 모두 O(1)이다.
+    같은 칸을 여러 객체(뱀, 먹이, 장애물, 파워업)가 겹쳐 점유할 수 있도록
+    칸별 점유 개수를 센다.
+    """
+
+    def __init__(self, width: int = GRID_WIDTH, height: int = GRID_HEIGHT):
+        """
+        빈 칸 인덱스 초기화 (모든 칸이 비어 있음)
+
+        Args:
+            width: 그리드 가로 칸 수
+            height: 그리드 세로 칸 수
+        """
+        self.width = width
+        self.height = height
+        self._cells = [(x, y) for y in range(height) for x in range(width)]
+        self._slots = {cell: i for i, cell in enumerate(self._cells)}
+        self._counts = [0] * (width * height)
+        self._free_count = width * height
+
+    def _in_bounds(self, position: Tuple[int, int]) -> bool:
+        """그리드 범위 내 위치인지 확인"""
+        x, y = position
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def _swap(self, i: int, j: int) -> None:
+        """배열의 두 칸 위치 교환"""
+        cells = self._cells
+        a, b = cells[i], cells[j]
+        cells[i], cells[j] = b, a
+        self._slots[a] = j
+        self._slots[b] = i
+
+    def occupy(self, position: Tuple[int, int]) -> None:
+        """
+        칸 점유 (범위 밖 위치는 무시)
+
+        Args:
+            position: 점유할 위치 (x, y)
+        """
+        if not self._in_bounds(position):
+            return
+        key = position[1] * self.width + position[0]
+        self._counts[key] += 1
+        if self._counts[key] == 1:
+            # 빈 칸 구간의 마지막과 교환 후 구간 축소
+            last = self._free_count - 1
+            self._swap(self._slots[position], last)
+            self._free_count = last
+
+    def release(self, position: Tuple[int, int]) -> None:
+        """
+        칸 점유 해제 (범위 밖 위치나 비어 있는 칸은 무시)
+
+        Args:
+            position: 해제할 위치 (x, y)
+        """
+        if not self._in_bounds(position):
+            return
+        key = position[1] * self.width + position[0]
+        if self._counts[key] == 0:
+            return
+        self._counts[key] -= 1
+        if self._counts[key] == 0:
+            # 빈 칸 구간 바로 뒤와 교환 후 구간 확장
+            self._swap(self._slots[position], self._free_count)
+            self._free_count += 1
+
+    def is_free(self, position: Tuple[int, int]) -> bool:
+        """빈 칸인지 확인 (범위 밖이면 False)"""
+        if not self._in_bounds(position):
+            return False
+        return self._counts[position[1] * self.width + position[0]] == 0
+
+    def sample(self, rng=None) -> Optional[Tuple[int, int]]:
+        """
+        임의의 빈 칸 반환 (O(1))
+
+        Args:
+            rng: 난수 생성기 (randrange 지원, None이면 random 모듈)
+
+        Returns:
+            빈 칸 위치 또는 None (보드가 가득 참)
+        """
+        if self._free_count == 0:
+            return None
+        rng = rng if rng is not None else random
+        return self._cells[rng.randrange(self._free_count)]
+
+    def is_full(self) -> bool:
+        """보드가 가득 찼는지 확인"""
+        return self._free_count == 0
+
+    def free_cells(self) -> Iterator[Tuple[int, int]]:
+        """빈 칸 목록 순회"""
+        return iter(self._cells[:self._free_count])
+
+    def __len__(self) -> int:
+        """빈 칸 개수"""
+        return self._free_count
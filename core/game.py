@@ -1,76 +1,160 @@
 """게임 로직 관리 클래스"""
+import os
+import random
+import time
 import pygame
 from constants import *
-from core.snake import Snake
-from core.food import Food
-from core.obstacle import Obstacle
+from core.game_state import GameState, EVENT_EAT, EVENT_GAME_OVER
+from core.replay import ReplayRecorder, ReplayPlayer, REPLAY_EXTENSION
+from core.input_queue import DirectionQueue
 from ui.hud import UI
+from ui.background import BackgroundCache
+from ui.dirty_rects import DirtyRectTracker
+from ui.frame_capture import FrameCapture
+from ui.render_target import RenderTarget
+from ui.sprite_atlas import SpriteAtlas
+from ui.sprite_batch import SnakeSpriteBatch, SURFARRAY_MIN_SEGMENTS
 from managers.score_manager import ScoreManager
 from managers.sound_manager import SoundManager
 from config import ConfigManager
 
 
 class Game:
-    def __init__(self, screen=None, difficulty='normal', portal_mode=False, sound_enabled=True, music_enabled=True):
-        """게임 초기화"""
-        if screen is None:
+    def __init__(self, screen=None, difficulty='normal', portal_mode=False, sound_enabled=True, music_enabled=True,
+                 seed=None, replay_dir=None, offscreen=False, window_size=None, smooth_scaling=False,
+                 config_manager=None):
+        """
+        게임 초기화
+        
+        Args:
+            seed: 난수 시드 (지정하면 먹이/장애물 배치가 재현됨)
+            replay_dir: 판이 끝날 때마다 리플레이를 저장할 폴더 (None이면 저장 안 함)
+            offscreen: 창 없이 일반 Surface에 그리기 (SDL dummy 드라이버, 프레임 캡처용)
+            window_size: 창 크기 (None이면 논리 해상도, 크기를 바꿀 수 있는 창으로 생성)
+            smooth_scaling: 창에 꽉 차게 smoothscale (False면 정수 배율로 선명하게 확대)
+            config_manager: 키 입력으로 바뀐 설정을 저장할 ConfigManager (None이면 config.json)
+        """
+        self.offscreen = offscreen
+        if offscreen:
+            # 디스플레이/오디오 장치가 없는 서버에서도 동작하도록 dummy 드라이버 사용
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+            os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
             pygame.init()
-            self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-            pygame.display.set_caption("Snake Game - Version 3.1")
-            self.own_screen = True
+            self.screen = screen if screen is not None else pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+            self.own_screen = screen is None
+            self.render_target = None
         else:
-            self.screen = screen
-            self.own_screen = False
+            if screen is None:
+                pygame.init()
+                window = pygame.display.set_mode(window_size or (WINDOW_WIDTH, WINDOW_HEIGHT),
+                                                 pygame.RESIZABLE)
+                pygame.display.set_caption("Snake Game - Version 3.1")
+                self.own_screen = True
+            else:
+                window = screen
+                self.own_screen = False
+            # 게임/UI는 논리 해상도 Surface에 그리고, 창에는 배율을 적용해 옮김
+            self.render_target = RenderTarget(window, smooth=smooth_scaling)
+            self.screen = self.render_target.surface
         
         # 시계 설정 (FPS 제어)
         self.clock = pygame.time.Clock()
         
-        # 게임 객체
-        self.snake = Snake()
-        self.food = Food()
+        # 게임 로직 (헤드리스 코어) - 판마다 새 시드를 뽑아 리플레이에 기록
+        self._seed_source = random.Random(seed)
+        self.game_seed = self._seed_source.getrandbits(32)
+        self.state = GameState(difficulty, portal_mode, ScoreManager(), self.game_seed)
+        
+        # 리플레이 기록/재생
+        self.replay_dir = replay_dir
+        self.recorder = ReplayRecorder(difficulty, portal_mode, self.game_seed)
+        self.last_replay = None
+        self.replay_player = None
+        self._pending_portal_mode = None  # 판 진행 중에 바뀐 포탈 설정 (다음 판에 적용)
+        
+        # 렌더링/사운드
         self.ui = UI(self.screen)
-        self.score_manager = ScoreManager()
+        self.game_surface = pygame.Surface((BOARD_WIDTH, BOARD_HEIGHT))
+        self.background = BackgroundCache((BOARD_WIDTH, BOARD_HEIGHT))
+        self.dirty_rects = DirtyRectTracker()
+        self.atlas = SpriteAtlas()
+        self._last_background = None
+        self._overlay_shown = False
+        self.frame_capture = None  # 설정하면 draw()마다 화면을 캡처 (FrameCapture)
         self.sound_manager = SoundManager()
         
-        # 설정 적용
+        # 설정 적용 (변경 사항은 ConfigManager가 모아서 기록)
+        self.config_manager = config_manager if config_manager is not None else ConfigManager()
         self.sound_manager.sound_enabled = sound_enabled
         self.sound_manager.music_enabled = music_enabled
         
-        # 난이도 설정
-        self.difficulty = difficulty
-        self.apply_difficulty_settings()
-        
-        # 장애물 생성 (난이도에 따라)
-        obstacle_count = DIFFICULTIES[self.difficulty]['obstacles']
-        self.obstacle = Obstacle(obstacle_count, self.snake.body, self.food.get_position()) if obstacle_count > 0 else None
-        
-        # 먹이 재생성 (장애물 고려)
-        obstacle_positions = self.obstacle.get_positions() if self.obstacle else []
-        self.food.spawn(self.snake.body, obstacle_positions)
-        
-        # 포탈 모드
-        self.portal_mode = portal_mode
-        
         # 게임 상태
         self.running = True
-        self.game_over = False
         self.paused = False
         self.waiting = True  # 게임 시작 대기 상태
         self.countdown = False  # 카운트다운 상태
         self.countdown_value = 3  # 카운트다운 숫자 (3, 2, 1)
         self.countdown_start_time = 0  # 카운트다운 시작 시간
         
+        # 고정 틱 루프 (로직은 current_fps 간격, 화면은 RENDER_FPS로 갱신)
+        self.speed_multiplier = 1.0  # 파워업 등의 속도 배율
+        self.input_queue = DirectionQueue()  # 틱마다 하나씩 적용할 방향 입력
+        self.snake_sprites = SnakeSpriteBatch()  # 직전/현재 틱 마디 좌표 (보간용)
+        self.snake_sprites.reset(self.snake.body)
+        self.interpolation = 1.0  # 직전 틱 -> 현재 틱 사이 진행 비율 (0.0 ~ 1.0)
+        
         # 배경 음악 시작
         if self.sound_manager.music_enabled:
             self.sound_manager.start_background_music()
     
+    # GameState 위임 속성 (기존 호출부 호환)
+    @property
+    def snake(self):
+        return self.state.snake
+    
+    @property
+    def food(self):
+        return self.state.food
+    
+    @property
+    def obstacle(self):
+        return self.state.obstacle
+    
+    @property
+    def free_cells(self):
+        return self.state.free_cells
+    
+    @property
+    def score_manager(self):
+        return self.state.score_manager
+    
+    @property
+    def current_fps(self):
+        return self.state.current_fps
+    
+    @property
+    def difficulty(self):
+        return self.state.difficulty
+    
+    @difficulty.setter
+    def difficulty(self, value):
+        self.state.difficulty = value
+    
+    @property
+    def portal_mode(self):
+        return self.state.portal_mode
+    
+    @portal_mode.setter
+    def portal_mode(self, value):
+        self.state.portal_mode = value
+    
+    @property
+    def game_over(self):
+        return self.state.game_over
+    
     def apply_difficulty_settings(self):
         """난이도 설정 적용"""
-        settings = DIFFICULTIES[self.difficulty]
-        self.initial_fps = settings['initial_fps']
-        self.speed_increase_interval = settings['speed_increase_interval']
-        self.max_fps = settings['max_fps']
-        self.current_fps = self.initial_fps
+        self.state.apply_difficulty_settings()
     
     def handle_events(self):
         """이벤트 처리"""
@@ -78,6 +162,11 @@ class Game:
             if event.type == pygame.QUIT:
                 self.running = False
             
+            # 창 크기 변경 - 배율을 다시 계산하고 다음 프레임은 전체 그리기
+            if event.type == pygame.VIDEORESIZE and self.render_target is not None:
+                self.render_target.resize(pygame.display.get_surface())
+                self.dirty_rects.invalidate()
+            
             if event.type == pygame.KEYDOWN:
                 # ESC - 종료
                 if event.key == pygame.K_ESCAPE:
@@ -110,20 +199,66 @@ class Game:
                 elif event.key == pygame.K_d:
                     self.cycle_difficulty()
                 
-                # P - 포탈 모드 토글
+                # P - 포탈 모드 토글 (게임 시작 전/게임 오버 시, 진행 중인 판의 리플레이가 어긋나지 않도록)
                 elif event.key == pygame.K_p:
-                    self.portal_mode = self.config_manager.toggle_portal_mode()
+                    if not self.is_game_in_progress() and self.replay_player is None:
+                        self.set_portal_mode(self.config_manager.toggle_portal_mode())
                 
-                # 방향키 (게임 진행 중일 때만)
-                elif not self.game_over and not self.paused:
+                # 방향키 (게임 진행 중일 때만, 리플레이 재생 중에는 무시)
+                # 입력 큐에 쌓아 두고 로직 틱마다 하나씩 적용
+                elif not self.game_over and not self.paused and self.replay_player is None:
                     if event.key == pygame.K_UP:
-                        self.snake.change_direction(UP)
+                        self.input_queue.push(UP, self.snake.direction)
                     elif event.key == pygame.K_DOWN:
-                        self.snake.change_direction(DOWN)
+                        self.input_queue.push(DOWN, self.snake.direction)
                     elif event.key == pygame.K_LEFT:
-                        self.snake.change_direction(LEFT)
+                        self.input_queue.push(LEFT, self.snake.direction)
                     elif event.key == pygame.K_RIGHT:
-                        self.snake.change_direction(RIGHT)
+                        self.input_queue.push(RIGHT, self.snake.direction)
+    
+    def apply_external_config(self):
+        """설정 파일이 외부에서 수정됐으면 사운드/음악/포탈 설정 반영 (mtime 확인은 주기적으로만)"""
+        for key in self.config_manager.check_external_changes():
+            if key == 'sound_enabled':
+                self.sound_manager.sound_enabled = self.config_manager.get(key)
+            elif key == 'music_enabled' and self.config_manager.get(key) != self.sound_manager.music_enabled:
+                self.sound_manager.toggle_music()
+            elif key == 'portal_mode':
+                self.set_portal_mode(self.config_manager.get(key))
+    
+    def is_game_in_progress(self):
+        """틱이 진행된 판이 아직 끝나지 않았는지 확인 (리플레이 헤더의 설정을 바꿀 수 없는 상태)"""
+        return self.state.tick > 0 and not self.game_over
+    
+    def set_portal_mode(self, value):
+        """
+        포탈 모드 변경
+        
+        리플레이는 포탈 모드를 헤더에 한 번만 기록하므로 판이 진행 중이거나
+        리플레이 재생 중이면 바로 바꾸지 않고 다음 판(reset_game)부터 적용한다.
+        
+        Args:
+            value: 포탈 모드 여부
+        
+        Returns:
+            바로 적용했으면 True, 다음 판으로 미뤘으면 False
+        """
+        if self.is_game_in_progress() or self.replay_player is not None:
+            self._pending_portal_mode = value
+            return False
+        self._pending_portal_mode = None
+        self.portal_mode = value
+        if self.recorder is not None and self.state.tick == 0:
+            self.recorder.replay.portal_mode = value  # 아직 틱이 없는 판은 헤더도 함께 변경
+        return True
+    
+    def is_ticking(self):
+        """로직 틱이 진행되는 상태인지 확인 (대기/카운트다운/일시정지/게임 오버가 아님)"""
+        return not (self.countdown or self.waiting or self.paused or self.game_over)
+    
+    def get_tick_interval(self):
+        """로직 틱 간격(초) 반환 (현재 속도와 속도 배율 기준)"""
+        return 1.0 / (self.current_fps * self.speed_multiplier)
     
     def update(self):
         """게임 상태 업데이트"""
@@ -147,186 +282,81 @@ class Game:
         if self.waiting or self.game_over or self.paused:
             return
         
-        # Golden Apple 타이머 체크 (10초 경과 시 재생성)
-        if self.food.should_respawn():
-            obstacle_positions = self.obstacle.get_positions() if self.obstacle else []
-            self.food.spawn(self.snake.body, obstacle_positions)
-        
-        # 뱀 이동 (Portal 모드 적용)
-        self.snake.move(self.portal_mode)
-        
-        # 벽 충돌 확인 (Portal 모드가 아닐 때만)
-        if not self.portal_mode and self.snake.check_wall_collision():
-            self.game_over = True
-            self.score_manager.end_game()
-            self.sound_manager.play_game_over_sound()
-            return
-        
-        # 장애물 충돌 확인
-        if self.obstacle and self.obstacle.check_collision(self.snake.get_head()):
-            self.game_over = True
-            self.score_manager.end_game()
-            self.sound_manager.play_game_over_sound()
-            return
-        
-        # 자기 몸통 충돌 확인
-        if self.snake.check_self_collision():
-            self.game_over = True
-            self.score_manager.end_game()
+        # 한 틱 진행 (이동/충돌/먹기는 GameState가 처리)
+        if self.replay_player is not None:
+            event = self.replay_player.step()
+        else:
+            direction = self.input_queue.pop()
+            if direction is not None:
+                self.snake.change_direction(direction)
+            self.recorder.record(self.state.tick, self.snake.direction)
+            event = self.state.step()
+        self.snake_sprites.advance(self.snake.body)
+        
+        if event == EVENT_GAME_OVER:
+            self.finish_recording()
             self.sound_manager.play_game_over_sound()
-            return
-        
-        # 먹이 먹기 확인
-        if self.snake.get_head() == self.food.get_position():
-            self.snake.grow()
-            
-            # 점수 추가 (Golden Apple이면 50점, 일반은 10점)
-            food_value = self.food.get_value()
-            if food_value == GOLDEN_APPLE_SCORE:
-                # Golden Apple: 직접 점수 추가
-                self.score_manager.score += food_value
-                if self.score_manager.score > self.score_manager.high_score:
-                    self.score_manager.high_score = self.score_manager.score
-                    self.score_manager.save_high_score()
-                self.score_manager.food_eaten += 1
-            else:
-                # 일반 먹이: 기존 로직 (콤보 포함)
-                self.score_manager.add_food()
-            
-            # 먹이 재생성
-            obstacle_positions = self.obstacle.get_positions() if self.obstacle else []
-            self.food.spawn(self.snake.body, obstacle_positions)
+        elif event == EVENT_EAT:
             self.sound_manager.play_eat_sound()
-            
-            # 속도 증가
-            if self.score_manager.get_food_eaten() % self.speed_increase_interval == 0:
-                if self.current_fps < self.max_fps:
-                    self.current_fps += 1
     
     def draw(self):
-        """화면 그리기"""
-        # 배경 (검은색)
-        self.screen.fill(BLACK)
-        
-        # 게임 영역만 따로 그리기 (정보 패널 아래)
-        game_surface = pygame.Surface((600, 600))
-        game_surface.fill(BLACK)
-        
-        # 그리드 라인 그리기
-        for x in range(0, 600, GRID_SIZE):
-            pygame.draw.line(game_surface, GRID_COLOR, (x, 0), (x, 600))
-        for y in range(0, 600, GRID_SIZE):
-            pygame.draw.line(game_surface, GRID_COLOR, (0, y), (600, y))
+        """
+        화면 그리기
+        
+        게임 진행 중에는 지난 프레임과 이번 프레임에 그린 영역만 다시 그려
+        pygame.display.update(rects)로 반영하고, 오버레이 화면(대기/카운트다운/
+        일시정지/게임 오버)이나 배경이 바뀐 프레임만 전체를 다시 그린다.
+        """
+        background = self.background.get(self.state.get_obstacle_positions())
+        overlay = self.countdown or self.waiting or self.paused or self.game_over
+        if overlay or self._overlay_shown or background is not self._last_background:
+            self.dirty_rects.invalidate()
+        self._last_background = background
+        self._overlay_shown = overlay
+        full_redraw = self.dirty_rects.full_redraw
+        
+        # 게임 영역 (정보 패널 아래) - 캐시된 그리드/장애물 배경을 복사
+        game_surface = self.game_surface
+        if full_redraw:
+            # 배경 (검은색)
+            self.screen.fill(BLACK)
+            game_surface.blit(background, (0, 0))
+        else:
+            # 지난 프레임에 그린 부분만 배경으로 지움
+            self.dirty_rects.restore(game_surface, background)
         
-        # Portal 모드일 때 테두리 효과
+        # Portal 모드일 때 테두리 효과 (미리 그린 펄스 프레임)
+        ticks = pygame.time.get_ticks()
         if self.portal_mode:
-            # 펄스 효과 (0.6 ~ 1.0 사이로 반짝임)
-            pulse = abs(pygame.time.get_ticks() % 1000 - 500) / 500.0
-            brightness = 0.6 + 0.4 * pulse
-            
-            # 초록색/청록색 (Portal 느낌)
-            portal_color = (
-                int(0 * brightness),
-                int(255 * brightness),
-                int(200 * brightness)
-            )
-            
-            # 점선 테두리 그리기 (상, 하, 좌, 우)
-            dash_length = 15
-            gap_length = 10
-            border_width = 4
-            
-            # 상단 테두리
-            x = 0
-            while x < 600:
-                pygame.draw.line(game_surface, portal_color, 
-                               (x, 0), (min(x + dash_length, 600), 0), border_width)
-                x += dash_length + gap_length
-            
-            # 하단 테두리
-            x = 0
-            while x < 600:
-                pygame.draw.line(game_surface, portal_color, 
-                               (x, 599), (min(x + dash_length, 600), 599), border_width)
-                x += dash_length + gap_length
-            
-            # 좌측 테두리
-            y = 0
-            while y < 600:
-                pygame.draw.line(game_surface, portal_color, 
-                               (0, y), (0, min(y + dash_length, 600)), border_width)
-                y += dash_length + gap_length
-            
-            # 우측 테두리
-            y = 0
-            while y < 600:
-                pygame.draw.line(game_surface, portal_color, 
-                               (599, y), (599, min(y + dash_length, 600)), border_width)
-                y += dash_length + gap_length
-        
-        # 뱀 그리기
-        for i, segment in enumerate(self.snake.body):
-            rect = pygame.Rect(
-                segment[0] * GRID_SIZE,
-                segment[1] * GRID_SIZE,
-                GRID_SIZE,
-                GRID_SIZE
-            )
-            # 머리는 밝은 녹색, 몸통은 어두운 녹색
-            if i == 0:
-                base_color = LIGHT_GREEN
-            else:
-                base_color = DARK_GREEN
-            
-            # 콤보 활성화 시 반짝이는 효과
-            if self.score_manager.is_combo_active():
-                # 0.0 ~ 1.0 사이로 진동하는 값 (더 빠른 주기)
-                pulse = abs(pygame.time.get_ticks() % 300 - 150) / 150.0
-                # 밝기 조절 (0.5 ~ 1.3) - 더 강한 효과
-                brightness = 0.5 + 0.8 * pulse
-                # 색상에 노란색 톤 추가
-                if i == 0:  # 머리
-                    r = min(255, int(base_color[0] * brightness + 50 * pulse))
-                    g = min(255, int(base_color[1] * brightness + 50 * pulse))
-                    b = int(base_color[2] * brightness)
-                else:  # 몸통
-                    r = min(255, int(base_color[0] * brightness + 30 * pulse))
-                    g = min(255, int(base_color[1] * brightness + 30 * pulse))
-                    b = int(base_color[2] * brightness)
-                color = (r, g, b)
-            else:
-                color = base_color
-            
-            pygame.draw.rect(game_surface, color, rect)
+            self.dirty_rects.add_all(self.background.draw_portal_border(game_surface, ticks))
+        
+        # 뱀 그리기 - 마디 좌표 배열에서 만든 시퀀스를 한 번의 blits 호출로 복사
+        # (아주 긴 뱀은 surfarray로 한 번에 칠함)
+        if not self.snake_sprites.matches(self.snake.body):
+            self.snake_sprites.reset(self.snake.body)
+        head_tile, body_tile = self.atlas.segment_tiles(self.score_manager.is_combo_active(), ticks)
+        if len(self.snake_sprites) >= SURFARRAY_MIN_SEGMENTS:
+            self.dirty_rects.add(self.snake_sprites.fill(
+                game_surface, head_tile.get_at((0, 0)), body_tile.get_at((0, 0)), self.interpolation))
+        else:
+            self.dirty_rects.add_all(game_surface.blits(
+                self.snake_sprites.blit_sequence(head_tile, body_tile, self.interpolation)))
         
-        # 먹이 그리기 (Golden Apple이면 금색, 일반은 빨간색 + 펄스 효과)
+        # 먹이 그리기 (Golden Apple이면 금색, 일반은 빨간색 + 펄스 크기)
         food_pos = self.food.get_position()
-        pulse = abs(pygame.time.get_ticks() % 1000 - 500) / 500.0  # 0.0 ~ 1.0 왕복
-        food_size = int(GRID_SIZE * (0.8 + 0.2 * pulse))  # 80% ~ 100% 크기
-        food_offset = (GRID_SIZE - food_size) // 2
-        
-        food_rect = pygame.Rect(
-            food_pos[0] * GRID_SIZE + food_offset,
-            food_pos[1] * GRID_SIZE + food_offset,
-            food_size,
-            food_size
-        )
-        food_color = GOLD if self.food.is_golden else RED
-        pygame.draw.rect(game_surface, food_color, food_rect)
-        
-        # 장애물 그리기
-        if self.obstacle:
-            for obs_pos in self.obstacle.get_positions():
-                obs_rect = pygame.Rect(
-                    obs_pos[0] * GRID_SIZE,
-                    obs_pos[1] * GRID_SIZE,
-                    GRID_SIZE,
-                    GRID_SIZE
-                )
-                pygame.draw.rect(game_surface, GRAY, obs_rect)
+        if food_pos is not None:  # 보드가 가득 차면 먹이 없음
+            food_tile, food_offset = self.atlas.food_tile(self.food.is_golden, ticks)
+            self.dirty_rects.add(game_surface.blit(
+                food_tile, (food_pos[0] * GRID_SIZE + food_offset, food_pos[1] * GRID_SIZE + food_offset)))
         
         # 게임 화면을 메인 화면에 그리기 (패널 아래)
-        self.screen.blit(game_surface, (0, INFO_PANEL_HEIGHT))
+        dirty = self.dirty_rects.end_frame()
+        if full_redraw:
+            self.screen.blit(game_surface, (0, INFO_PANEL_HEIGHT))
+        else:
+            self.screen.blits([(game_surface, rect.move(0, INFO_PANEL_HEIGHT), rect) for rect in dirty],
+                              False)
+            dirty = [rect.move(0, INFO_PANEL_HEIGHT) for rect in dirty]
         
         # 정보 패널 그리기
         self.ui.draw_info_panel(
@@ -362,29 +392,108 @@ class Game:
                 self.score_manager.get_play_time()
             )
         
-        # 화면 업데이트
-        pygame.display.flip()
+        # 화면 업데이트 (부분 갱신 시 패널 + 변경 영역만 창 배율로 옮김, 오프스크린이면 생략)
+        if self.render_target is not None:
+            if full_redraw:
+                self.render_target.present()
+            else:
+                dirty.append(pygame.Rect(0, 0, WINDOW_WIDTH, INFO_PANEL_HEIGHT + 2))
+                self.render_target.present(dirty)
+        
+        # 프레임 캡처 (복사 후 바로 반환, 파일 쓰기는 캡처 스레드가 처리)
+        if self.frame_capture is not None:
+            self.frame_capture.capture(self.screen)
     
     def reset_game(self):
-        """게임 재시작"""
-        self.snake = Snake()
-        
-        # 난이도 재적용
-        self.apply_difficulty_settings()
-        
-        # 장애물 재생성
-        obstacle_count = DIFFICULTIES[self.difficulty]['obstacles']
-        self.obstacle = Obstacle(obstacle_count, self.snake.body, (0, 0)) if obstacle_count > 0 else None
-        
-        # 먹이 재생성
-        obstacle_positions = self.obstacle.get_positions() if self.obstacle else []
-        self.food = Food()
-        self.food.spawn(self.snake.body, obstacle_positions)
+        """게임 재시작 (리플레이 재생 중이면 처음으로 되감기)"""
+        self.paused = False
+        self.input_queue.clear()
+        if self.replay_player is not None:
+            self.replay_player.seek(0)
+            self.state = self.replay_player.state
+            self.snake_sprites.reset(self.snake.body)
+            return
         
-        self.score_manager.reset()
-        self.game_over = False
+        self.finish_recording()
+        if self._pending_portal_mode is not None:
+            self.portal_mode, self._pending_portal_mode = self._pending_portal_mode, None
+        self.game_seed = self._seed_source.getrandbits(32)
+        self.state.reset(self.game_seed)
+        self.snake_sprites.reset(self.snake.body)
+        self.recorder = ReplayRecorder(self.difficulty, self.portal_mode, self.game_seed)
+    
+    def finish_recording(self):
+        """
+        현재 판의 리플레이 기록 종료 (진행된 틱이 있을 때만)
+        
+        Returns:
+            완성된 리플레이 또는 None
+        """
+        if self.recorder is None or self.state.tick == 0:
+            return None
+        self.last_replay = self.recorder.finish(self.state.tick)
+        self.recorder = None
+        
+        if self.replay_dir is not None:
+            try:
+                os.makedirs(self.replay_dir, exist_ok=True)
+                name = time.strftime('%Y%m%d_%H%M%S') + f'_{self.game_seed:08x}' + REPLAY_EXTENSION
+                self.last_replay.save(os.path.join(self.replay_dir, name))
+            except IOError:
+                pass
+        return self.last_replay
+    
+    def play_replay(self, replay):
+        """
+        리플레이 재생 모드로 전환 (run()이 일반 draw 경로로 원래 속도로 재생)
+        
+        Args:
+            replay: 재생할 Replay
+        """
+        self.finish_recording()
+        self.replay_player = ReplayPlayer(replay)
+        self.state = self.replay_player.state
+        self.snake_sprites.reset(self.snake.body)
+        self.waiting = False
+        self.countdown = False
         self.paused = False
     
+    def export_replay(self, replay, output, fps=RENDER_FPS, hold_seconds=1.0):
+        """
+        리플레이를 화면 없이 렌더링해 파일로 내보내기 (offscreen=True로 만든 Game에서 사용)
+        
+        run()과 같은 고정 틱/보간 규칙을 따르되 경과 시간 대신 프레임당
+        1/fps초를 누적하므로, 실제 속도와 상관없이 원래 재생 속도의 영상이 된다.
+        
+        Args:
+            replay: 내보낼 Replay
+            output: 출력 경로 ('.y4m', '.rgb'/'.raw', 그 외는 PNG 폴더)
+            fps: 출력 영상의 초당 프레임 수
+            hold_seconds: 게임 오버 후 마지막 화면을 유지할 시간 (초)
+        
+        Returns:
+            캡처한 프레임 수
+        """
+        self.play_replay(replay)
+        frame_time = 1.0 / fps
+        accumulator = 0.0
+        with FrameCapture(output, fps) as capture:
+            self.frame_capture = capture
+            try:
+                while not self.replay_player.finished and not self.game_over:
+                    accumulator += frame_time
+                    while accumulator >= self.get_tick_interval() and not self.replay_player.finished:
+                        accumulator -= self.get_tick_interval()
+                        self.update()
+                    self.interpolation = min(1.0, accumulator / self.get_tick_interval())
+                    self.draw()
+                self.interpolation = 1.0
+                for _ in range(int(hold_seconds * fps)):
+                    self.draw()
+            finally:
+                self.frame_capture = None
+        return capture.frames_captured
+    
     def cycle_difficulty(self):
         """난이도 순환 변경 (Easy → Normal → Hard → Easy)"""
         difficulties = ['easy', 'normal', 'hard']
@@ -402,13 +511,46 @@ class Game:
     
     def run(self):
         """게임 메인 루프"""
+        # 고정 틱 루프: 경과 시간을 누적해 로직 틱 간격마다 update()를 호출하고,
+        # 화면은 매 프레임 두 틱 사이를 보간해 그림
+        accumulator = 0.0
+        previous_time = time.perf_counter()
         while self.running:
             self.handle_events()
-            self.update()
+            self.apply_external_config()
+            
+            now = time.perf_counter()
+            accumulator += now - previous_time
+            previous_time = now
+            
+            if self.is_ticking():
+                ticks = 0
+                while accumulator >= self.get_tick_interval() and ticks < MAX_TICKS_PER_FRAME:
+                    accumulator -= self.get_tick_interval()
+                    self.update()
+                    ticks += 1
+                if ticks == MAX_TICKS_PER_FRAME:
+                    # 따라잡지 못한 시간은 버림 (긴 정지 후 순간이동 방지)
+                    accumulator = min(accumulator, self.get_tick_interval())
+                self.interpolation = min(1.0, accumulator / self.get_tick_interval())
+            else:
+                # 대기/카운트다운/일시정지 중에는 시간을 쌓지 않음
+                self.update()
+                accumulator = 0.0
+                self.interpolation = 1.0
+            
             self.draw()
             
-            # FPS 제어
-            self.clock.tick(self.current_fps)
+            # 화면 갱신 속도 제어 (게임 속도와 무관)
+            self.clock.tick(RENDER_FPS)
+        
+        # 중간에 종료한 판도 리플레이로 남김
+        if self.replay_player is None:
+            self.finish_recording()
+        
+        # 예약된 최고 점수/설정 기록이 끝날 때까지 대기
+        self.score_manager.flush(wait=True)
+        self.config_manager.flush()
         
         # 배경 음악 정지
         if self.sound_manager.music_enabled:
@@ -0,0 +1,200 @@
+"""헤드리스 게임 로직 (디스플레이/사운드 없이 동작하는 시뮬레이션 코어)"""
+import random
+from typing import Optional, Tuple
+from constants import *
+from core.snake import Snake
+from core.food import Food
+from core.obstacle import Obstacle
+from core.free_cells import FreeCellIndex
+from managers.score_manager import ScoreManager
+
+
+# step() 결과 이벤트
+EVENT_NONE = 'none'
+EVENT_EAT = 'eat'
+EVENT_GAME_OVER = 'game_over'
+
+
+class GameState:
+    """뱀/먹이/장애물/점수 상태와 충돌·먹기 규칙을 관리하는 순수 로직 클래스"""
+
+    def __init__(self, difficulty: str = 'normal', portal_mode: bool = False,
+                 score_manager: Optional[ScoreManager] = None, seed: Optional[int] = None):
+        """
+        게임 상태 초기화
+
+        Args:
+            difficulty: 난이도 (easy, normal, hard)
+            portal_mode: Portal 모드 활성화 여부
+            score_manager: 점수 관리자 (None이면 새로 생성)
+            seed: 난수 시드 (같은 시드와 입력이면 같은 게임이 재현됨)
+        """
+        self.difficulty = difficulty
+        self.portal_mode = portal_mode
+        self.score_manager = score_manager if score_manager is not None else ScoreManager()
+        # 콤보/Golden Apple 타이머는 벽시계 대신 시뮬레이션 시간을 사용
+        self.score_manager.clock = self.get_time
+
+        # 게임 전용 난수 생성기 (전역 random 상태와 독립)
+        self.rng = random.Random(seed)
+        self.sim_time = 0.0
+
+        self.snake: Optional[Snake] = None
+        self.food: Optional[Food] = None
+        self.obstacle: Optional[Obstacle] = None
+        self.free_cells: Optional[FreeCellIndex] = None
+        self.game_over = False
+        self.game_over_reason: Optional[str] = None
+        self.tick = 0
+
+        self.reset()
+
+    def apply_difficulty_settings(self) -> None:
+        """난이도 설정 적용"""
+        settings = DIFFICULTIES[self.difficulty]
+        self.initial_fps = settings['initial_fps']
+        self.speed_increase_interval = settings['speed_increase_interval']
+        self.max_fps = settings['max_fps']
+        self.current_fps = self.initial_fps
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """
+        게임 상태 초기화 (뱀/장애물/먹이 재생성, 점수 리셋)
+
+        Args:
+            seed: 난수 시드 (None이면 현재 난수 생성기를 이어서 사용)
+        """
+        if seed is not None:
+            self.rng.seed(seed)
+        self.sim_time = 0.0
+
+        # 빈 칸 인덱스 (뱀/먹이/장애물의 점유 변화가 점진적으로 반영됨)
+        self.free_cells = FreeCellIndex(GRID_WIDTH, GRID_HEIGHT)
+        self.snake = Snake(self.free_cells)
+        self.apply_difficulty_settings()
+
+        # 장애물 생성 (난이도에 따라)
+        self.food = Food(self.free_cells, self.rng, self.get_time)
+        obstacle_count = DIFFICULTIES[self.difficulty]['obstacles']
+        self.obstacle = Obstacle(obstacle_count, self.snake.body, self.food.get_position(),
+                                 self.free_cells, self.rng) if obstacle_count > 0 else None
+
+        # 먹이 재생성 (장애물 고려)
+        self.respawn_food()
+
+        self.score_manager.reset()
+        self.game_over = False
+        self.game_over_reason = None
+        self.tick = 0
+
+    def get_time(self) -> float:
+        """시뮬레이션 시간(초) 반환 (매 틱마다 1/current_fps씩 증가)"""
+        return self.sim_time
+
+    def get_obstacle_positions(self) -> list:
+        """장애물 위치 리스트 반환 (장애물이 없으면 빈 리스트)"""
+        return self.obstacle.get_positions() if self.obstacle else []
+
+    def respawn_food(self) -> bool:
+        """
+        뱀/장애물과 겹치지 않는 위치에 먹이 재생성
+
+        Returns:
+            생성 성공 여부 (보드가 가득 차면 False)
+        """
+        return self.food.spawn(self.snake.body, self.get_obstacle_positions())
+
+    def step(self, action: Optional[Tuple[int, int]] = None) -> str:
+        """
+        게임을 한 틱 진행
+
+        Args:
+            action: 방향 입력 (UP/DOWN/LEFT/RIGHT) 또는 None (현재 방향 유지)
+
+        Returns:
+            발생한 이벤트 (EVENT_NONE, EVENT_EAT, EVENT_GAME_OVER)
+        """
+        if self.game_over:
+            return EVENT_GAME_OVER
+
+        if action is not None:
+            self.snake.change_direction(action)
+
+        self.tick += 1
+        event = self._advance()
+        if event != EVENT_GAME_OVER:
+            # 시뮬레이션 시간 진행 (현재 속도 기준 한 틱)
+            self.sim_time += 1.0 / self.current_fps
+        return event
+
+    def _advance(self) -> str:
+        """이동/충돌/먹기 규칙을 한 틱 적용하고 이벤트 반환"""
+        # Golden Apple 타이머 체크 (10초 경과 시 재생성)
+        if self.food.should_respawn():
+            self.respawn_food()
+
+        # 뱀 이동 (Portal 모드 적용)
+        self.snake.move(self.portal_mode)
+
+        # 벽 충돌 확인 (Portal 모드가 아닐 때만)
+        if not self.portal_mode and self.snake.check_wall_collision():
+            return self._end_game('wall')
+
+        # 장애물 충돌 확인
+        if self.obstacle and self.obstacle.check_collision(self.snake.get_head()):
+            return self._end_game('obstacle')
+
+        # 자기 몸통 충돌 확인
+        if self.snake.check_self_collision():
+            return self._end_game('self')
+
+        # 먹이 먹기 확인
+        if self.snake.get_head() == self.food.get_position():
+            if not self._eat_food():
+                # 먹이를 놓을 빈 칸이 없음 (보드가 가득 참)
+                return self._end_game('board_full')
+            return EVENT_EAT
+
+        return EVENT_NONE
+
+    def _end_game(self, reason: str) -> str:
+        """
+        게임 오버 처리
+
+        Args:
+            reason: 게임 오버 원인 (wall, obstacle, self, board_full)
+        """
+        self.game_over = True
+        self.game_over_reason = reason
+        self.score_manager.end_game()
+        return EVENT_GAME_OVER
+
+    def _eat_food(self) -> bool:
+        """
+        먹이를 먹었을 때 성장/점수/재생성/속도 증가 처리
+
+        Returns:
+            먹이 재생성 성공 여부 (보드가 가득 차면 False)
+        """
+        self.snake.grow()
+
+        # 점수 추가 (Golden Apple이면 50점, 일반은 10점)
+        food_value = self.food.get_value()
+        if food_value == GOLDEN_APPLE_SCORE:
+            # Golden Apple: 직접 점수 추가
+            self.score_manager.score += food_value
+            if self.score_manager.score > self.score_manager.high_score:
+                self.score_manager.high_score = self.score_manager.score
+                self.score_manager.save_high_score()
+            self.score_manager.food_eaten += 1
+        else:
+            # 일반 먹이: 기존 로직 (콤보 포함)
+            self.score_manager.add_food()
+
+        # 속도 증가
+        if self.score_manager.get_food_eaten() % self.speed_increase_interval == 0:
+            if self.current_fps < self.max_fps:
+                self.current_fps += 1
+
+        # 먹이 재생성
+        return self.respawn_food()
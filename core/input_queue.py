@@ -0,0 +1,55 @@
+"""방향 입력 큐 (틱 사이에 들어온 키 입력을 순서대로 한 틱에 하나씩 적용)"""
+from collections import deque
+from typing import Optional, Tuple
+from constants import INPUT_QUEUE_SIZE
+
+
+class DirectionQueue:
+    """
+    틱 단위로 소비되는 방향 입력 버퍼
+
+    새 입력은 마지막으로 큐에 들어간 방향(큐가 비었으면 뱀의 현재 방향)을
+    기준으로 검증한다. 같은 방향과 반대 방향은 버리므로, 한 틱 안에
+    UP → LEFT처럼 빠르게 눌러도 두 입력이 각각 다음 틱들에 적용되고
+    뱀이 제 몸으로 돌아서는 일이 없다.
+    """
+
+    def __init__(self, max_size: int = INPUT_QUEUE_SIZE):
+        """
+        입력 큐 초기화
+
+        Args:
+            max_size: 보관할 최대 입력 수 (가득 차면 새 입력은 버림)
+        """
+        self.max_size = max_size
+        self._queue = deque()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def push(self, direction: Tuple[int, int], current_direction: Tuple[int, int]) -> bool:
+        """
+        방향 입력 추가
+
+        Args:
+            direction: 입력된 방향
+            current_direction: 뱀의 현재 방향
+
+        Returns:
+            큐에 추가되었는지 여부
+        """
+        last = self._queue[-1] if self._queue else current_direction
+        if direction == last or direction == (-last[0], -last[1]):
+            return False
+        if len(self._queue) >= self.max_size:
+            return False
+        self._queue.append(direction)
+        return True
+
+    def pop(self) -> Optional[Tuple[int, int]]:
+        """다음 틱에 적용할 방향 꺼내기 (없으면 None)"""
+        return self._queue.popleft() if self._queue else None
+
+    def clear(self) -> None:
+        """대기 중인 입력 모두 제거"""
+        self._queue.clear()
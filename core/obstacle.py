@@ -4,7 +4,7 @@ from constants import GRID_WIDTH, GRID_HEIGHT
 
 
 class Obstacle:
-    def __init__(self, count, snake_body, food_pos):
+    def __init__(self, count, snake_body, food_pos, free_cells=None, rng=None):
         """
         장애물 초기화
         
@@ -12,8 +12,13 @@ class Obstacle:
             count: 생성할 장애물 개수
             snake_body: 뱀의 몸통 위치 리스트
             food_pos: 먹이 위치 튜플
+            free_cells: 빈 칸 인덱스 (FreeCellIndex, 선택)
+            rng: 난수 생성기 (random.Random, None이면 random 모듈)
         """
+        self.rng = rng if rng is not None else random
         self.positions = []
+        self._position_set = set()
+        self.free_cells = free_cells
         self.generate_positions(count, snake_body, food_pos)
     
     def generate_positions(self, count, snake_body, food_pos):
@@ -25,22 +30,53 @@ class Obstacle:
             snake_body: 뱀의 몸통 위치 리스트
             food_pos: 먹이 위치 튜플
         """
-        self.positions = []
-        occupied = set(snake_body + [food_pos])
+        self.clear()
+        
+        # 빈 칸 인덱스가 있으면 O(1) 샘플링 (보드가 가득 차면 중단)
+        if self.free_cells is not None:
+            while len(self.positions) < count:
+                pos = self.free_cells.sample(self.rng)
+                if pos is None:
+                    break
+                self.add(pos)
+            return
+        
+        occupied = set(snake_body)
+        occupied.add(food_pos)
         
         max_attempts = 1000  # 무한 루프 방지
         attempts = 0
         
         while len(self.positions) < count and attempts < max_attempts:
-            x = random.randint(0, GRID_WIDTH - 1)
-            y = random.randint(0, GRID_HEIGHT - 1)
+            x = self.rng.randint(0, GRID_WIDTH - 1)
+            y = self.rng.randint(0, GRID_HEIGHT - 1)
             pos = (x, y)
             
-            if pos not in occupied and pos not in self.positions:
-                self.positions.append(pos)
+            if pos not in occupied and pos not in self._position_set:
+                self.add(pos)
             
             attempts += 1
     
+    def add(self, position):
+        """
+        장애물 추가
+        
+        Args:
+            position: 장애물 위치 (x, y)
+        """
+        self.positions.append(position)
+        self._position_set.add(position)
+        if self.free_cells is not None:
+            self.free_cells.occupy(position)
+    
+    def clear(self):
+        """모든 장애물 제거 (빈 칸 인덱스에서도 해제)"""
+        if self.free_cells is not None:
+            for position in self.positions:
+                self.free_cells.release(position)
+        self.positions = []
+        self._position_set = set()
+    
     def get_positions(self):
         """장애물 위치 리스트 반환"""
         return self.positions
@@ -55,4 +91,4 @@ class Obstacle:
         Returns:
             bool: 충돌하면 True, 아니면 False
         """
-        return position in self.positions
+        return position in self._position_set
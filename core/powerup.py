@@ -2,11 +2,11 @@
 import pygame
 import time
 import random
-from typing import Tuple, Optional
+from typing import Iterable, Tuple, Optional
 from constants import (
     POWERUP_SPEED_BOOST, POWERUP_SLOW_MOTION, POWERUP_INVINCIBLE,
     POWERUP_COLORS, POWERUP_PROBABILITY, POWERUP_DURATION,
-    POWERUP_SCORE, POWERUP_EFFECTS, GRID_SIZE
+    POWERUP_SCORE, POWERUP_EFFECTS, GRID_SIZE, GRID_WIDTH, GRID_HEIGHT
 )
 
 
@@ -30,54 +30,23 @@ class PowerUp:
         self.start_time: Optional[float] = None
         self.animation_frame = 0
         
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface, atlas) -> Optional[pygame.Rect]:
         """
-        파워업을 화면에 그리기
+        파워업을 화면에 그리기 (미리 회전해 둔 아틀라스 프레임 사용)
         
         Args:
             surface: 그릴 화면
-        """
-        x, y = self.position
-        pixel_x = x * GRID_SIZE
-        pixel_y = y * GRID_SIZE
+            atlas: 스프라이트 아틀라스 (ui.sprite_atlas.SpriteAtlas, 호출하는 렌더러가 전달)
         
+        Returns:
+            그려진 영역
+        """
         # 회전 애니메이션을 위한 프레임 증가
         self.animation_frame += 1
         
-        # 중심점
-        center_x = pixel_x + GRID_SIZE // 2
-        center_y = pixel_y + GRID_SIZE // 2
-        
-        # 종류별 모양 그리기
-        if self.type == POWERUP_SPEED_BOOST:
-            # 번개 모양 (삼각형)
-            points = [
-                (center_x, center_y - GRID_SIZE // 2 + 2),
-                (center_x + GRID_SIZE // 4, center_y),
-                (center_x, center_y + GRID_SIZE // 2 - 2),
-                (center_x - GRID_SIZE // 4, center_y)
-            ]
-            pygame.draw.polygon(surface, self.color, points)
-            
-        elif self.type == POWERUP_SLOW_MOTION:
-            # 시계 모양 (원과 선)
-            pygame.draw.circle(surface, self.color, (center_x, center_y), GRID_SIZE // 3)
-            # 시계 바늘
-            angle = (self.animation_frame * 6) % 360
-            end_x = center_x + int((GRID_SIZE // 4) * pygame.math.Vector2(1, 0).rotate(angle).x)
-            end_y = center_y + int((GRID_SIZE // 4) * pygame.math.Vector2(1, 0).rotate(angle).y)
-            pygame.draw.line(surface, (255, 255, 255), (center_x, center_y), (end_x, end_y), 2)
-            
-        elif self.type == POWERUP_INVINCIBLE:
-            # 별 모양
-            points = []
-            for i in range(5):
-                angle = i * 144 - 90 + (self.animation_frame * 2) % 360
-                radius = GRID_SIZE // 2 - 2
-                x = center_x + int(radius * pygame.math.Vector2(1, 0).rotate(angle).x)
-                y = center_y + int(radius * pygame.math.Vector2(1, 0).rotate(angle).y)
-                points.append((x, y))
-            pygame.draw.polygon(surface, self.color, points)
+        x, y = self.position
+        tile = atlas.powerup_tile(self.type, self.animation_frame)
+        return surface.blit(tile, (x * GRID_SIZE, y * GRID_SIZE))
             
     def activate(self) -> None:
         """파워업 활성화"""
@@ -103,14 +72,17 @@ class PowerUp:
         self.start_time = None
         
     @staticmethod
-    def should_spawn() -> Optional[str]:
+    def should_spawn(rng=None) -> Optional[str]:
         """
         파워업을 생성할지 결정하고, 생성할 경우 종류 반환
         
+        Args:
+            rng: 난수 생성기 (random.Random, None이면 random 모듈)
+        
         Returns:
             생성할 파워업 종류 또는 None
         """
-        rand = random.random()
+        rand = (rng if rng is not None else random).random()
         cumulative = 0.0
         
         for powerup_type, probability in POWERUP_PROBABILITY.items():
@@ -135,43 +107,66 @@ class PowerUp:
 class PowerUpManager:
     """파워업 관리 클래스"""
     
-    def __init__(self):
-        """파워업 매니저 초기화"""
+    def __init__(self, free_cells=None, rng=None):
+        """
+        파워업 매니저 초기화
+        
+        Args:
+            free_cells: 빈 칸 인덱스 (FreeCellIndex, 선택)
+            rng: 난수 생성기 (random.Random, None이면 random 모듈)
+        """
+        self.rng = rng if rng is not None else random
         self.active_powerups = {}  # {type: PowerUp}
         self.spawn_position: Optional[Tuple[int, int]] = None
         self.spawned_powerup: Optional[PowerUp] = None
+        self.free_cells = free_cells
         
-    def try_spawn(self, occupied_positions: list) -> Optional[PowerUp]:
+    def try_spawn(self, occupied_positions: Iterable = ()) -> Optional[PowerUp]:
         """
         파워업 생성 시도
         
+        free_cells가 있으면 빈 칸 인덱스에서 O(1)로 샘플링하며,
+        이때 occupied_positions는 무시된다.
+        
         Args:
             occupied_positions: 이미 차지된 위치들 (뱀, 먹이, 장애물 등)
             
         Returns:
-            생성된 파워업 또는 None
+            생성된 파워업 또는 None (생성하지 않음 또는 보드가 가득 참)
         """
-        powerup_type = PowerUp.should_spawn()
+        powerup_type = PowerUp.should_spawn(self.rng)
         if powerup_type is None:
             return None
             
         # 빈 위치 찾기
-        from constants import GRID_WIDTH, GRID_HEIGHT
-        available_positions = []
-        for x in range(GRID_WIDTH):
-            for y in range(GRID_HEIGHT):
-                if (x, y) not in occupied_positions:
-                    available_positions.append((x, y))
+        if self.free_cells is not None:
+            position = self.free_cells.sample(self.rng)
+        else:
+            occupied = set(occupied_positions)
+            available_positions = [
+                (x, y)
+                for x in range(GRID_WIDTH)
+                for y in range(GRID_HEIGHT)
+                if (x, y) not in occupied
+            ]
+            position = self.rng.choice(available_positions) if available_positions else None
                     
-        if not available_positions:
+        if position is None:
             return None
             
-        position = random.choice(available_positions)
+        self._release_spawn_position()
         powerup = PowerUp(powerup_type, position)
         self.spawned_powerup = powerup
         self.spawn_position = position
+        if self.free_cells is not None:
+            self.free_cells.occupy(position)
         return powerup
         
+    def _release_spawn_position(self) -> None:
+        """필드에 놓인 파워업 위치를 빈 칸 인덱스에서 해제"""
+        if self.free_cells is not None and self.spawn_position is not None:
+            self.free_cells.release(self.spawn_position)
+        
     def collect(self, powerup: PowerUp) -> int:
         """
         파워업 수집
@@ -184,6 +179,7 @@ class PowerUpManager:
         """
         powerup.activate()
         self.active_powerups[powerup.type] = powerup
+        self._release_spawn_position()
         self.spawned_powerup = None
         self.spawn_position = None
         return powerup.score
@@ -221,5 +217,6 @@ class PowerUpManager:
     def clear(self) -> None:
         """모든 파워업 제거"""
         self.active_powerups.clear()
+        self._release_spawn_position()
         self.spawned_powerup = None
         self.spawn_position = None
@@ -0,0 +1,285 @@
+"""리플레이 기록/재생 (시드 + 방향 전환 입력만 저장하는 압축 바이너리 포맷)"""
+import bisect
+import copy
+from typing import Dict, List, Optional, Tuple
+from constants import UP, DOWN, LEFT, RIGHT, DIFFICULTIES
+from core.game_state import GameState, EVENT_NONE, EVENT_GAME_OVER
+from managers.score_manager import ScoreManager
+
+
+# 파일 포맷
+#   MAGIC | 버전(1B) | 플래그(1B: 난이도 2bit + Portal 1bit)
+#   | varint 시드 | varint 총 틱 수 | varint 입력 수
+#   | 입력마다 varint((이전 입력과의 틱 차이 << 2) | 방향 코드)
+REPLAY_MAGIC = b'SNKR'
+REPLAY_VERSION = 1
+REPLAY_EXTENSION = '.snkr'
+KEYFRAME_INTERVAL = 250  # 재생 시 스냅샷을 남기는 틱 간격
+
+DIRECTION_CODES = (UP, DOWN, LEFT, RIGHT)
+_DIRECTION_INDEX = {direction: code for code, direction in enumerate(DIRECTION_CODES)}
+_DIFFICULTY_NAMES = ('easy', 'normal', 'hard')
+
+
+def encode_varint(value: int, out: bytearray) -> None:
+    """
+    음이 아닌 정수를 LEB128 varint로 인코딩 (7비트씩, 작은 값일수록 짧음)
+
+    Args:
+        value: 인코딩할 값 (0 이상)
+        out: 결과를 이어 붙일 버퍼
+    """
+    if value < 0:
+        raise ValueError("varint는 음수를 표현할 수 없습니다")
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """
+    varint 디코딩
+
+    Args:
+        data: 바이트 데이터
+        offset: 읽기 시작 위치
+
+    Returns:
+        (값, 다음 읽기 위치)
+    """
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("리플레이 데이터가 잘렸습니다")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class Replay:
+    """한 판의 리플레이 데이터 (시드와 틱별 방향 전환 목록)"""
+
+    def __init__(self, difficulty: str, portal_mode: bool, seed: int,
+                 inputs: Optional[List[Tuple[int, Tuple[int, int]]]] = None, length: int = 0):
+        """
+        리플레이 초기화
+
+        Args:
+            difficulty: 난이도 (easy, normal, hard)
+            portal_mode: Portal 모드 여부
+            seed: GameState 난수 시드 (0 이상)
+            inputs: (틱, 방향) 목록 - 해당 틱을 진행하기 전에 적용된 방향
+            length: 기록된 총 틱 수
+        """
+        self.difficulty = difficulty
+        self.portal_mode = portal_mode
+        self.seed = seed
+        self.inputs = inputs if inputs is not None else []
+        self.length = length
+
+    def to_bytes(self) -> bytes:
+        """바이너리로 직렬화"""
+        out = bytearray(REPLAY_MAGIC)
+        out.append(REPLAY_VERSION)
+        out.append(_DIFFICULTY_NAMES.index(self.difficulty) | (0x04 if self.portal_mode else 0))
+        encode_varint(self.seed, out)
+        encode_varint(self.length, out)
+        encode_varint(len(self.inputs), out)
+
+        previous_tick = 0
+        for tick, direction in self.inputs:
+            encode_varint(((tick - previous_tick) << 2) | _DIRECTION_INDEX[direction], out)
+            previous_tick = tick
+        return bytes(out)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> 'Replay':
+        """
+        바이너리에서 리플레이 생성
+
+        Raises:
+            ValueError: 리플레이 포맷이 아니거나 데이터가 손상된 경우
+        """
+        header = len(REPLAY_MAGIC)
+        if data[:header] != REPLAY_MAGIC or len(data) < header + 2:
+            raise ValueError("리플레이 파일이 아닙니다")
+        if data[header] != REPLAY_VERSION:
+            raise ValueError(f"지원하지 않는 리플레이 버전: {data[header]}")
+
+        flags = data[header + 1]
+        if flags & 0x03 >= len(_DIFFICULTY_NAMES):
+            raise ValueError("알 수 없는 난이도")
+        difficulty = _DIFFICULTY_NAMES[flags & 0x03]
+        portal_mode = bool(flags & 0x04)
+
+        offset = header + 2
+        seed, offset = decode_varint(data, offset)
+        length, offset = decode_varint(data, offset)
+        count, offset = decode_varint(data, offset)
+
+        inputs = []
+        tick = 0
+        for _ in range(count):
+            packed, offset = decode_varint(data, offset)
+            tick += packed >> 2
+            inputs.append((tick, DIRECTION_CODES[packed & 0x03]))
+        return Replay(difficulty, portal_mode, seed, inputs, length)
+
+    def save(self, path: str) -> None:
+        """파일로 저장"""
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @staticmethod
+    def load(path: str) -> 'Replay':
+        """파일에서 로드"""
+        with open(path, 'rb') as f:
+            return Replay.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """진행 중인 게임의 방향 전환을 기록"""
+
+    def __init__(self, difficulty: str, portal_mode: bool, seed: int):
+        """
+        리플레이 기록기 초기화
+
+        Args:
+            difficulty: 난이도
+            portal_mode: Portal 모드 여부
+            seed: 게임을 초기화한 난수 시드
+        """
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"알 수 없는 난이도: {difficulty}")
+        self.replay = Replay(difficulty, portal_mode, seed)
+        self._last_direction = RIGHT  # Snake 초기 방향
+
+    def record(self, tick: int, direction: Tuple[int, int]) -> None:
+        """
+        틱을 진행하기 직전의 방향 기록 (바뀌었을 때만 저장)
+
+        Args:
+            tick: 진행할 틱 번호 (GameState.tick)
+            direction: 뱀의 현재 방향
+        """
+        if direction != self._last_direction:
+            self.replay.inputs.append((tick, direction))
+            self._last_direction = direction
+
+    def finish(self, length: int) -> Replay:
+        """
+        기록 종료
+
+        Args:
+            length: 진행된 총 틱 수
+
+        Returns:
+            완성된 리플레이
+        """
+        self.replay.length = length
+        return self.replay
+
+
+class ReplayPlayer:
+    """
+    리플레이를 GameState로 재시뮬레이션
+
+    step()을 반복 호출하면 원래 속도로(게임 루프에서), run()은 제한 없이 빠르게
+    재생한다. 재생 중 keyframe_interval 틱마다 상태 스냅샷을 남겨 seek()가
+    가장 가까운 스냅샷부터 다시 진행하도록 한다.
+    """
+
+    def __init__(self, replay: Replay, keyframe_interval: int = KEYFRAME_INTERVAL):
+        """
+        리플레이 재생기 초기화
+
+        Args:
+            replay: 재생할 리플레이
+            keyframe_interval: 스냅샷 간격 (틱)
+        """
+        self.replay = replay
+        self.keyframe_interval = keyframe_interval
+        self._keyframes: Dict[int, Tuple[GameState, int]] = {}
+        self._keyframe_ticks: List[int] = []
+
+        self.state = GameState(replay.difficulty, replay.portal_mode, ScoreManager(None),
+                               seed=replay.seed)
+        self._cursor = 0
+        self._save_keyframe()
+
+    @property
+    def tick(self) -> int:
+        """현재 틱"""
+        return self.state.tick
+
+    @property
+    def finished(self) -> bool:
+        """재생 완료 여부 (게임 오버 또는 기록 끝)"""
+        return self.state.game_over or self.state.tick >= self.replay.length
+
+    def _save_keyframe(self) -> None:
+        """현재 상태를 스냅샷으로 저장"""
+        tick = self.state.tick
+        if tick not in self._keyframes:
+            self._keyframes[tick] = (copy.deepcopy(self.state), self._cursor)
+            bisect.insort(self._keyframe_ticks, tick)
+
+    def step(self) -> str:
+        """
+        한 틱 재생
+
+        Returns:
+            발생한 이벤트 (재생이 끝났으면 EVENT_NONE 또는 EVENT_GAME_OVER)
+        """
+        if self.finished:
+            return EVENT_GAME_OVER if self.state.game_over else EVENT_NONE
+
+        # 기록된 방향을 그대로 적용 (change_direction 검증은 녹화 시 이미 거침)
+        inputs = self.replay.inputs
+        if self._cursor < len(inputs) and inputs[self._cursor][0] == self.state.tick:
+            self.state.snake.direction = inputs[self._cursor][1]
+            self._cursor += 1
+
+        event = self.state.step()
+        if self.state.tick % self.keyframe_interval == 0:
+            self._save_keyframe()
+        return event
+
+    def run(self, until: Optional[int] = None) -> GameState:
+        """
+        디스플레이 없이 최대 속도로 재생
+
+        Args:
+            until: 멈출 틱 (None이면 끝까지)
+
+        Returns:
+            재생 후 게임 상태
+        """
+        target = self.replay.length if until is None else min(until, self.replay.length)
+        while self.state.tick < target and not self.state.game_over:
+            self.step()
+        return self.state
+
+    def seek(self, tick: int) -> GameState:
+        """
+        임의의 틱으로 이동 (가장 가까운 이전 스냅샷에서 재시뮬레이션)
+
+        Args:
+            tick: 이동할 틱
+
+        Returns:
+            이동한 시점의 게임 상태
+        """
+        tick = max(0, min(tick, self.replay.length))
+        index = bisect.bisect_right(self._keyframe_ticks, tick) - 1
+        nearest = self._keyframe_ticks[index]
+        if self.state.tick > tick or nearest > self.state.tick:
+            snapshot, cursor = self._keyframes[nearest]
+            self.state = copy.deepcopy(snapshot)
+            self._cursor = cursor
+        return self.run(tick)
@@ -1,10 +1,130 @@
 """뱀(Snake) 클래스"""
+from collections import deque
 from constants import *
 
 
+class SnakeBody:
+    """
+    deque 기반 몸통 뷰 (머리부터 꼬리까지)
+    
+    머리 삽입/꼬리 제거가 O(1)이며, 칸별 점유 개수를 함께 유지하여
+    `in` 검사와 충돌 검사도 O(1)로 수행한다. 인덱스 접근/대입, 슬라이싱,
+    리스트와의 비교·연결 등 기존 리스트 사용 방식과 호환된다.
+    """
+    
+    __slots__ = ('_segments', '_cell_counts', '_free_cells')
+    
+    def __init__(self, segments=(), free_cells=None):
+        """
+        몸통 초기화
+        
+        Args:
+            segments: 머리부터 꼬리까지의 위치 시퀀스
+            free_cells: 점유 변화를 반영할 FreeCellIndex (선택)
+        """
+        self._segments = deque()
+        self._cell_counts = {}  # {(x, y): count}
+        self._free_cells = free_cells
+        for segment in segments:
+            self.append(segment)
+    
+    def _occupy(self, position):
+        """칸 점유 개수 증가"""
+        count = self._cell_counts.get(position, 0)
+        self._cell_counts[position] = count + 1
+        if count == 0 and self._free_cells is not None:
+            self._free_cells.occupy(position)
+    
+    def _vacate(self, position):
+        """칸 점유 개수 감소 (0이 되면 제거)"""
+        count = self._cell_counts[position] - 1
+        if count:
+            self._cell_counts[position] = count
+        else:
+            del self._cell_counts[position]
+            if self._free_cells is not None:
+                self._free_cells.release(position)
+    
+    def detach(self):
+        """빈 칸 인덱스에서 몸통이 점유한 칸을 모두 해제"""
+        if self._free_cells is not None:
+            for position in self._cell_counts:
+                self._free_cells.release(position)
+            self._free_cells = None
+    
+    def appendleft(self, position):
+        """머리 쪽에 마디 추가 (O(1))"""
+        self._segments.appendleft(position)
+        self._occupy(position)
+    
+    def append(self, position):
+        """꼬리 쪽에 마디 추가 (O(1))"""
+        self._segments.append(position)
+        self._occupy(position)
+    
+    def pop(self):
+        """꼬리 마디 제거 후 반환 (O(1))"""
+        position = self._segments.pop()
+        self._vacate(position)
+        return position
+    
+    def count_at(self, position):
+        """특정 칸을 점유한 마디 수 반환 (O(1))"""
+        return self._cell_counts.get(position, 0)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._segments)[index]
+        return self._segments[index]
+    
+    def __setitem__(self, index, position):
+        old = self._segments[index]
+        self._segments[index] = position
+        self._vacate(old)
+        self._occupy(position)
+    
+    def __len__(self):
+        return len(self._segments)
+    
+    def __iter__(self):
+        return iter(self._segments)
+    
+    def __reversed__(self):
+        return reversed(self._segments)
+    
+    def __contains__(self, position):
+        return position in self._cell_counts
+    
+    def __eq__(self, other):
+        if isinstance(other, SnakeBody):
+            return self._segments == other._segments
+        if isinstance(other, (list, tuple, deque)):
+            return list(self._segments) == list(other)
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __add__(self, other):
+        return list(self._segments) + list(other)
+    
+    def __radd__(self, other):
+        return list(other) + list(self._segments)
+    
+    def __repr__(self):
+        return repr(list(self._segments))
+
+
 class Snake:
-    def __init__(self):
-        """뱀 초기화: 화면 중앙에 길이 3으로 시작"""
+    def __init__(self, free_cells=None):
+        """
+        뱀 초기화: 화면 중앙에 길이 3으로 시작
+        
+        Args:
+            free_cells: 몸통 점유를 반영할 FreeCellIndex (선택)
+        """
+        self.free_cells = free_cells
+        self._body = None
+        
         # 화면 중앙 위치
         center_x = GRID_WIDTH // 2
         center_y = GRID_HEIGHT // 2
@@ -20,6 +140,18 @@ class Snake:
         self.direction = RIGHT
         self.growing = False  # 성장 여부
     
+    @property
+    def body(self):
+        """몸통 (SnakeBody, 머리부터 꼬리까지)"""
+        return self._body
+    
+    @body.setter
+    def body(self, segments):
+        """몸통 교체 (점유 정보 재구성)"""
+        if self._body is not None:
+            self._body.detach()
+        self._body = SnakeBody(segments, self.free_cells)
+    
     def change_direction(self, new_direction):
         """방향 변경 (반대 방향으로는 변경 불가)"""
         # 현재 방향의 반대 방향인지 확인
@@ -51,11 +183,11 @@ class Snake:
         new_head = (new_head_x, new_head_y)
         
         # 새 머리를 몸통 앞에 추가
-        self.body.insert(0, new_head)
+        self._body.appendleft(new_head)
         
         # 성장 중이 아니면 꼬리 제거
         if not self.growing:
-            self.body.pop()
+            self._body.pop()
         else:
             self.growing = False
     
@@ -75,12 +207,31 @@ class Snake:
         return False
     
     def check_self_collision(self):
-        """자기 몸통 충돌 확인"""
-        head = self.body[0]
+        """자기 몸통 충돌 확인 (O(1))"""
+        # 머리 칸을 두 개 이상의 마디가 점유하면 충돌
+        return self._body.count_at(self._body[0]) > 1
+    
+    def occupies(self, position):
+        """
+        특정 위치를 뱀이 점유하고 있는지 확인 (O(1))
         
-        # 머리가 몸통의 나머지 부분과 충돌하는지 확인
-        return head in self.body[1:]
+        Args:
+            position: 확인할 위치 (x, y)
+            
+        Returns:
+            bool: 점유 중이면 True
+        """
+        return position in self._body
+    
+    def set_head(self, position):
+        """
+        머리 위치 교체 (Portal 모드 보정 등)
+        
+        Args:
+            position: 새 머리 위치 (x, y)
+        """
+        self._body[0] = position
     
     def get_head(self):
         """머리 위치 반환"""
-        return self.body[0]
+        return self._body[0]
@@ -5,6 +5,7 @@ import pygame
 import sys
 from ui.menu import MainMenu
 from ui.leaderboard import Leaderboard, LeaderboardUI
+from ui.text_cache import get_font, text_cache
 from managers.achievement_manager import AchievementManager
 from constants import WINDOW_WIDTH, WINDOW_HEIGHT, BLACK
 
@@ -137,22 +138,22 @@ class GameApp:
         self.screen.fill(BLACK)
         
         # 타이틀
-        title_font = pygame.font.Font(None, 56)
-        title_text = title_font.render("ACHIEVEMENTS", True, YELLOW)
+        title_font = get_font(56)
+        title_text = text_cache.render(title_font, "ACHIEVEMENTS", YELLOW)
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 50))
         self.screen.blit(title_text, title_rect)
         
         # 진행도
         progress = self.achievement_manager.get_progress()
-        progress_font = pygame.font.Font(None, 28)
+        progress_font = get_font(28)
         progress_text = f"{progress['unlocked']}/{progress['total']} ({progress['percentage']}%)"
-        progress_render = progress_font.render(progress_text, True, GREEN)
+        progress_render = text_cache.render(progress_font, progress_text, GREEN)
         progress_rect = progress_render.get_rect(center=(WINDOW_WIDTH // 2, 100))
         self.screen.blit(progress_render, progress_rect)
         
         # 업적 목록
         achievements = self.achievement_manager.get_all_achievements()
-        item_font = pygame.font.Font(None, 24)
+        item_font = get_font(24)
         start_y = 150
         item_spacing = 50
         
@@ -163,21 +164,22 @@ class GameApp:
             color = GREEN if achievement.unlocked else GRAY
             
             # 이름
-            name_text = item_font.render(
+            name_text = text_cache.render(
+                item_font,
                 f"{'✓' if achievement.unlocked else '✗'} {achievement.name}",
-                True, color
+                color
             )
             self.screen.blit(name_text, (100, y))
             
             # 설명
-            desc_font = pygame.font.Font(None, 20)
-            desc_text = desc_font.render(achievement.description, True, GRAY)
+            desc_font = get_font(20)
+            desc_text = text_cache.render(desc_font, achievement.description, GRAY)
             self.screen.blit(desc_text, (120, y + 25))
             
         # 하단 안내
-        hint_font = pygame.font.Font(None, 24)
+        hint_font = get_font(24)
         hint_text = "Press ESC to return"
-        hint_render = hint_font.render(hint_text, True, GRAY)
+        hint_render = text_cache.render(hint_font, hint_text, GRAY)
         hint_rect = hint_render.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 40))
         self.screen.blit(hint_render, hint_rect)
 
@@ -1,44 +1,208 @@
 """점수 관리 클래스"""
+import atexit
 import json
 import os
+import tempfile
+import threading
 import time
+from typing import Dict, Optional
+
+
+HIGHSCORE_FLUSH_INTERVAL = 5.0  # 변경된 최고 점수를 모아서 기록하는 주기 (초)
+
+
+class HighScoreStore:
+    """
+    최고 점수 파일의 write-behind 저장소 (파일 경로마다 하나)
+
+    mark_dirty()는 값만 기록하고 바로 반환한다. 백그라운드 스레드가 변경을
+    모아 두었다가 주기(flush_interval)마다, 또는 flush() 요청(게임 종료)이나
+    프로세스 종료 시에 한 번만 쓴다. 쓰기는 임시 파일에 기록한 뒤
+    os.replace()로 교체하므로 도중에 중단돼도 기존 파일이 깨지지 않는다.
+    """
+
+    def __init__(self, path: str, flush_interval: float = HIGHSCORE_FLUSH_INTERVAL):
+        """
+        저장소 초기화
+
+        Args:
+            path: 최고 점수 파일 경로
+            flush_interval: 자동 기록 주기 (초)
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        self._condition = threading.Condition()
+        self._pending: Optional[int] = None  # 아직 기록하지 않은 값
+        self._dirty_version = 0  # mark_dirty() 횟수
+        self._written_version = 0  # 기록을 마친 버전
+        self._flush_requested = False
+        self._thread: Optional[threading.Thread] = None
+        self.writes = 0  # 실제 파일 쓰기 횟수
+
+    def load(self) -> int:
+        """
+        최고 점수 읽기 (기록 대기 중인 값이 있으면 먼저 기록)
+
+        Returns:
+            저장된 최고 점수 (파일이 없거나 손상되면 0)
+        """
+        self.flush(wait=True)
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r') as f:
+                    data = json.load(f)
+                    return data.get('high_score', 0)
+        except (json.JSONDecodeError, IOError):
+            pass
+        return 0
+
+    def mark_dirty(self, high_score: int) -> None:
+        """
+        새 최고 점수 기록 예약 (파일 I/O 없이 바로 반환)
+
+        Args:
+            high_score: 기록할 최고 점수
+        """
+        with self._condition:
+            self._pending = high_score
+            self._dirty_version += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._write_loop, name='highscore-writer',
+                                                daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, wait: bool = False, timeout: Optional[float] = None) -> None:
+        """
+        대기 중인 값을 바로 기록하도록 요청
+
+        Args:
+            wait: 기록이 끝날 때까지 기다릴지 여부
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+        """
+        with self._condition:
+            if self._written_version >= self._dirty_version:
+                return
+            self._flush_requested = True
+            self._condition.notify_all()
+            if wait:
+                target = self._dirty_version
+                self._condition.wait_for(lambda: self._written_version >= target, timeout)
+
+    def _write_loop(self) -> None:
+        """쓰기 스레드: 변경이 생기면 주기 또는 요청 시점까지 모았다가 기록"""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None)
+                self._condition.wait_for(lambda: self._flush_requested, self.flush_interval)
+                value, version = self._pending, self._dirty_version
+                self._pending = None
+                self._flush_requested = False
+
+            self._write(value)
+
+            with self._condition:
+                self._written_version = version
+                self._condition.notify_all()
+
+    def _write(self, high_score: int) -> None:
+        """임시 파일에 쓴 뒤 원자적으로 교체"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            fd, temp_path = tempfile.mkstemp(prefix='.highscore-', suffix='.tmp', dir=directory)
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'high_score': high_score}, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+            self.writes += 1
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+_stores: Dict[str, HighScoreStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_highscore_store(path: str) -> HighScoreStore:
+    """
+    파일 경로별 공용 저장소 (같은 파일을 쓰는 ScoreManager끼리 공유)
+
+    Args:
+        path: 최고 점수 파일 경로
+
+    Returns:
+        해당 경로의 HighScoreStore
+    """
+    key = os.path.abspath(path)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = HighScoreStore(path)
+            _stores[key] = store
+        return store
+
+
+@atexit.register
+def flush_all_highscores(timeout: float = 5.0) -> None:
+    """프로세스 종료 시 모든 저장소의 대기 중인 값 기록"""
+    with _stores_lock:
+        stores = list(_stores.values())
+    for store in stores:
+        store.flush(wait=True, timeout=timeout)
 
 
 class ScoreManager:
-    def __init__(self, highscore_file='highscore.json'):
-        """점수 관리자 초기화"""
+    def __init__(self, highscore_file='highscore.json', clock=None):
+        """
+        점수 관리자 초기화
+        
+        Args:
+            highscore_file: 최고 점수 파일 경로 (None이면 저장하지 않음)
+            clock: 현재 시간(초)을 반환하는 함수 (None이면 time.time)
+        """
         self.highscore_file = highscore_file
+        self.store = get_highscore_store(highscore_file) if highscore_file is not None else None
+        self.clock = clock if clock is not None else time.time
         self.score = 0
         self.high_score = self.load_high_score()
         self.food_eaten = 0
-        self.start_time = time.time()
+        self.start_time = self.clock()
         self.end_time = None  # 게임 종료 시간
-        self.last_food_time = time.time()
+        self.last_food_time = self.clock()
         self.combo_active = False
         self.combo_timeout = 10.0  # 10초 이내에 먹어야 콤보
     
     def load_high_score(self):
         """최고 점수 로드"""
-        try:
-            if os.path.exists(self.highscore_file):
-                with open(self.highscore_file, 'r') as f:
-                    data = json.load(f)
-                    return data.get('high_score', 0)
-        except (json.JSONDecodeError, IOError):
-            pass
-        return 0
+        if self.store is None:
+            return 0
+        return self.store.load()
     
     def save_high_score(self):
-        """최고 점수 저장"""
-        try:
-            with open(self.highscore_file, 'w') as f:
-                json.dump({'high_score': self.high_score}, f)
-        except IOError:
-            pass
+        """최고 점수 저장 예약 (백그라운드 스레드가 모아서 기록, 게임 틱을 막지 않음)"""
+        if self.store is not None:
+            self.store.mark_dirty(self.high_score)
+    
+    def flush(self, wait=False):
+        """
+        예약된 최고 점수를 바로 기록하도록 요청
+        
+        Args:
+            wait: 기록이 끝날 때까지 기다릴지 여부
+        """
+        if self.store is not None:
+            self.store.flush(wait)
     
     def add_food(self):
         """먹이를 먹었을 때 점수 추가"""
-        current_time = time.time()
+        current_time = self.clock()
         base_points = 10
         
         # 첫 번째 먹이가 아니고 3초 이내에 먹으면 콤보
@@ -74,18 +238,19 @@ class ScoreManager:
         if self.end_time is not None:
             # 게임 오버 후에는 고정된 시간 반환
             return int(self.end_time - self.start_time)
-        return int(time.time() - self.start_time)
+        return int(self.clock() - self.start_time)
     
     def end_game(self):
-        """게임 종료 시점 기록"""
+        """게임 종료 시점 기록 (예약된 최고 점수 기록 요청)"""
         if self.end_time is None:
-            self.end_time = time.time()
+            self.end_time = self.clock()
+        self.flush()
     
     def is_combo_active(self):
         """콤보 활성 여부 반환"""
         # 콤보가 활성화되어 있더라도 10초가 지나면 비활성화
         if self.combo_active:
-            current_time = time.time()
+            current_time = self.clock()
             if current_time - self.last_food_time > self.combo_timeout:
                 self.combo_active = False
         return self.combo_active
@@ -94,7 +259,7 @@ class ScoreManager:
         """점수 리셋 (재시작 시)"""
         self.score = 0
         self.food_eaten = 0
-        self.start_time = time.time()
+        self.start_time = self.clock()
         self.end_time = None
-        self.last_food_time = time.time()
+        self.last_food_time = self.clock()
         self.combo_active = False
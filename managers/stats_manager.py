@@ -1,8 +1,52 @@
 """통계 관리 시스템 (SQLite)"""
 import sqlite3
+import math
 import os
-from typing import Dict, Optional, Tuple
-from datetime import datetime
+import queue
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+from datetime import datetime, timedelta
+
+
+STATEMENT_CACHE_SIZE = 64  # 연결별로 캐시할 준비된 문장 수
+STATS_QUEUE_SIZE = 1024  # 쓰기 대기 중인 최대 기록 수 (넘치면 버림)
+STATS_BATCH_SIZE = 64  # 트랜잭션 하나에 묶는 최대 기록 수
+STATS_DRAIN_TIMEOUT = 5.0  # 종료 시 남은 기록을 쓰기 위해 기다리는 최대 시간 (초)
+
+# 자주 쓰는 문장 (같은 문자열을 재사용해 sqlite3 문장 캐시에 적중)
+_RECORD_GAME_SQL = """
+    UPDATE global_stats 
+    SET total_playtime = total_playtime + ?,
+        total_games = total_games + 1,
+        total_food_eaten = total_food_eaten + ?,
+        total_golden_apples = total_golden_apples + ?,
+        total_powerups_collected = total_powerups_collected + ?
+    WHERE id = 1
+"""
+# 더 높은 점수일 때만 갱신 (조회 + 삽입을 한 문장으로, rowcount로 갱신 여부 판단)
+_DIFFICULTY_HIGHSCORE_SQL = """
+    INSERT INTO difficulty_highscores (difficulty, highscore, achieved_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT(difficulty) DO UPDATE
+    SET highscore = excluded.highscore, achieved_at = excluded.achieved_at
+    WHERE excluded.highscore > difficulty_highscores.highscore
+"""
+_MODE_HIGHSCORE_SQL = """
+    INSERT INTO mode_highscores (mode, highscore, achieved_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT(mode) DO UPDATE
+    SET highscore = excluded.highscore, achieved_at = excluded.achieved_at
+    WHERE excluded.highscore > mode_highscores.highscore
+"""
+_SURVIVAL_SQL = """
+    INSERT INTO survival_records (survival_time, achieved_at)
+    VALUES (?, ?)
+"""
+_SESSION_SQL = """
+    INSERT INTO sessions (played_at, difficulty, mode, score, playtime, food_eaten, survival_time)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
 
 
 class StatsManager:
@@ -16,8 +60,39 @@ class StatsManager:
             db_path: 데이터베이스 파일 경로
         """
         self.db_path = db_path
+        self._local = threading.local()  # 스레드별 연결 (한 번 열면 계속 사용)
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
         self._ensure_directory()
         self._init_database()
+    
+    def _connection(self) -> sqlite3.Connection:
+        """
+        현재 스레드의 연결 (처음 요청 시 열고 WAL/synchronous=NORMAL 설정)
+        
+        Returns:
+            스레드 전용 sqlite3 연결
+        """
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            # 각 연결은 만든 스레드에서만 사용하되, close()는 어느 스레드에서든 가능하도록
+            conn = sqlite3.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE,
+                                   check_same_thread=False)
+            # WAL: 읽기와 쓰기가 서로 막지 않음, NORMAL: 커밋마다 fsync하지 않음 (체크포인트 시에만)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+    
+    def close(self) -> None:
+        """열려 있는 모든 연결 닫기 (이후 호출 시 다시 열림)"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
         
     def _ensure_directory(self) -> None:
         """데이터 디렉토리 생성"""
@@ -27,7 +102,7 @@ class StatsManager:
             
     def _init_database(self) -> None:
         """데이터베이스 초기화 및 테이블 생성"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connection()
         cursor = conn.cursor()
         
         # 전체 통계 테이블
@@ -68,6 +143,38 @@ class StatsManager:
                 achieved_at TEXT
             )
         """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_survival_records_time
+            ON survival_records (survival_time)
+        """)
+        
+        # 판별 기록 (분위수/추세 조회용)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                id INTEGER PRIMARY KEY,
+                played_at TEXT NOT NULL,
+                difficulty TEXT NOT NULL,
+                mode TEXT,
+                score INTEGER NOT NULL,
+                playtime REAL,
+                food_eaten INTEGER,
+                survival_time REAL
+            )
+        """)
+        # 커버링 인덱스: 조건 컬럼(난이도/모드) 다음에 기간을 두어 "최근 N일" 범위만 인덱스에서
+        # 읽고 점수까지 인덱스에서 꺼냄 (테이블 조회 없음, GROUP BY는 점수 종류 수만큼만)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_sessions_mode
+            ON sessions (mode, difficulty, played_at, score)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_sessions_difficulty
+            ON sessions (difficulty, played_at, score)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_sessions_played_at
+            ON sessions (played_at, difficulty, mode, score)
+        """)
         
         # 초기 데이터 삽입
         cursor.execute("SELECT COUNT(*) FROM global_stats")
@@ -75,7 +182,6 @@ class StatsManager:
             cursor.execute("INSERT INTO global_stats (id) VALUES (1)")
             
         conn.commit()
-        conn.close()
         
     def record_game(self, playtime: float, food_eaten: int, 
                    golden_apples: int = 0, powerups_collected: int = 0) -> None:
@@ -88,21 +194,8 @@ class StatsManager:
             golden_apples: 먹은 골든 애플 수
             powerups_collected: 수집한 파워업 수
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            UPDATE global_stats 
-            SET total_playtime = total_playtime + ?,
-                total_games = total_games + 1,
-                total_food_eaten = total_food_eaten + ?,
-                total_golden_apples = total_golden_apples + ?,
-                total_powerups_collected = total_powerups_collected + ?
-            WHERE id = 1
-        """, (playtime, food_eaten, golden_apples, powerups_collected))
-        
-        conn.commit()
-        conn.close()
+        with self._connection() as conn:
+            conn.execute(_RECORD_GAME_SQL, (playtime, food_eaten, golden_apples, powerups_collected))
         
     def update_difficulty_highscore(self, difficulty: str, score: int) -> bool:
         """
@@ -115,27 +208,8 @@ class StatsManager:
         Returns:
             새로운 최고 점수인지 여부
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "SELECT highscore FROM difficulty_highscores WHERE difficulty = ?",
-            (difficulty,)
-        )
-        result = cursor.fetchone()
-        
-        is_new_highscore = False
-        if result is None or score > result[0]:
-            is_new_highscore = True
-            cursor.execute("""
-                INSERT OR REPLACE INTO difficulty_highscores 
-                (difficulty, highscore, achieved_at) 
-                VALUES (?, ?, ?)
-            """, (difficulty, score, datetime.now().isoformat()))
-            
-        conn.commit()
-        conn.close()
-        return is_new_highscore
+        with self._connection() as conn:
+            return self._update_highscore(conn, _DIFFICULTY_HIGHSCORE_SQL, difficulty, score)
         
     def update_mode_highscore(self, mode: str, score: int) -> bool:
         """
@@ -148,27 +222,8 @@ class StatsManager:
         Returns:
             새로운 최고 점수인지 여부
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "SELECT highscore FROM mode_highscores WHERE mode = ?",
-            (mode,)
-        )
-        result = cursor.fetchone()
-        
-        is_new_highscore = False
-        if result is None or score > result[0]:
-            is_new_highscore = True
-            cursor.execute("""
-                INSERT OR REPLACE INTO mode_highscores 
-                (mode, highscore, achieved_at) 
-                VALUES (?, ?, ?)
-            """, (mode, score, datetime.now().isoformat()))
-            
-        conn.commit()
-        conn.close()
-        return is_new_highscore
+        with self._connection() as conn:
+            return self._update_highscore(conn, _MODE_HIGHSCORE_SQL, mode, score)
         
     def record_survival_time(self, survival_time: float) -> None:
         """
@@ -177,16 +232,78 @@ class StatsManager:
         Args:
             survival_time: 생존 시간 (초)
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._connection() as conn:
+            conn.execute(_SURVIVAL_SQL, (survival_time, datetime.now().isoformat()))
         
-        cursor.execute("""
-            INSERT INTO survival_records (survival_time, achieved_at)
-            VALUES (?, ?)
-        """, (survival_time, datetime.now().isoformat()))
+    def record_session(self, playtime: float, food_eaten: int, score: int, difficulty: str,
+                       mode: Optional[str] = None, golden_apples: int = 0,
+                       powerups_collected: int = 0,
+                       survival_time: Optional[float] = None) -> Dict[str, bool]:
+        """
+        한 판이 끝났을 때의 모든 기록을 트랜잭션 하나로 저장
         
-        conn.commit()
-        conn.close()
+        record_game / 난이도·모드별 최고 점수 / 생존 시간 기록을 한 번의
+        커밋(WAL에서는 fsync 없이 로그 추가)으로 처리한다.
+        
+        Args:
+            playtime: 플레이 시간 (초)
+            food_eaten: 먹은 먹이 수
+            score: 최종 점수
+            difficulty: 난이도
+            mode: 게임 모드 (None이면 모드별 최고 점수 기록 안 함)
+            golden_apples: 먹은 골든 애플 수
+            powerups_collected: 수집한 파워업 수
+            survival_time: 생존 시간 (초, None이면 기록 안 함)
+            
+        Returns:
+            {'difficulty_highscore': 새 난이도 최고 점수 여부, 'mode_highscore': 새 모드 최고 점수 여부}
+        """
+        with self._connection() as conn:
+            return self._write_session(conn, datetime.now().isoformat(), playtime, food_eaten, score,
+                                       difficulty, mode, golden_apples, powerups_collected,
+                                       survival_time)
+    
+    def record_sessions(self, sessions: List[Dict]) -> List[Dict[str, bool]]:
+        """
+        여러 판의 기록을 트랜잭션 하나로 저장 (StatsWriter의 배치 쓰기용)
+        
+        Args:
+            sessions: record_session()의 키워드 인자 딕셔너리 목록 (판이 끝난 시각
+                'achieved_at'(ISO 문자열)이 있으면 그 시각으로, 없으면 지금 시각으로 기록)
+            
+        Returns:
+            판별 새 최고 점수 여부 목록
+        """
+        now = datetime.now().isoformat()
+        with self._connection() as conn:
+            return [self._write_session(conn, **{'achieved_at': now, **session})
+                    for session in sessions]
+    
+    def _write_session(self, conn: sqlite3.Connection, achieved_at: str, playtime: float,
+                       food_eaten: int, score: int, difficulty: str, mode: Optional[str] = None,
+                       golden_apples: int = 0, powerups_collected: int = 0,
+                       survival_time: Optional[float] = None) -> Dict[str, bool]:
+        """한 판의 기록 쓰기 (트랜잭션은 호출자가 관리)"""
+        conn.execute(_RECORD_GAME_SQL, (playtime, food_eaten, golden_apples, powerups_collected))
+        new_records = {
+            'difficulty_highscore': self._update_highscore(
+                conn, _DIFFICULTY_HIGHSCORE_SQL, difficulty, score, achieved_at),
+            'mode_highscore': mode is not None and self._update_highscore(
+                conn, _MODE_HIGHSCORE_SQL, mode, score, achieved_at),
+        }
+        if survival_time is not None:
+            conn.execute(_SURVIVAL_SQL, (survival_time, achieved_at))
+        conn.execute(_SESSION_SQL, (achieved_at, difficulty, mode, score, playtime, food_eaten,
+                                    survival_time))
+        return new_records
+    
+    @staticmethod
+    def _update_highscore(conn: sqlite3.Connection, sql: str, key: str, score: int,
+                          achieved_at: Optional[str] = None) -> bool:
+        """더 높은 점수일 때만 갱신하고 갱신 여부 반환 (트랜잭션은 호출자가 관리)"""
+        if achieved_at is None:
+            achieved_at = datetime.now().isoformat()
+        return conn.execute(sql, (key, score, achieved_at)).rowcount > 0
         
     def get_global_stats(self) -> Dict[str, float]:
         """
@@ -195,8 +312,7 @@ class StatsManager:
         Returns:
             통계 딕셔너리
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._connection().cursor()
         
         cursor.execute("""
             SELECT total_playtime, total_games, total_food_eaten,
@@ -204,7 +320,6 @@ class StatsManager:
             FROM global_stats WHERE id = 1
         """)
         result = cursor.fetchone()
-        conn.close()
         
         if result:
             return {
@@ -226,8 +341,7 @@ class StatsManager:
         Returns:
             (최고 점수, 달성 일시)
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._connection().cursor()
         
         cursor.execute("""
             SELECT highscore, achieved_at 
@@ -235,7 +349,6 @@ class StatsManager:
             WHERE difficulty = ?
         """, (difficulty,))
         result = cursor.fetchone()
-        conn.close()
         
         if result:
             return result[0], result[1]
@@ -251,8 +364,7 @@ class StatsManager:
         Returns:
             (최고 점수, 달성 일시)
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._connection().cursor()
         
         cursor.execute("""
             SELECT highscore, achieved_at 
@@ -260,7 +372,6 @@ class StatsManager:
             WHERE mode = ?
         """, (mode,))
         result = cursor.fetchone()
-        conn.close()
         
         if result:
             return result[0], result[1]
@@ -273,8 +384,7 @@ class StatsManager:
         Returns:
             (생존 시간, 달성 일시)
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._connection().cursor()
         
         cursor.execute("""
             SELECT survival_time, achieved_at 
@@ -283,22 +393,294 @@ class StatsManager:
             LIMIT 1
         """)
         result = cursor.fetchone()
-        conn.close()
         
         if result:
             return result[0], result[1]
         return 0.0, None
+    
+    @staticmethod
+    def _session_filter(difficulty: Optional[str], mode: Optional[str],
+                        days: Optional[float]) -> Tuple[str, list]:
+        """sessions 조회 조건 (None인 항목은 조건에서 제외)"""
+        clauses, params = [], []
+        if difficulty is not None:
+            clauses.append("difficulty = ?")
+            params.append(difficulty)
+        if mode is not None:
+            clauses.append("mode = ?")
+            params.append(mode)
+        if days is not None:
+            clauses.append("played_at >= ?")
+            params.append((datetime.now() - timedelta(days=days)).isoformat())
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+    
+    def get_score_distribution(self, difficulty: str, mode: Optional[str] = None,
+                               days: Optional[float] = None) -> List[Tuple[int, int]]:
+        """
+        점수별 판 수 (분위수/히스토그램 계산의 기반)
         
-    def reset_stats(self) -> None:
-        """모든 통계 초기화"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        점수 종류 수만큼의 행만 돌려주므로 판 수가 수백만이어도 결과가 작다.
         
-        cursor.execute("DELETE FROM global_stats")
-        cursor.execute("INSERT INTO global_stats (id) VALUES (1)")
-        cursor.execute("DELETE FROM difficulty_highscores")
-        cursor.execute("DELETE FROM mode_highscores")
-        cursor.execute("DELETE FROM survival_records")
+        Args:
+            difficulty: 난이도
+            mode: 게임 모드 (None이면 전체 모드)
+            days: 최근 며칠 동안의 기록만 (None이면 전체 기간)
+            
+        Returns:
+            점수 오름차순 (점수, 판 수) 목록
+        """
+        where, params = self._session_filter(difficulty, mode, days)
+        cursor = self._connection().execute(
+            "SELECT score, COUNT(*) FROM sessions" + where + " GROUP BY score ORDER BY score",
+            params)
+        return cursor.fetchall()
+    
+    def get_score_percentiles(self, difficulty: str, percentiles: Sequence[float] = (50, 95),
+                              mode: Optional[str] = None,
+                              days: Optional[float] = None) -> Dict[float, Optional[int]]:
+        """
+        점수 분위수 (nearest-rank 방식)
         
-        conn.commit()
-        conn.close()
+        Args:
+            difficulty: 난이도
+            percentiles: 구할 분위 (0 ~ 100)
+            mode: 게임 모드 (None이면 전체 모드)
+            days: 최근 며칠 동안의 기록만 (None이면 전체 기간)
+            
+        Returns:
+            {분위: 점수} (기록이 없으면 점수는 None)
+        """
+        distribution = self.get_score_distribution(difficulty, mode, days)
+        total = sum(count for _, count in distribution)
+        result: Dict[float, Optional[int]] = {}
+        for percentile in percentiles:
+            if total == 0:
+                result[percentile] = None
+                continue
+            rank = max(1, math.ceil(percentile / 100 * total))
+            seen = 0
+            for score, count in distribution:
+                seen += count
+                if seen >= rank:
+                    result[percentile] = score
+                    break
+        return result
+    
+    def get_score_histogram(self, difficulty: str, bin_size: int = 10,
+                            mode: Optional[str] = None,
+                            days: Optional[float] = None) -> List[Tuple[int, int]]:
+        """
+        점수 히스토그램
+        
+        Args:
+            difficulty: 난이도
+            bin_size: 구간 크기 (점수)
+            mode: 게임 모드 (None이면 전체 모드)
+            days: 최근 며칠 동안의 기록만 (None이면 전체 기간)
+            
+        Returns:
+            (구간 시작 점수, 판 수) 목록 (판이 있는 구간만, 오름차순)
+        """
+        bins: Dict[int, int] = {}
+        for score, count in self.get_score_distribution(difficulty, mode, days):
+            start = score // bin_size * bin_size
+            bins[start] = bins.get(start, 0) + count
+        return sorted(bins.items())
+    
+    def get_daily_trend(self, days: float = 30, difficulty: Optional[str] = None,
+                        mode: Optional[str] = None) -> List[Dict]:
+        """
+        최근 기간의 일별 판 수/평균/최고 점수
+        
+        Args:
+            days: 최근 며칠
+            difficulty: 난이도 (None이면 전체)
+            mode: 게임 모드 (None이면 전체)
+            
+        Returns:
+            날짜 오름차순 [{'date', 'games', 'average_score', 'max_score'}] 목록
+        """
+        where, params = self._session_filter(difficulty, mode, days)
+        cursor = self._connection().execute("""
+            SELECT substr(played_at, 1, 10) AS day, COUNT(*), AVG(score), MAX(score)
+            FROM sessions""" + where + """
+            GROUP BY day ORDER BY day
+        """, params)
+        return [{'date': day, 'games': games, 'average_score': average, 'max_score': best}
+                for day, games, average, best in cursor]
+        
+    def reset_stats(self) -> None:
+        """모든 통계 초기화"""
+        with self._connection() as conn:
+            conn.execute("DELETE FROM global_stats")
+            conn.execute("INSERT INTO global_stats (id) VALUES (1)")
+            conn.execute("DELETE FROM difficulty_highscores")
+            conn.execute("DELETE FROM mode_highscores")
+            conn.execute("DELETE FROM survival_records")
+            conn.execute("DELETE FROM sessions")
+
+
+class StatsWriter:
+    """
+    StatsManager의 비동기 앞단 (게임/렌더 루프를 막지 않는 통계 기록)
+
+    submit()은 기록을 크기가 제한된 큐에 넣고 바로 반환한다 (가득 차면
+    버리고 dropped 카운터 증가). 쓰기 스레드 하나가 큐에 쌓인 기록을
+    최대 batch_size개씩 record_sessions()로 묶어 트랜잭션 하나로 쓰고,
+    close()는 남은 기록을 timeout 안에서 모두 쓴 뒤 종료한다.
+    """
+
+    def __init__(self, stats_manager: StatsManager, queue_size: int = STATS_QUEUE_SIZE,
+                 batch_size: int = STATS_BATCH_SIZE):
+        """
+        쓰기 스레드 시작
+
+        Args:
+            stats_manager: 실제로 기록할 StatsManager
+            queue_size: 대기 큐 크기
+            batch_size: 트랜잭션당 최대 기록 수
+        """
+        self.stats_manager = stats_manager
+        self.batch_size = batch_size
+        self._queue: queue.Queue = queue.Queue(queue_size)
+        self._counters_lock = threading.Lock()
+        self._counters = {
+            'submitted': 0,
+            'written': 0,
+            'dropped': 0,
+            'errors': 0,
+            'batches': 0,
+            'last_batch_size': 0,
+            'max_batch_size': 0,
+            'max_queue_depth': 0,
+            'last_write_ms': 0.0,
+            'max_write_ms': 0.0,
+            'total_write_ms': 0.0,
+        }
+        self.last_error: Optional[Exception] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._write_loop, name='stats-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, playtime: float, food_eaten: int, score: int, difficulty: str,
+               mode: Optional[str] = None, golden_apples: int = 0, powerups_collected: int = 0,
+               survival_time: Optional[float] = None) -> bool:
+        """
+        한 판의 기록을 쓰기 대기열에 추가 (인자는 StatsManager.record_session()과 같음)
+
+        Returns:
+            대기열에 넣었으면 True, 닫혔거나 가득 차서 버렸으면 False
+        """
+        session = {
+            'achieved_at': datetime.now().isoformat(),  # 쓰기 시점이 아닌 판이 끝난 시각
+            'playtime': playtime, 'food_eaten': food_eaten, 'score': score,
+            'difficulty': difficulty, 'mode': mode, 'golden_apples': golden_apples,
+            'powerups_collected': powerups_collected, 'survival_time': survival_time,
+        }
+        with self._counters_lock:
+            try:
+                if self._closed:
+                    raise queue.Full
+                self._queue.put_nowait(session)
+            except queue.Full:
+                self._counters['dropped'] += 1
+                return False
+            self._counters['submitted'] += 1
+            self._counters['max_queue_depth'] = max(self._counters['max_queue_depth'],
+                                                    self._queue.qsize())
+        return True
+
+    def _write_loop(self) -> None:
+        """쓰기 스레드: 대기 중인 기록을 배치로 묶어 저장 (None을 받으면 종료)"""
+        while True:
+            item = self._queue.get()
+            stop = item is None
+            batch = [] if stop else [item]
+            # 이미 쌓여 있는 기록을 기다리지 않고 최대 batch_size개까지 묶음
+            while not stop and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                else:
+                    batch.append(item)
+            if batch:
+                self._write_batch(batch)
+            if stop:
+                break
+
+    def _write_batch(self, batch: List[Dict]) -> None:
+        """
+        배치 하나를 트랜잭션 하나로 쓰고 카운터 갱신
+
+        배치 트랜잭션이 실패하면 (롤백되므로) 기록마다 따로 다시 써서 문제가
+        된 기록만 버린다 (errors 증가, last_error에 예외 보관).
+        """
+        started = time.perf_counter()
+        try:
+            self.stats_manager.record_sessions(batch)
+            written = len(batch)
+        except Exception as error:  # 잘못된 기록 하나로 쓰기 스레드가 죽지 않도록
+            written = 0
+            failed = [error] if len(batch) == 1 else []
+            if len(batch) > 1:
+                for session in batch:
+                    try:
+                        self.stats_manager.record_sessions([session])
+                        written += 1
+                    except Exception as session_error:
+                        failed.append(session_error)
+            if failed:
+                self.last_error = failed[-1]
+            with self._counters_lock:
+                self._counters['errors'] += len(failed)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._counters_lock:
+            counters = self._counters
+            counters['written'] += written
+            counters['batches'] += 1
+            counters['last_batch_size'] = len(batch)
+            counters['max_batch_size'] = max(counters['max_batch_size'], len(batch))
+            counters['last_write_ms'] = elapsed_ms
+            counters['max_write_ms'] = max(counters['max_write_ms'], elapsed_ms)
+            counters['total_write_ms'] += elapsed_ms
+
+    def get_counters(self) -> Dict[str, float]:
+        """
+        모니터링용 카운터
+
+        Returns:
+            queue_depth(현재 대기 수), submitted, written, dropped, errors, batches,
+            last/max_batch_size, max_queue_depth, last/max/avg_write_ms
+        """
+        with self._counters_lock:
+            counters = dict(self._counters)
+        counters['queue_depth'] = self._queue.qsize()
+        batches = counters['batches']
+        counters['avg_write_ms'] = counters['total_write_ms'] / batches if batches else 0.0
+        return counters
+
+    def close(self, timeout: float = STATS_DRAIN_TIMEOUT) -> bool:
+        """
+        새 기록을 받지 않고 남은 기록을 모두 쓴 뒤 쓰기 스레드 종료
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            timeout 안에 모두 썼으면 True
+        """
+        deadline = time.monotonic() + timeout
+        with self._counters_lock:
+            closing = not self._closed
+            self._closed = True
+        if closing:
+            # 남은 기록 뒤에 종료 표시 (큐가 가득 차 있으면 자리가 날 때까지만 대기)
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                return False
+        self._thread.join(max(0.0, deadline - time.monotonic()))
+        return not self._thread.is_alive()
@@ -3,6 +3,7 @@ from modes.base_mode import BaseMode
 from typing import Tuple, Optional
 import pygame
 from constants import WHITE, YELLOW
+from ui.text_cache import get_font, text_cache
 
 
 class ClassicMode(BaseMode):
@@ -55,7 +56,7 @@ class ClassicMode(BaseMode):
             return True, "Wall Collision!"
             
         # 자기 몸 충돌
-        if head in game.snake.body[1:]:
+        if game.snake.check_self_collision():
             return True, "Self Collision!"
             
         # 장애물 충돌
@@ -75,13 +76,13 @@ class ClassicMode(BaseMode):
             game: 게임 인스턴스
         """
         # 기본 정보만 표시
-        font = pygame.font.Font(None, 24)
+        font = get_font(24)
         
         # 점수
-        score_text = font.render(f"Score: {game.score}", True, WHITE)
+        score_text = text_cache.render(font, f"Score: {game.score}", WHITE)
         surface.blit(score_text, (10, 10))
         
         # 최고 점수
         if hasattr(game, 'high_score'):
-            high_score_text = font.render(f"High: {game.high_score}", True, YELLOW)
+            high_score_text = text_cache.render(font, f"High: {game.high_score}", YELLOW)
             surface.blit(high_score_text, (200, 10))
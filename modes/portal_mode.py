@@ -3,6 +3,7 @@ from modes.base_mode import BaseMode
 from typing import Tuple, Optional
 import pygame
 from constants import WHITE, YELLOW
+from ui.text_cache import get_font, text_cache
 
 
 class PortalMode(BaseMode):
@@ -42,7 +43,7 @@ class PortalMode(BaseMode):
         new_y = head_y % GRID_HEIGHT
         
         if (new_x, new_y) != (head_x, head_y):
-            game.snake.body[0] = (new_x, new_y)
+            game.snake.set_head((new_x, new_y))
         
     def check_game_over(self, game) -> Tuple[bool, Optional[str]]:
         """
@@ -59,7 +60,7 @@ class PortalMode(BaseMode):
         # 벽 충돌 없음 (포탈 모드)
         
         # 자기 몸 충돌
-        if head in game.snake.body[1:]:
+        if game.snake.check_self_collision():
             return True, "Self Collision!"
             
         # 장애물 충돌
@@ -78,19 +79,19 @@ class PortalMode(BaseMode):
             surface: 그릴 화면
             game: 게임 인스턴스
         """
-        font = pygame.font.Font(None, 24)
+        font = get_font(24)
         
         # 점수
-        score_text = font.render(f"Score: {game.score}", True, WHITE)
+        score_text = text_cache.render(font, f"Score: {game.score}", WHITE)
         surface.blit(score_text, (10, 10))
         
         # 최고 점수
         if hasattr(game, 'high_score'):
-            high_score_text = font.render(f"High: {game.high_score}", True, YELLOW)
+            high_score_text = text_cache.render(font, f"High: {game.high_score}", YELLOW)
             surface.blit(high_score_text, (200, 10))
             
         # 모드 표시
-        mode_text = font.render("Portal Mode", True, (100, 200, 255))
+        mode_text = text_cache.render(font, "Portal Mode", (100, 200, 255))
         surface.blit(mode_text, (450, 10))
         
     def get_score_multiplier(self) -> float:
@@ -7,6 +7,7 @@ from constants import (
     WHITE, YELLOW, RED, SURVIVAL_OBSTACLE_INTERVAL,
     SURVIVAL_MAX_OBSTACLES
 )
+from ui.text_cache import get_font, text_cache
 
 
 class SurvivalMode(BaseMode):
@@ -56,17 +57,32 @@ class SurvivalMode(BaseMode):
                 self._add_obstacle(game)
                 self.last_obstacle_time = current_time
                 
-    def _add_obstacle(self, game) -> None:
+    def _add_obstacle(self, game) -> bool:
         """
         새로운 장애물 추가
         
         Args:
             game: 게임 인스턴스
+            
+        Returns:
+            추가 성공 여부 (보드가 가득 차면 False)
         """
         import random
         from constants import GRID_WIDTH, GRID_HEIGHT
         from core.obstacle import Obstacle
         
+        # 게임별 난수 생성기 (없으면 random 모듈)
+        rng = getattr(game, 'rng', None) or random
+        
+        # 빈 칸 인덱스가 있으면 O(1) 샘플링
+        free_cells = getattr(game, 'free_cells', None)
+        if free_cells is not None:
+            pos = free_cells.sample(rng)
+            if pos is not None:
+                game.obstacles.append(Obstacle(pos))
+                free_cells.occupy(pos)
+            return pos is not None
+        
         # 빈 위치 찾기
         occupied = set(game.snake.body)
         occupied.add(game.food.position)
@@ -79,15 +95,19 @@ class SurvivalMode(BaseMode):
         if hasattr(game, 'powerup_manager') and game.powerup_manager.spawn_position:
             occupied.add(game.powerup_manager.spawn_position)
             
-        available = []
-        for x in range(GRID_WIDTH):
-            for y in range(GRID_HEIGHT):
-                if (x, y) not in occupied:
-                    available.append((x, y))
+        available = [
+            (x, y)
+            for x in range(GRID_WIDTH)
+            for y in range(GRID_HEIGHT)
+            if (x, y) not in occupied
+        ]
                     
-        if available:
-            pos = random.choice(available)
-            game.obstacles.append(Obstacle(pos))
+        if not available:
+            return False
+            
+        pos = rng.choice(available)
+        game.obstacles.append(Obstacle(pos))
+        return True
             
     def check_game_over(self, game) -> Tuple[bool, Optional[str]]:
         """
@@ -108,7 +128,7 @@ class SurvivalMode(BaseMode):
             return True, "Wall Collision!"
             
         # 자기 몸 충돌
-        if head in game.snake.body[1:]:
+        if game.snake.check_self_collision():
             return True, "Self Collision!"
             
         # 장애물 충돌
@@ -127,25 +147,25 @@ class SurvivalMode(BaseMode):
             surface: 그릴 화면
             game: 게임 인스턴스
         """
-        font = pygame.font.Font(None, 24)
-        large_font = pygame.font.Font(None, 36)
+        font = get_font(24)
+        large_font = get_font(36)
         
         # 생존 시간
         if self.start_time is not None:
             survival_time = time.time() - self.start_time
-            time_text = large_font.render(f"Time: {int(survival_time)}s", True, YELLOW)
+            time_text = text_cache.render(large_font, f"Time: {int(survival_time)}s", YELLOW)
             surface.blit(time_text, (10, 5))
             
         # 장애물 수
         if hasattr(game, 'obstacles'):
             obstacle_count = len(game.obstacles)
             color = RED if obstacle_count >= self.max_obstacles * 0.8 else WHITE
-            obstacles_text = font.render(f"Obstacles: {obstacle_count}/{self.max_obstacles}", 
-                                        True, color)
+            obstacles_text = text_cache.render(font, f"Obstacles: {obstacle_count}/{self.max_obstacles}",
+                                               color)
             surface.blit(obstacles_text, (250, 10))
             
         # 점수
-        score_text = font.render(f"Score: {game.score}", True, WHITE)
+        score_text = text_cache.render(font, f"Score: {game.score}", WHITE)
         surface.blit(score_text, (480, 10))
         
     def get_survival_time(self) -> float:
@@ -7,6 +7,7 @@ from constants import (
     WHITE, RED, YELLOW, TIME_ATTACK_DURATION, 
     TIME_ATTACK_BONUS_TIME
 )
+from ui.text_cache import get_font, text_cache
 
 
 class TimeAttackMode(BaseMode):
@@ -63,7 +64,7 @@ class TimeAttackMode(BaseMode):
             return True, "Wall Collision!"
             
         # 자기 몸 충돌
-        if head in game.snake.body[1:]:
+        if game.snake.check_self_collision():
             return True, "Self Collision!"
             
         # 장애물 충돌
@@ -88,11 +89,11 @@ class TimeAttackMode(BaseMode):
             surface: 그릴 화면
             game: 게임 인스턴스
         """
-        font = pygame.font.Font(None, 24)
-        large_font = pygame.font.Font(None, 36)
+        font = get_font(24)
+        large_font = get_font(36)
         
         # 점수
-        score_text = font.render(f"Score: {game.score}", True, WHITE)
+        score_text = text_cache.render(font, f"Score: {game.score}", WHITE)
         surface.blit(score_text, (10, 10))
         
         # 남은 시간
@@ -110,12 +111,12 @@ class TimeAttackMode(BaseMode):
                 else:
                     color = WHITE
                     
-            time_text = large_font.render(f"Time: {int(remaining)}s", True, color)
+            time_text = text_cache.render(large_font, f"Time: {int(remaining)}s", color)
             surface.blit(time_text, (200, 5))
             
         # 시간 보너스 획득 횟수
         if self.time_bonus_collected > 0:
-            bonus_text = font.render(f"Time Bonuses: {self.time_bonus_collected}", True, YELLOW)
+            bonus_text = text_cache.render(font, f"Time Bonuses: {self.time_bonus_collected}", YELLOW)
             surface.blit(bonus_text, (450, 10))
             
     def add_time_bonus(self) -> None:
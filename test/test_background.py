@@ -0,0 +1,49 @@
+"""배경 캐시 테스트"""
+import pygame
+from ui.background import BackgroundCache
+from constants import *
+
+
+def test_background_cached_until_obstacles_change():
+    """장애물이 같으면 같은 Surface를 재사용"""
+    cache = BackgroundCache()
+    first = cache.get([(1, 1)])
+    assert cache.get([(1, 1)]) is first
+
+    second = cache.get([(1, 1), (2, 2)])
+    assert second is not first
+    assert second.get_at((2 * GRID_SIZE + 5, 2 * GRID_SIZE + 5))[:3] == GRAY
+
+
+def test_background_draws_grid():
+    """그리드 라인과 빈 칸"""
+    surface = BackgroundCache().get()
+    assert surface.get_at((GRID_SIZE, 5))[:3] == GRID_COLOR
+    assert surface.get_at((5, 5))[:3] == BLACK
+
+
+def test_resize_invalidates():
+    """크기가 바뀌면 다시 그림"""
+    cache = BackgroundCache((200, 200))
+    first = cache.get()
+    cache.resize((400, 200))
+    resized = cache.get()
+    assert resized is not first
+    assert resized.get_size() == (400, 200)
+
+
+def test_portal_border_frames():
+    """Portal 테두리는 가장자리에만 그려지고 프레임은 재사용됨"""
+    cache = BackgroundCache()
+    surface = pygame.Surface((600, 600))
+    surface.fill(BLACK)
+    cache.draw_portal_border(surface, 0)
+    assert surface.get_at((0, 0))[:3] == (0, 255, 200)
+    assert surface.get_at((300, 300))[:3] == BLACK
+    # 대시 사이 간격은 투명
+    assert surface.get_at((20, 0))[:3] == BLACK
+
+    frames = cache._portal_frames
+    cache.draw_portal_border(surface, 500)
+    assert cache._portal_frames is frames
+    assert surface.get_at((0, 0))[:3] == (0, 153, 120)
@@ -0,0 +1,164 @@
+"""BatchGameState (NumPy 배치 시뮬레이터) 테스트"""
+import numpy as np
+import pytest
+from core.batch_engine import (
+    BatchGameState, DIRECTIONS, ACTION_NONE, ACTION_UP, ACTION_LEFT, ACTION_RIGHT,
+    BATCH_EVENT_NONE, BATCH_EVENT_EAT, BATCH_EVENT_GAME_OVER,
+    REASON_WALL, REASON_SELF
+)
+from core.game_state import GameState, EVENT_NONE, EVENT_EAT, EVENT_GAME_OVER
+from core.obstacle import Obstacle
+from managers.score_manager import ScoreManager
+from constants import GRID_WIDTH, GRID_HEIGHT
+
+EVENT_CODES = {EVENT_NONE: BATCH_EVENT_NONE, EVENT_EAT: BATCH_EVENT_EAT,
+               EVENT_GAME_OVER: BATCH_EVENT_GAME_OVER}
+
+
+def _sync_food(state, batch, game):
+    """배치 게임의 먹이를 스칼라 게임에 복사"""
+    state.food.position = batch.get_food(game)
+    state.food.is_golden = bool(batch.food_golden[game])
+
+
+def _make_scalar_games(batch, tmp_path):
+    """배치와 같은 초기 상태의 GameState 목록 생성"""
+    states = []
+    for game in range(batch.num_games):
+        score_manager = ScoreManager(str(tmp_path / f"hs_{game}.json"))
+        state = GameState(batch.difficulty, batch.portal_mode, score_manager)
+        obstacles = batch.get_obstacle_positions(game)
+        if obstacles:
+            state.obstacle = Obstacle(0, [], None)
+            for position in obstacles:
+                state.obstacle.add(position)
+        else:
+            state.obstacle = None
+        _sync_food(state, batch, game)
+        states.append(state)
+    return states
+
+
+def _random_action_stream(num_games, num_steps, seed):
+    """무작위 입력 스트림 생성 (ACTION_NONE 포함)"""
+    rng = np.random.default_rng(seed)
+    return rng.integers(ACTION_NONE, 4, size=(num_steps, num_games))
+
+
+@pytest.mark.parametrize("difficulty,portal_mode", [
+    ('easy', False), ('normal', True), ('hard', False), ('hard', True),
+])
+def test_parity_with_scalar_engine(tmp_path, difficulty, portal_mode):
+    """같은 입력/먹이 위치에서 스칼라 GameState와 결과가 일치"""
+    num_games = 16
+    batch = BatchGameState(num_games, difficulty, portal_mode, seed=1234)
+    states = _make_scalar_games(batch, tmp_path)
+    actions = _random_action_stream(num_games, 60, seed=99)
+
+    for step_actions in actions:
+        events = batch.step(step_actions)
+        for game, state in enumerate(states):
+            action = DIRECTIONS[step_actions[game]] if step_actions[game] >= 0 else None
+            event = state.step(action)
+            assert EVENT_CODES[event] == events[game]
+            if event == EVENT_EAT:
+                _sync_food(state, batch, game)
+
+            assert state.game_over == batch.done[game]
+            assert state.score_manager.get_score() == batch.score[game]
+            assert state.score_manager.get_food_eaten() == batch.food_eaten[game]
+            assert state.current_fps == batch.current_fps[game]
+            if not state.game_over:
+                assert list(state.snake.body) == batch.get_body(game)
+
+
+def test_parity_with_forced_eating(tmp_path):
+    """먹이를 머리 앞에 두어 성장/콤보/속도 증가 규칙 비교"""
+    num_games = 4
+    batch = BatchGameState(num_games, 'normal', True, seed=7, golden_apple_probability=0.5)
+    states = _make_scalar_games(batch, tmp_path)
+
+    for _ in range(20):
+        for game, state in enumerate(states):
+            head_x, head_y = batch.get_head(game)
+            food = ((head_x + 1) % GRID_WIDTH, head_y)
+            batch.food_x[game], batch.food_y[game] = food
+            _sync_food(state, batch, game)
+        events = batch.step(np.full(num_games, ACTION_RIGHT))
+        for game, state in enumerate(states):
+            assert state.step(None) == EVENT_EAT
+            assert events[game] == BATCH_EVENT_EAT
+            assert state.score_manager.get_score() == batch.score[game]
+            assert state.current_fps == batch.current_fps[game]
+            assert list(state.snake.body) == batch.get_body(game)
+
+
+def test_initial_state():
+    """초기 상태는 Snake()와 같음"""
+    batch = BatchGameState(3, seed=0)
+    center = (GRID_WIDTH // 2, GRID_HEIGHT // 2)
+    for game in range(3):
+        assert batch.get_body(game) == [center, (center[0] - 1, center[1]), (center[0] - 2, center[1])]
+        assert batch.get_food(game) not in batch.get_body(game)
+    assert not batch.done.any()
+
+
+def test_wall_collision_and_reverse_input():
+    """벽 충돌 원인 기록 및 반대 방향 입력 무시"""
+    batch = BatchGameState(2, 'easy', False, seed=0)
+    batch.food_x[:] = 0
+    batch.food_y[:] = 0
+
+    # 게임 0: 오른쪽 벽까지 직진
+    for _ in range(GRID_WIDTH):
+        batch.step(np.array([ACTION_NONE, ACTION_NONE]))
+    assert batch.done[0]
+    assert batch.reason[0] == REASON_WALL
+
+    # 게임 1: 반대 방향 입력은 무시되어 자기 충돌 없음
+    batch.reset([1])
+    batch.food_x[1] = 0
+    batch.food_y[1] = 0
+    batch.step(np.array([ACTION_NONE, ACTION_LEFT]))
+    assert not batch.done[1]
+    assert batch.get_head(1) == (GRID_WIDTH // 2 + 1, GRID_HEIGHT // 2)
+
+
+def test_self_collision_reason():
+    """몸통으로 들어가면 자기 충돌"""
+    batch = BatchGameState(1, 'easy', False, seed=0, width=10, height=10)
+    batch.food_x[0] = 9
+    batch.food_y[0] = 9
+    # 길이를 늘린 뒤 제자리 회전
+    batch.growing[0] = True
+    batch.step([ACTION_NONE])
+    batch.growing[0] = True
+    batch.step([ACTION_NONE])
+    batch.step([ACTION_UP])
+    batch.step([ACTION_LEFT])
+    events = batch.step([1])  # DOWN
+    assert events[0] == BATCH_EVENT_GAME_OVER
+    assert batch.reason[0] == REASON_SELF
+
+
+def test_reset_subset():
+    """일부 게임만 초기화"""
+    batch = BatchGameState(3, seed=0)
+    batch.score[:] = 100
+    batch.done[:] = True
+    batch.reset([1])
+    assert batch.score[1] == 0 and not batch.done[1]
+    assert batch.score[0] == 100 and batch.done[0]
+
+
+def test_seed_reproducible():
+    """같은 시드와 입력이면 같은 결과"""
+    actions = _random_action_stream(8, 50, seed=3)
+    results = []
+    for _ in range(2):
+        batch = BatchGameState(8, 'hard', False, seed=42)
+        for step_actions in actions:
+            batch.step(step_actions)
+        results.append((batch.score.copy(), batch.food_x.copy(), batch.done.copy()))
+    for a, b in zip(*results):
+        np.testing.assert_array_equal(a, b)
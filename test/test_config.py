@@ -2,7 +2,7 @@
 import pytest
 import os
 import json
-from config import ConfigManager
+from config import ConfigManager, flush_all_configs
 
 
 class TestConfigManager:
@@ -15,7 +15,8 @@ class TestConfigManager:
     
     def teardown_method(self):
         """각 테스트 후에 실행"""
-        # 테스트 파일 삭제
+        # 기록 대기 중인 변경을 먼저 기록한 뒤 테스트 파일 삭제
+        flush_all_configs()
         if os.path.exists(self.test_config_file):
             os.remove(self.test_config_file)
     
@@ -83,3 +84,57 @@ class TestConfigManager:
         # 기본값으로 로드되어야 함
         config_manager = ConfigManager(self.test_config_file)
         assert config_manager.get('difficulty') == 'normal'
+
+
+class TestConfigPersistence:
+    def test_set_is_debounced(self, tmp_path):
+        """연속 변경은 메모리에만 반영되고 한 번에 기록됨"""
+        path = str(tmp_path / 'config.json')
+        config_manager = ConfigManager(path, save_delay=60.0)
+        writes = []
+        save_config = config_manager.save_config
+        config_manager.save_config = lambda: (writes.append(1), save_config())
+        
+        for _ in range(5):
+            config_manager.toggle_portal_mode()
+        config_manager.set('sound_enabled', False)
+        assert not os.path.exists(path)
+        assert config_manager.is_dirty()
+        
+        config_manager.flush()
+        assert len(writes) == 1
+        assert not config_manager.is_dirty()
+        with open(path) as f:
+            assert json.load(f)['portal_mode'] == True
+    
+    def test_debounce_timer_flushes(self, tmp_path):
+        """마지막 변경 후 지연 시간이 지나면 백그라운드에서 기록"""
+        import time
+        path = str(tmp_path / 'config.json')
+        config_manager = ConfigManager(path, save_delay=0.05)
+        config_manager.set_difficulty('hard')
+        
+        deadline = time.time() + 5
+        while config_manager.is_dirty() and time.time() < deadline:
+            time.sleep(0.01)
+        with open(path) as f:
+            assert json.load(f)['difficulty'] == 'hard'
+        assert os.listdir(tmp_path) == ['config.json']  # 임시 파일이 남지 않음
+    
+    def test_external_edit_reloaded(self, tmp_path):
+        """외부 수정은 다시 읽고, 기록 대기 중인 키는 메모리 값 유지"""
+        path = tmp_path / 'config.json'
+        config_manager = ConfigManager(str(path), save_delay=60.0)
+        config_manager.set('sound_enabled', False)
+        config_manager.flush()
+        assert config_manager.check_external_changes(force=True) == []
+        
+        config_manager.set('portal_mode', True)
+        path.write_text(json.dumps({'difficulty': 'easy', 'portal_mode': False,
+                                    'sound_enabled': True, 'music_enabled': True}))
+        os.utime(path, ns=(0, 0))  # mtime 해상도와 상관없이 변경 감지
+        
+        changed = config_manager.check_external_changes(force=True)
+        assert sorted(changed) == ['difficulty', 'sound_enabled']
+        assert config_manager.get('portal_mode') == True
+        assert config_manager.is_dirty()
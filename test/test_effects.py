@@ -124,3 +124,59 @@ def test_animation_fade_out():
     assert alpha1 == 1.0
     assert 0.0 < alpha2 < 1.0
     assert alpha3 == 0.0
+
+
+def test_particle_system_matches_particle_physics():
+    """배열 갱신이 Particle.update와 같은 결과인지 테스트"""
+    system = ParticleSystem()
+    system.create_explosion((10, 10), (255, 0, 0), count=3)
+    reference = system.particles
+
+    for _ in range(10):
+        system.update()
+        for particle in reference:
+            particle.update()
+
+    for particle, expected in zip(system.particles, reference):
+        assert particle.x == pytest.approx(expected.x, abs=1e-3)
+        assert particle.y == pytest.approx(expected.y, abs=1e-3)
+        assert particle.lifetime == expected.lifetime
+
+
+def test_particle_system_capacity():
+    """풀 용량을 넘는 파티클은 생성되지 않는지 테스트"""
+    system = ParticleSystem(capacity=8)
+    system.create_explosion((1, 1), (255, 0, 0), count=5)
+    system.create_explosion((1, 1), (255, 0, 0), count=5)
+
+    assert system.get_particle_count() == 8
+
+
+def test_particle_system_deterministic():
+    """같은 시드의 rng면 같은 파티클이 생성되는지 테스트"""
+    import random
+    first = ParticleSystem(rng=random.Random(3))
+    second = ParticleSystem(rng=random.Random(3))
+    for system in (first, second):
+        system.create_explosion((4, 4), (0, 255, 0), count=20)
+        system.create_sparkle((4, 4), (255, 215, 0))
+
+    assert (first.position == second.position).all()
+    assert (first.color == second.color).all()
+
+
+def test_particle_system_draw_uses_disc_cache():
+    """그리기가 원 이미지 캐시를 재사용하는지 테스트"""
+    import pygame
+    from ui.effects import _disc_cache
+    surface = pygame.Surface((600, 600))
+    system = ParticleSystem()
+    system.create_glow((5, 5), (0, 255, 0), count=50)
+    system.create_explosion((59, 59), (255, 0, 0), count=50)  # 일부는 화면 밖으로
+
+    system.draw(surface)
+    cached = len(_disc_cache)
+    system.draw(surface)
+
+    assert len(_disc_cache) == cached
+    assert surface.get_at((5 * 20 + 10, 5 * 20 + 10)) != (0, 0, 0, 255)
@@ -0,0 +1,155 @@
+"""강화학습 환경 (SnakeEnv, SnakeVectorEnv) 테스트"""
+import numpy as np
+import pytest
+from core.env import (
+    SnakeEnv, SnakeVectorEnv, RewardConfig, OBS_GRID, OBS_FEATURES, OBS_RGB,
+    NUM_FEATURES, GRID_CHANNELS
+)
+from core.batch_engine import ACTION_UP, ACTION_RIGHT
+from constants import GRID_WIDTH, GRID_HEIGHT
+
+
+@pytest.mark.parametrize("obs_type", [OBS_FEATURES, OBS_GRID, OBS_RGB])
+def test_reset_observation_shape(obs_type):
+    """reset은 observation_shape 모양의 관찰을 반환"""
+    env = SnakeEnv(obs_type=obs_type, rgb_cell_size=2)
+    obs, info = env.reset(seed=0)
+    assert obs.shape == env.observation_shape
+    assert info['score'] == 0
+    assert info['length'] == 3
+
+
+def test_invalid_obs_type():
+    """알 수 없는 관찰 종류는 ValueError"""
+    with pytest.raises(ValueError):
+        SnakeEnv(obs_type='pixels')
+
+
+def test_features_direction_and_food():
+    """특징 벡터: 방향 one-hot과 먹이 방향"""
+    env = SnakeEnv()
+    env.reset(seed=0)
+    head_x, head_y = env.state.snake.get_head()
+    env.state.food.position = (head_x + 5, head_y - 3)
+    obs = env._observe()
+    assert obs[3 + ACTION_RIGHT] == 1.0
+    assert obs[8] == 1.0 and obs[9] == 1.0
+    assert obs[7] == 0.0 and obs[10] == 0.0
+
+
+def test_features_wall_danger():
+    """벽 앞에서는 직진 위험"""
+    env = SnakeEnv()
+    env.reset(seed=0)
+    env.state.snake.body = [(GRID_WIDTH - 1, 5), (GRID_WIDTH - 2, 5), (GRID_WIDTH - 3, 5)]
+    obs = env._observe()
+    assert obs[0] == 1.0  # 직진 (오른쪽 벽)
+    assert obs[1] == 0.0 and obs[2] == 0.0
+
+
+def test_grid_observation_channels():
+    """그리드 관찰: 몸통/머리/먹이 채널"""
+    env = SnakeEnv(obs_type=OBS_GRID)
+    obs, _ = env.reset(seed=0)
+    head_x, head_y = env.state.snake.get_head()
+    food_x, food_y = env.state.food.get_position()
+    assert obs[0].sum() == 3
+    assert obs[1, head_y, head_x] == 1.0
+    assert obs[2, food_y, food_x] == 1.0
+
+
+def test_reward_for_food_and_death():
+    """먹이 보상과 게임 오버 패널티"""
+    env = SnakeEnv(reward_config=RewardConfig(death_penalty=-2.0))
+    env.reset(seed=0)
+    head_x, head_y = env.state.snake.get_head()
+    env.state.food.position = (head_x + 1, head_y)
+    env.state.food.is_golden = False
+    _, reward, terminated, truncated, _ = env.step(ACTION_RIGHT)
+    assert reward == pytest.approx(1.0)
+    assert not terminated and not truncated
+
+    env.state.snake.body = [(GRID_WIDTH - 1, 5), (GRID_WIDTH - 2, 5), (GRID_WIDTH - 3, 5)]
+    _, reward, terminated, _, info = env.step(ACTION_RIGHT)
+    assert terminated
+    assert reward == pytest.approx(-2.0)
+    assert info['game_over_reason'] == 'wall'
+
+
+def test_truncation():
+    """max_steps 초과 시 truncated"""
+    env = SnakeEnv(portal_mode=True, max_steps=3)
+    env.reset(seed=0)
+    env.state.food.position = (0, 0)
+    results = [env.step(None) for _ in range(3)]
+    assert [r[3] for r in results] == [False, False, True]
+
+
+@pytest.mark.parametrize("obs_type", [OBS_FEATURES, OBS_GRID])
+def test_vector_env_buffers_reused(obs_type):
+    """벡터 환경은 같은 출력 버퍼를 재사용"""
+    env = SnakeVectorEnv(8, obs_type=obs_type, seed=0)
+    obs, _ = env.reset()
+    expected = (8, NUM_FEATURES) if obs_type == OBS_FEATURES else (8, GRID_CHANNELS, GRID_HEIGHT, GRID_WIDTH)
+    assert obs.shape == expected
+
+    obs2, rewards, terminated, truncated, _ = env.step(np.full(8, ACTION_UP))
+    obs3, rewards2, terminated2, _, _ = env.step(np.full(8, ACTION_UP))
+    assert obs2 is obs3
+    assert rewards is rewards2
+    assert terminated is terminated2
+
+
+
+@pytest.mark.parametrize("obs_type", [OBS_FEATURES, OBS_GRID])
+def test_vector_env_step_does_not_allocate(obs_type):
+    """보통 틱(초기화 없음)은 게임 수에 비례하는 임시 배열을 만들지 않음"""
+    import tracemalloc
+    num_envs = 8192
+    env = SnakeVectorEnv(num_envs, difficulty='easy', portal_mode=True, obs_type=obs_type,
+                         seed=0, max_steps=10 ** 9)
+    env.reset()
+    actions = np.full(num_envs, -1, dtype=np.int8)
+    env.step(actions)
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(10):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            env.step(actions)
+            peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+    # 가장 작은 게임별 배열(bool)도 num_envs 바이트 (먹기 처리의 작은 인덱스 배열만 허용)
+    assert sorted(peaks)[len(peaks) // 2] < num_envs
+
+def test_vector_env_matches_single_features():
+    """벡터 환경의 특징 벡터는 단일 환경 계산과 일치"""
+    env = SnakeVectorEnv(4, seed=1)
+    obs, _ = env.reset()
+    batch = env.batch
+    for game in range(4):
+        single = SnakeEnv()
+        single.reset()
+        single.state.snake.body = batch.get_body(game)
+        single.state.food.position = batch.get_food(game)
+        np.testing.assert_array_equal(single._observe(), obs[game])
+
+
+def test_vector_env_auto_reset():
+    """종료된 환경은 자동 초기화되고 패널티를 받음"""
+    env = SnakeVectorEnv(2, seed=0)
+    env.reset()
+    env.batch.food_x[:] = 0
+    env.batch.food_y[:] = 0
+    terminated_seen = False
+    for _ in range(GRID_WIDTH):
+        _, rewards, terminated, _, _ = env.step(np.full(2, ACTION_RIGHT))
+        if terminated.any():
+            terminated_seen = True
+            assert rewards[terminated].max() == pytest.approx(-1.0)
+            assert not env.batch.done.any()
+            break
+    assert terminated_seen
@@ -2,7 +2,7 @@
 import pytest
 import time
 
-from food import Food
+from core.food import Food
 from constants import *
 
 
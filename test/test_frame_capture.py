@@ -0,0 +1,88 @@
+"""오프스크린 프레임 캡처 테스트"""
+import os
+import pygame
+import pytest
+from ui.frame_capture import FrameCapture, PNG_NAME_FORMAT
+
+
+def _surface(color, size=(8, 6)):
+    pygame.init()
+    surface = pygame.Surface(size)
+    surface.fill(color)
+    return surface
+
+
+def test_raw_rgb_stream(tmp_path):
+    """raw RGB 파일은 프레임마다 높이 x 너비 x 3 바이트 (행 우선)"""
+    path = str(tmp_path / 'clip.rgb')
+    surface = _surface((10, 20, 30))
+    surface.set_at((1, 0), (200, 0, 0))
+    with FrameCapture(path) as capture:
+        capture.capture(surface)
+        capture.capture(surface)
+
+    data = open(path, 'rb').read()
+    assert len(data) == 2 * 8 * 6 * 3
+    assert data[0:3] == bytes((10, 20, 30))
+    assert data[3:6] == bytes((200, 0, 0))  # (x=1, y=0)
+
+
+def test_y4m_stream(tmp_path):
+    """Y4M 파일은 헤더 + 프레임마다 FRAME 표시와 4:4:4 평면"""
+    path = str(tmp_path / 'clip.y4m')
+    with FrameCapture(path, fps=30) as capture:
+        for color in ((0, 0, 0), (255, 255, 255)):
+            capture.capture(_surface(color))
+
+    data = open(path, 'rb').read()
+    header, body = data.split(b'\n', 1)
+    assert header == b'YUV4MPEG2 W8 H6 F30:1 Ip A1:1 C444'
+    frame_size = len(b'FRAME\n') + 8 * 6 * 3
+    assert len(body) == 2 * frame_size
+    assert body[6] == 16  # 검은색 Y
+    assert body[frame_size + 6] == 235  # 흰색 Y
+
+
+def test_png_sequence(tmp_path):
+    """폴더 경로면 번호 붙은 PNG 파일로 저장"""
+    directory = str(tmp_path / 'frames')
+    with FrameCapture(directory) as capture:
+        for _ in range(3):
+            capture.capture(_surface((0, 255, 0)))
+
+    assert sorted(os.listdir(directory)) == [PNG_NAME_FORMAT.format(i) for i in range(3)]
+    image = pygame.image.load(os.path.join(directory, PNG_NAME_FORMAT.format(2)))
+    assert image.get_at((0, 0))[:3] == (0, 255, 0)
+
+
+def test_drop_frames_when_writer_behind(tmp_path):
+    """drop_frames면 버퍼가 모두 사용 중일 때 기다리지 않고 버림"""
+    import threading
+    release = threading.Event()
+    capture = FrameCapture(str(tmp_path / 'clip.rgb'), queue_size=2, drop_frames=True)
+    write = capture._sink.write
+    capture._sink.write = lambda frame: (release.wait(), write(frame))  # 디스크가 멈춘 상황
+    surface = _surface((1, 2, 3))
+    results = [capture.capture(surface) for _ in range(10)]
+    release.set()
+    capture.close()
+
+    assert results[:3] == [True, True, True]  # 버퍼 수 = queue_size + 1
+    assert capture.frames_dropped == 7
+    assert os.path.getsize(str(tmp_path / 'clip.rgb')) == 3 * 8 * 6 * 3
+
+
+def test_export_replay_offscreen(tmp_path):
+    """오프스크린 Game으로 리플레이를 영상 파일로 내보내기"""
+    from core.game import Game
+    from core.replay import Replay
+    from constants import WINDOW_WIDTH, WINDOW_HEIGHT, RIGHT
+
+    game = Game(sound_enabled=False, music_enabled=False, seed=1, offscreen=True)
+    replay = Replay('normal', False, seed=5, inputs=[(0, RIGHT)], length=6)
+    path = str(tmp_path / 'clip.rgb')
+    frames = game.export_replay(replay, path, fps=30, hold_seconds=0.1)
+
+    assert frames > 3
+    assert os.path.getsize(path) == frames * WINDOW_WIDTH * WINDOW_HEIGHT * 3
+    assert game.frame_capture is None
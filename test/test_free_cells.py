@@ -0,0 +1,141 @@
+"""FreeCellIndex (빈 칸 인덱스) 테스트"""
+import pytest
+from core.free_cells import FreeCellIndex
+from core.snake import Snake
+from core.food import Food
+from core.obstacle import Obstacle
+from core.powerup import PowerUpManager
+from constants import GRID_WIDTH, GRID_HEIGHT, RIGHT
+
+
+def test_initially_all_free():
+    """초기에는 모든 칸이 비어 있음"""
+    index = FreeCellIndex(4, 3)
+    assert len(index) == 12
+    assert sorted(index.free_cells()) == sorted((x, y) for x in range(4) for y in range(3))
+
+
+def test_occupy_and_release():
+    """점유/해제 시 빈 칸 개수 갱신 (겹친 점유는 개수로 관리)"""
+    index = FreeCellIndex(4, 3)
+    index.occupy((1, 1))
+    index.occupy((1, 1))
+    assert len(index) == 11
+    assert not index.is_free((1, 1))
+
+    index.release((1, 1))
+    assert not index.is_free((1, 1))
+    index.release((1, 1))
+    assert index.is_free((1, 1))
+    assert len(index) == 12
+
+
+def test_out_of_bounds_ignored():
+    """범위 밖 위치는 무시"""
+    index = FreeCellIndex(4, 3)
+    index.occupy((-1, 0))
+    index.occupy((4, 0))
+    index.release((0, 5))
+    assert len(index) == 12
+    assert not index.is_free((-1, 0))
+
+
+def test_sample_returns_free_cell():
+    """샘플은 항상 빈 칸"""
+    index = FreeCellIndex(3, 3)
+    for cell in [(0, 0), (1, 1), (2, 2), (0, 1)]:
+        index.occupy(cell)
+    for _ in range(100):
+        assert index.is_free(index.sample())
+
+
+def test_sample_board_full():
+    """보드가 가득 차면 None"""
+    index = FreeCellIndex(2, 2)
+    for cell in [(0, 0), (0, 1), (1, 0), (1, 1)]:
+        index.occupy(cell)
+    assert index.is_full()
+    assert index.sample() is None
+
+
+def test_snake_updates_index():
+    """뱀 이동이 빈 칸 인덱스에 반영"""
+    index = FreeCellIndex()
+    snake = Snake(index)
+    tail = snake.body[-1]
+    assert len(index) == GRID_WIDTH * GRID_HEIGHT - 3
+
+    snake.direction = RIGHT
+    snake.move()
+    assert index.is_free(tail)
+    assert not index.is_free(snake.get_head())
+    assert len(index) == GRID_WIDTH * GRID_HEIGHT - 3
+
+    # body 재할당 시 기존 점유 해제
+    snake.body = [(0, 0), (0, 1)]
+    assert len(index) == GRID_WIDTH * GRID_HEIGHT - 2
+
+
+def test_food_spawn_uses_index():
+    """먹이는 빈 칸에만 생성되고 재생성 시 이전 칸을 해제"""
+    index = FreeCellIndex(3, 1)
+    index.occupy((0, 0))
+    index.occupy((1, 0))
+    food = Food(index)
+    assert food.get_position() == (2, 0)
+    assert index.is_full()
+
+    # 다른 빈 칸이 없으면 같은 칸에 재생성
+    assert food.spawn()
+    assert food.get_position() == (2, 0)
+
+
+def test_food_spawn_board_full():
+    """보드가 가득 차면 먹이 생성 실패"""
+    index = FreeCellIndex(2, 1)
+    index.occupy((0, 0))
+    index.occupy((1, 0))
+    food = Food(index)
+    assert food.get_position() is None
+    assert not food.spawn()
+
+
+def test_food_spawn_full_board_without_index():
+    """인덱스 없이도 보드가 가득 차면 종료"""
+    full_board = [(x, y) for x in range(GRID_WIDTH) for y in range(GRID_HEIGHT)]
+    food = Food()
+    assert not food.spawn(full_board)
+    assert food.get_position() is None
+
+
+def test_obstacle_uses_index():
+    """장애물은 빈 칸에만 생성되고 인덱스에 반영"""
+    index = FreeCellIndex(3, 3)
+    index.occupy((1, 1))
+    obstacle = Obstacle(5, [], None, index)
+    assert len(obstacle.get_positions()) == 5
+    assert (1, 1) not in obstacle.get_positions()
+    assert len(index) == 3
+
+    obstacle.clear()
+    assert len(index) == 8
+
+
+def test_powerup_spawn_uses_index(monkeypatch):
+    """파워업은 빈 칸 인덱스를 사용하고 수집 시 해제"""
+    from core.powerup import PowerUp
+    monkeypatch.setattr(PowerUp, 'should_spawn', staticmethod(lambda rng=None: 'speed_boost'))
+
+    index = FreeCellIndex(2, 1)
+    manager = PowerUpManager(index)
+    index.occupy((0, 0))
+    powerup = manager.try_spawn()
+    assert powerup.position == (1, 0)
+    assert index.is_full()
+
+    # 보드가 가득 차면 생성하지 않음
+    assert manager.try_spawn() is None
+    assert manager.spawn_position == (1, 0)
+
+    manager.collect(manager.spawned_powerup)
+    assert index.is_free((1, 0))
@@ -1,8 +1,9 @@
 """게임 통합 테스트"""
+import json
 import pytest
 import pygame
 
-from game import Game
+from core.game import Game
 from constants import *
 
 
@@ -169,3 +170,112 @@ def test_multiple_food_eating(game):
     
     # 길이가 증가했는지 확인
     assert len(game.snake.body) > initial_length
+
+
+def test_queued_directions_applied_one_per_tick(game):
+    """한 틱 사이에 빠르게 누른 입력은 다음 틱들에 하나씩 적용됨"""
+    game.waiting = False
+    head_x, head_y = game.snake.get_head()
+    # 오른쪽 이동 중 UP → LEFT (한 틱 안에 연속 입력)
+    game.input_queue.push(UP, game.snake.direction)
+    game.input_queue.push(LEFT, game.snake.direction)
+    game.update()
+    assert game.snake.get_head() == (head_x, head_y - 1)
+    game.update()
+    assert game.snake.get_head() == (head_x - 1, head_y - 1)
+    assert not game.game_over
+    assert len(game.input_queue) == 0
+
+
+def test_tick_interval_uses_speed_multiplier(game):
+    """틱 간격은 current_fps와 속도 배율로 결정"""
+    assert game.get_tick_interval() == pytest.approx(1.0 / game.current_fps)
+    game.speed_multiplier = 2.0
+    assert game.get_tick_interval() == pytest.approx(0.5 / game.current_fps)
+
+
+def test_dirty_rect_redraw_matches_full_redraw(game, monkeypatch):
+    """부분 갱신 결과는 전체 다시 그리기와 같은 화면"""
+    monkeypatch.setattr(pygame.time, 'get_ticks', lambda: 1234)
+    game.portal_mode = True
+    game.waiting = False
+    game.draw()
+    assert not game.dirty_rects.full_redraw
+
+    for step in range(6):
+        game.update()
+        game.interpolation = step / 6
+        game.draw()
+    partial = pygame.image.tobytes(game.screen, 'RGB')
+
+    game.dirty_rects.invalidate()
+    game.draw()
+    assert pygame.image.tobytes(game.screen, 'RGB') == partial
+
+
+def test_overlay_forces_full_redraw(game, monkeypatch):
+    """오버레이 화면과 오버레이가 사라진 첫 프레임은 전체 갱신"""
+    calls = []
+    monkeypatch.setattr(pygame.display, 'flip', lambda: calls.append('flip'))
+    monkeypatch.setattr(pygame.display, 'update', lambda rects: calls.append('update'))
+    game.draw()
+    game.draw()
+    game.waiting = False
+    game.draw()
+    game.draw()
+    assert calls == ['flip', 'flip', 'flip', 'update']
+
+
+def test_setting_keys_do_not_write_config_immediately(tmp_path):
+    """S/P 키 입력은 설정을 메모리에만 반영하고 파일 기록은 미룸"""
+    from config import ConfigManager
+    pygame.init()
+    path = tmp_path / 'config.json'
+    game = Game(sound_enabled=False, music_enabled=False,
+                config_manager=ConfigManager(str(path), save_delay=60.0))
+    for key in (pygame.K_s, pygame.K_p, pygame.K_s):
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+    game.handle_events()
+    
+    assert game.portal_mode
+    assert game.config_manager.get('portal_mode') == True
+    assert not path.exists()
+    game.config_manager.flush()
+    assert json.loads(path.read_text())['portal_mode'] == True
+    pygame.quit()
+
+
+def test_portal_toggle_mid_game_keeps_replay_in_sync(game):
+    """진행 중인 판에서는 P가 무시되어 리플레이가 같은 결과로 재생됨"""
+    from core.replay import ReplayPlayer
+    game.waiting = False
+    game.update()
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p))
+    game.handle_events()
+    assert not game.portal_mode
+    
+    # 오른쪽 벽까지 직진 (포탈 모드가 켜졌다면 반대편으로 넘어가 계속 진행)
+    for _ in range(GRID_WIDTH * 2):
+        if game.game_over:
+            break
+        game.update()
+    assert game.game_over
+    
+    player = ReplayPlayer(game.last_replay)
+    replayed = player.run()
+    assert replayed.game_over
+    assert replayed.tick == game.state.tick
+    assert list(replayed.snake.body) == list(game.snake.body)
+    assert replayed.score_manager.get_score() == game.score_manager.get_score()
+
+
+def test_external_portal_change_waits_for_next_game(game):
+    """판 진행 중의 포탈 설정 변경은 다음 판부터 적용"""
+    game.waiting = False
+    game.update()
+    assert not game.set_portal_mode(True)
+    assert not game.portal_mode
+    
+    game.reset_game()
+    assert game.portal_mode
+    assert game.recorder.replay.portal_mode
@@ -0,0 +1,178 @@
+"""GameState (헤드리스 게임 로직) 테스트"""
+import pytest
+from core.game_state import GameState, EVENT_NONE, EVENT_EAT, EVENT_GAME_OVER
+from managers.score_manager import ScoreManager
+from constants import *
+
+
+@pytest.fixture
+def state(tmp_path):
+    """임시 최고 점수 파일을 사용하는 GameState"""
+    score_manager = ScoreManager(str(tmp_path / "highscore.json"))
+    return GameState('normal', False, score_manager)
+
+
+def test_initial_state(state):
+    """초기 상태 테스트"""
+    assert len(state.snake.body) == 3
+    assert state.food.get_position() not in state.snake.body
+    assert state.obstacle is None
+    assert not state.game_over
+    assert state.current_fps == DIFFICULTIES['normal']['initial_fps']
+
+
+def test_hard_difficulty_creates_obstacles(tmp_path):
+    """Hard 난이도는 장애물 생성"""
+    state = GameState('hard', False, ScoreManager(str(tmp_path / "hs.json")))
+    positions = state.get_obstacle_positions()
+    assert len(positions) == DIFFICULTIES['hard']['obstacles']
+    assert state.food.get_position() not in positions
+
+
+def test_step_moves_snake(state):
+    """step은 뱀을 한 칸 이동"""
+    head_x, head_y = state.snake.get_head()
+    state.food.position = (0, 0)
+    assert state.step() == EVENT_NONE
+    assert state.snake.get_head() == (head_x + 1, head_y)
+    assert state.tick == 1
+
+
+def test_step_applies_action(state):
+    """step의 action으로 방향 변경"""
+    head_x, head_y = state.snake.get_head()
+    state.food.position = (0, 0)
+    state.step(UP)
+    assert state.snake.get_head() == (head_x, head_y - 1)
+
+
+def test_step_eat_food(state):
+    """먹이를 먹으면 EVENT_EAT과 점수/성장"""
+    head_x, head_y = state.snake.get_head()
+    state.food.position = (head_x + 1, head_y)
+    state.food.is_golden = False
+
+    assert state.step() == EVENT_EAT
+    assert state.score_manager.get_score() == NORMAL_FOOD_SCORE
+    assert state.food.get_position() not in state.snake.body
+
+    state.food.position = (0, 0)
+    state.step()
+    assert len(state.snake.body) == 4
+
+
+def test_step_golden_apple(state):
+    """Golden Apple은 50점"""
+    head_x, head_y = state.snake.get_head()
+    state.food.position = (head_x + 1, head_y)
+    state.food.is_golden = True
+
+    assert state.step() == EVENT_EAT
+    assert state.score_manager.get_score() == GOLDEN_APPLE_SCORE
+    assert state.score_manager.get_food_eaten() == 1
+
+
+def test_wall_collision(state):
+    """벽 충돌 시 게임 오버"""
+    state.snake.body = [(0, 10), (1, 10), (2, 10)]
+    state.snake.direction = LEFT
+    state.food.position = (20, 20)
+
+    assert state.step() == EVENT_GAME_OVER
+    assert state.game_over
+    assert state.game_over_reason == 'wall'
+    # 게임 오버 이후에는 진행하지 않음
+    assert state.step() == EVENT_GAME_OVER
+
+
+def test_portal_mode_wraps(tmp_path):
+    """Portal 모드에서는 벽을 통과"""
+    state = GameState('normal', True, ScoreManager(str(tmp_path / "hs.json")))
+    state.snake.body = [(0, 10), (1, 10), (2, 10)]
+    state.snake.direction = LEFT
+    state.food.position = (20, 20)
+
+    assert state.step() == EVENT_NONE
+    assert state.snake.get_head() == (GRID_WIDTH - 1, 10)
+
+
+def test_self_collision(state):
+    """자기 몸통 충돌 시 게임 오버"""
+    state.snake.body = [(10, 10), (11, 10), (11, 11), (10, 11), (9, 11), (9, 10)]
+    state.snake.direction = DOWN
+    state.food.position = (20, 20)
+
+    assert state.step() == EVENT_GAME_OVER
+    assert state.game_over_reason == 'self'
+
+
+def test_speed_increase(state):
+    """speed_increase_interval마다 속도 증가"""
+    initial_fps = state.current_fps
+    for _ in range(state.speed_increase_interval):
+        head_x, head_y = state.snake.get_head()
+        state.food.position = (head_x, head_y - 1)
+        state.food.is_golden = False
+        state.step(UP)
+        state.snake.body = [(15, 15), (14, 15), (13, 15)]
+        state.snake.direction = RIGHT
+    assert state.current_fps == initial_fps + 1
+
+
+def test_reset(state):
+    """reset은 게임 상태를 초기화"""
+    state.snake.body = [(0, 10), (1, 10), (2, 10)]
+    state.snake.direction = LEFT
+    state.step()
+    assert state.game_over
+
+    state.reset()
+    assert not state.game_over
+    assert state.tick == 0
+    assert state.score_manager.get_score() == 0
+    assert len(state.snake.body) == 3
+
+
+def _play(tmp_path, seed, name):
+    """같은 입력 스트림으로 게임을 진행하고 (이벤트, 먹이 위치, 점수) 기록"""
+    state = GameState('hard', True, ScoreManager(str(tmp_path / name)), seed=seed)
+    actions = [None, UP, None, LEFT, None, DOWN, None, RIGHT] * 50
+    history = [tuple(state.get_obstacle_positions())]
+    for action in actions:
+        event = state.step(action)
+        history.append((event, state.food.get_position(), state.score_manager.get_score()))
+    return history
+
+
+def test_seed_reproducible(tmp_path):
+    """같은 시드와 입력이면 같은 게임이 재현됨"""
+    assert _play(tmp_path, 7, "a.json") == _play(tmp_path, 7, "b.json")
+    assert _play(tmp_path, 7, "a.json") != _play(tmp_path, 8, "b.json")
+
+
+def test_seed_independent_of_global_random(tmp_path):
+    """전역 random 상태는 게임 난수에 영향을 주지 않음"""
+    import random
+    random.seed(1)
+    first = _play(tmp_path, 3, "a.json")
+    random.seed(2)
+    assert _play(tmp_path, 3, "b.json") == first
+
+
+def test_reset_with_seed(tmp_path):
+    """reset(seed)는 초기 배치를 다시 만듦"""
+    state = GameState('hard', False, ScoreManager(str(tmp_path / "hs.json")), seed=5)
+    initial = (state.get_obstacle_positions(), state.food.get_position())
+    state.step()
+    state.reset(5)
+    assert (state.get_obstacle_positions(), state.food.get_position()) == initial
+    assert state.sim_time == 0.0
+
+
+def test_simulated_clock_advances_per_tick(state):
+    """시뮬레이션 시간은 틱마다 1/current_fps만큼 증가"""
+    state.food.position = (0, 0)
+    state.step()
+    state.step()
+    assert state.get_time() == pytest.approx(2.0 / state.current_fps)
+    assert state.score_manager.clock() == state.get_time()
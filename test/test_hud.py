@@ -0,0 +1,84 @@
+"""UI 오버레이 캐시 테스트"""
+import pygame
+import pytest
+from constants import WINDOW_WIDTH, WINDOW_HEIGHT
+from ui.hud import UI
+
+
+@pytest.fixture
+def ui():
+    pygame.init()
+    return UI(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)))
+
+
+def test_game_over_overlay_reused(ui):
+    """입력이 같으면 게임 오버 오버레이를 다시 만들지 않는지 테스트"""
+    ui.draw_game_over_screen(120, 100, 12, 33)
+    first = ui._overlays['game_over'][1]
+    ui.draw_game_over_screen(120, 100, 12, 33)
+
+    assert ui._overlays['game_over'][1] is first
+
+
+def test_overlay_rebuilt_on_input_change(ui):
+    """점수/난이도가 바뀌면 오버레이를 다시 만드는지 테스트"""
+    ui.draw_game_over_screen(120, 100, 12, 33)
+    ui.draw_start_screen('easy', False)
+    game_over = ui._overlays['game_over'][1]
+    start = ui._overlays['start'][1]
+
+    ui.draw_game_over_screen(130, 100, 13, 35)
+    ui.draw_start_screen('hard', False)
+
+    assert ui._overlays['game_over'][1] is not game_over
+    assert ui._overlays['start'][1] is not start
+
+
+def test_overlay_dims_background(ui):
+    """오버레이가 배경을 어둡게 하고 글자는 그대로 보이는지 테스트"""
+    ui.screen.fill((255, 255, 255))
+    ui.draw_pause_screen()
+
+    # 글자 없는 구석은 alpha 200만큼 어두워짐
+    assert ui.screen.get_at((2, 2))[:3] == pytest.approx((55, 55, 55), abs=2)
+    # "PAUSED" 글자 줄에는 노란색 픽셀이 있음
+    row = [ui.screen.get_at((x, 80))[:3] for x in range(WINDOW_WIDTH)]
+    assert (255, 255, 0) in row
+
+
+def test_info_field_renders_only_on_change():
+    """패널 항목은 값이 바뀔 때만 다시 렌더링되는지 테스트"""
+    pygame.init()
+    from ui.hud import InfoField
+    from ui.text_cache import get_font
+    field = InfoField(get_font(32), (10, 5), (255, 255, 255))
+
+    assert field.set("Score: 10")
+    surface = field.surface
+    assert not field.set("Score: 10")
+    assert field.surface is surface
+    assert field.set("Score: 20")
+    assert field.set("")
+    assert field.surface is None
+
+
+def test_info_panel_reused_while_values_unchanged(ui):
+    """값이 그대로면 합성된 패널 이미지를 재사용하는지 테스트"""
+    args = (120, 300, 14, 12, True, False, False, 'hard', False)
+    ui.draw_info_panel(*args)
+    panel = ui._panel
+    ui.draw_info_panel(*args)
+    assert ui._panel is panel
+
+    ui.draw_info_panel(130, *args[1:])
+    assert ui._panel is not panel
+
+
+def test_info_panel_combo_palette(ui):
+    """콤보 표시는 미리 그린 색상 단계를 사용하는지 테스트"""
+    ui.draw_info_panel(0, 0, 3, 10, False, False, True)
+    palette = ui._combo_palette
+    ui.draw_info_panel(0, 0, 3, 10, False, False, True)
+
+    assert ui._combo_palette is palette
+    assert len(palette) > 1
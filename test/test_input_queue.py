@@ -0,0 +1,35 @@
+"""방향 입력 큐 테스트"""
+from core.input_queue import DirectionQueue
+from constants import UP, DOWN, LEFT, RIGHT
+
+
+def test_validates_against_last_queued_direction():
+    """반대 방향 검증은 마지막으로 큐에 들어간 방향 기준"""
+    queue = DirectionQueue()
+    assert queue.push(UP, RIGHT)
+    # 현재 방향(RIGHT) 기준이면 거부되지만, 마지막 입력(UP) 기준으로는 허용
+    assert queue.push(LEFT, RIGHT)
+    # LEFT → RIGHT처럼 직전 입력의 반대는 거부 (자기 몸으로 도는 것 방지)
+    assert not queue.push(RIGHT, RIGHT)
+    assert queue.pop() == UP
+    assert queue.pop() == LEFT
+    assert queue.pop() is None
+
+
+def test_rejects_same_and_opposite_of_current():
+    """큐가 비었을 때는 현재 방향 기준으로 같은/반대 방향 거부"""
+    queue = DirectionQueue()
+    assert not queue.push(RIGHT, RIGHT)
+    assert not queue.push(LEFT, RIGHT)
+    assert len(queue) == 0
+
+
+def test_bounded_size():
+    """최대 크기를 넘는 입력은 버림"""
+    queue = DirectionQueue(max_size=2)
+    assert queue.push(UP, RIGHT)
+    assert queue.push(LEFT, RIGHT)
+    assert not queue.push(DOWN, RIGHT)
+    assert len(queue) == 2
+    queue.clear()
+    assert len(queue) == 0
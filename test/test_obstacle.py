@@ -1,6 +1,6 @@
 """Obstacle 클래스 테스트"""
 import pytest
-from obstacle import Obstacle
+from core.obstacle import Obstacle
 from constants import GRID_WIDTH, GRID_HEIGHT
 
 
@@ -108,3 +108,14 @@ def test_powerup_manager_clear():
     
     assert len(manager.active_powerups) == 0
     assert manager.spawned_powerup is None
+
+
+def test_powerup_module_has_no_ui_dependency():
+    """core.powerup은 ui 계층을 import하지 않음 (헤드리스 경로용)"""
+    import os
+    import subprocess
+    import sys
+    code = "import sys; import core.powerup; print(any(m.startswith('ui') for m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert result.stdout.strip().splitlines()[-1] == "False"
@@ -0,0 +1,71 @@
+"""해상도 독립 렌더 타깃 테스트"""
+import pygame
+import pytest
+from ui.render_target import RenderTarget
+
+
+@pytest.fixture(autouse=True)
+def no_display(monkeypatch):
+    """창 없이 테스트 (디스플레이 갱신 호출 무시)"""
+    pygame.init()
+    monkeypatch.setattr(pygame.display, 'flip', lambda: None)
+    monkeypatch.setattr(pygame.display, 'update', lambda rects: None)
+
+
+def _draw_pattern(surface):
+    surface.fill((10, 10, 10))
+    pygame.draw.rect(surface, (255, 0, 0), (5, 5, 10, 10))
+    pygame.draw.rect(surface, (0, 0, 255), (30, 20, 4, 4))
+
+
+def test_identity_scale_copies_logical_surface():
+    """창 크기가 논리 해상도와 같으면 그대로 복사"""
+    window = pygame.Surface((60, 40))
+    target = RenderTarget(window, logical_size=(60, 40))
+    _draw_pattern(target.surface)
+    target.present()
+
+    assert target.is_identity
+    assert pygame.image.tobytes(window, 'RGB') == pygame.image.tobytes(target.surface, 'RGB')
+
+
+def test_integer_scale_letterboxed():
+    """정수 배율로 확대하고 남는 부분은 가운데 정렬 + 검은 여백"""
+    window = pygame.Surface((200, 100))
+    target = RenderTarget(window, logical_size=(60, 40))
+    _draw_pattern(target.surface)
+    target.present()
+
+    assert target.scale == 2
+    assert target.rect == pygame.Rect(40, 10, 120, 80)
+    assert window.get_at((0, 0))[:3] == (0, 0, 0)
+    assert window.get_at((40 + 5 * 2, 10 + 5 * 2))[:3] == (255, 0, 0)
+    assert target.to_logical((40 + 61, 10 + 41)) == (30, 20)
+
+
+def test_partial_present_matches_full():
+    """바뀐 영역만 확대한 결과가 전체 확대와 같은지 테스트"""
+    window = pygame.Surface((180, 120))
+    target = RenderTarget(window, logical_size=(60, 40))
+    _draw_pattern(target.surface)
+    target.present()
+
+    pygame.draw.rect(target.surface, (0, 255, 0), (40, 30, 6, 6))
+    updated = target.present([pygame.Rect(40, 30, 6, 6), pygame.Rect(55, 35, 20, 20)])
+    partial = pygame.image.tobytes(window, 'RGB')
+    target.present()
+
+    assert updated[0] == pygame.Rect(120, 90, 18, 18)
+    assert pygame.image.tobytes(window, 'RGB') == partial
+
+
+def test_resize_recomputes_scale():
+    """창 크기가 바뀌면 배율과 위치를 다시 계산"""
+    target = RenderTarget(pygame.Surface((60, 40)), logical_size=(60, 40), smooth=True)
+    target.resize(pygame.Surface((150, 100)))
+    _draw_pattern(target.surface)
+    target.present()
+
+    assert target.scale == pytest.approx(2.5)
+    assert target.rect == pygame.Rect(0, 0, 150, 100)
+    assert target.window.get_at((25, 25))[0] > 200  # 빨간 사각형 안쪽
@@ -0,0 +1,111 @@
+"""리플레이 기록/재생 테스트"""
+import random
+import pytest
+from core.game_state import GameState, EVENT_GAME_OVER
+from core.replay import (
+    Replay, ReplayRecorder, ReplayPlayer, encode_varint, decode_varint
+)
+from managers.score_manager import ScoreManager
+from constants import *
+
+
+def _record_game(difficulty='hard', portal_mode=True, seed=11, ticks=600, input_seed=0):
+    """무작위 입력으로 한 판을 진행하며 기록 (입력은 change_direction 경로를 거침)"""
+    state = GameState(difficulty, portal_mode, ScoreManager(None), seed=seed)
+    recorder = ReplayRecorder(difficulty, portal_mode, seed)
+    inputs = random.Random(input_seed)
+    while state.tick < ticks and not state.game_over:
+        # 가끔 방향을 바꾸되 바로 앞 칸이 막힌 방향은 피함 (한 틱에 여러 번 입력 가능)
+        for _ in range(inputs.choice((0, 0, 0, 0, 1, 2))):
+            direction = inputs.choice((UP, DOWN, LEFT, RIGHT))
+            if not _blocked(state, direction):
+                state.snake.change_direction(direction)
+        if _blocked(state, state.snake.direction):
+            for direction in (UP, DOWN, LEFT, RIGHT):
+                if not _blocked(state, direction):
+                    state.snake.change_direction(direction)
+        recorder.record(state.tick, state.snake.direction)
+        state.step()
+    return state, recorder.finish(state.tick)
+
+
+def _blocked(state, direction):
+    """해당 방향 다음 칸이 몸통/장애물/벽인지 확인"""
+    head_x, head_y = state.snake.get_head()
+    x, y = head_x + direction[0], head_y + direction[1]
+    if state.portal_mode:
+        x, y = x % GRID_WIDTH, y % GRID_HEIGHT
+    elif not (0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT):
+        return True
+    return (x, y) in state.snake.body or (x, y) in state.get_obstacle_positions()
+
+
+def _snapshot(state):
+    """비교용 상태 요약"""
+    return (list(state.snake.body), state.food.get_position(), state.score_manager.get_score(),
+            state.game_over, state.tick, state.current_fps)
+
+
+@pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 2 ** 32 - 1, 2 ** 63])
+def test_varint_roundtrip(value):
+    """varint 인코딩/디코딩 왕복"""
+    out = bytearray()
+    encode_varint(value, out)
+    assert decode_varint(bytes(out), 0) == (value, len(out))
+
+
+def test_replay_bytes_roundtrip():
+    """직렬화 후 역직렬화하면 같은 리플레이"""
+    _, replay = _record_game()
+    restored = Replay.from_bytes(replay.to_bytes())
+    assert restored.difficulty == replay.difficulty
+    assert restored.portal_mode == replay.portal_mode
+    assert restored.seed == replay.seed
+    assert restored.length == replay.length
+    assert restored.inputs == replay.inputs
+
+
+@pytest.mark.parametrize("difficulty,portal_mode", [('easy', False), ('hard', True)])
+def test_playback_reproduces_game(difficulty, portal_mode):
+    """재생 결과는 원래 게임과 같음"""
+    original, replay = _record_game(difficulty, portal_mode)
+    player = ReplayPlayer(Replay.from_bytes(replay.to_bytes()))
+    assert _snapshot(player.run()) == _snapshot(original)
+    assert player.finished
+
+
+def test_replay_is_compact():
+    """10분 분량(6000틱) 리플레이는 수 KB 이내"""
+    original, replay = _record_game('easy', True, ticks=6000)
+    assert original.tick == 6000
+    data = replay.to_bytes()
+    assert len(data) < 4096
+    assert len(data) < 3 * len(replay.inputs) + 32
+
+
+def test_seek_matches_linear_playback():
+    """seek는 처음부터 재생한 것과 같은 상태"""
+    _, replay = _record_game('easy', True, ticks=1000)
+    player = ReplayPlayer(replay, keyframe_interval=100)
+    player.run()
+
+    for tick in (950, 0, 437, 100, 999, 12):
+        linear = ReplayPlayer(replay).run(tick)
+        assert _snapshot(player.seek(tick)) == _snapshot(linear)
+
+
+def test_invalid_data_raises():
+    """리플레이가 아닌 데이터는 ValueError"""
+    with pytest.raises(ValueError):
+        Replay.from_bytes(b'not a replay')
+    _, replay = _record_game()
+    with pytest.raises(ValueError):
+        Replay.from_bytes(replay.to_bytes()[:-1])
+
+
+def test_save_and_load(tmp_path):
+    """파일 저장/로드"""
+    _, replay = _record_game()
+    path = str(tmp_path / "game.snkr")
+    replay.save(path)
+    assert Replay.load(path).inputs == replay.inputs
@@ -3,7 +3,7 @@ import pytest
 import os
 import json
 import time
-from score_manager import ScoreManager
+from managers.score_manager import ScoreManager
 
 
 class TestScoreManager:
@@ -16,6 +16,7 @@ class TestScoreManager:
     
     def teardown_method(self):
         """각 테스트 메서드 실행 후 정리"""
+        self.score_manager.flush(wait=True)  # 백그라운드 기록이 끝난 뒤 삭제
         if os.path.exists(self.test_file):
             os.remove(self.test_file)
     
@@ -112,3 +113,61 @@ class TestScoreManager:
         """최고 점수 파일이 없을 때 기본값 0"""
         manager = ScoreManager('nonexistent_file.json')
         assert manager.get_high_score() == 0
+
+
+class TestHighScoreStore:
+    """최고 점수 write-behind 저장소 테스트"""
+    
+    def test_add_food_does_not_write_immediately(self, tmp_path):
+        """먹이를 먹어도 바로 파일을 쓰지 않고 flush 때 기록"""
+        from managers.score_manager import HighScoreStore
+        path = str(tmp_path / 'hs.json')
+        manager = ScoreManager(path)
+        manager.store.flush_interval = 60.0
+        
+        for _ in range(20):
+            manager.add_food()
+        assert not os.path.exists(path)
+        
+        manager.flush(wait=True)
+        with open(path) as f:
+            assert json.load(f) == {'high_score': manager.get_high_score()}
+        assert manager.store.writes == 1  # 20번의 갱신을 한 번에 기록
+    
+    def test_end_game_flushes(self, tmp_path):
+        """게임 종료 시 백그라운드 기록 요청"""
+        path = str(tmp_path / 'hs.json')
+        manager = ScoreManager(path)
+        manager.store.flush_interval = 60.0
+        manager.add_food()
+        manager.end_game()
+        
+        deadline = time.time() + 5
+        while not os.path.exists(path) and time.time() < deadline:
+            time.sleep(0.01)
+        assert ScoreManager(path).get_high_score() == 10
+    
+    def test_atomic_write_leaves_no_temp_files(self, tmp_path):
+        """임시 파일에 쓴 뒤 교체하므로 남는 파일이 없음"""
+        path = tmp_path / 'hs.json'
+        path.write_text('{"high_score": 5}')
+        manager = ScoreManager(str(path))
+        assert manager.get_high_score() == 5
+        
+        for _ in range(3):
+            manager.add_food()
+        manager.flush(wait=True)
+        
+        assert os.listdir(tmp_path) == ['hs.json']
+        assert json.loads(path.read_text()) == {'high_score': manager.get_high_score()}
+    
+    def test_store_shared_per_path(self, tmp_path):
+        """같은 파일을 쓰는 ScoreManager는 저장소를 공유하고 새 값을 읽음"""
+        path = str(tmp_path / 'hs.json')
+        first = ScoreManager(path)
+        first.store.flush_interval = 60.0
+        first.add_food()
+        
+        second = ScoreManager(path)
+        assert second.store is first.store
+        assert second.get_high_score() == 10
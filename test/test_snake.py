@@ -1,7 +1,7 @@
 """Snake 클래스 단위 테스트"""
 import pytest
 
-from snake import Snake
+from core.snake import Snake, SnakeBody
 from constants import *
 
 
@@ -275,3 +275,75 @@ def test_normal_mode_vs_portal_mode():
     # 반대편으로 이동
     assert snake2.body[0] == (GRID_WIDTH - 1, 15)
     assert snake2.check_wall_collision() == False
+
+
+def test_occupies(snake):
+    """점유 여부 확인 (이동 시 갱신)"""
+    tail = snake.body[-1]
+    assert snake.occupies(snake.get_head())
+    assert snake.occupies(tail)
+    
+    snake.move()
+    
+    # 꼬리가 빠진 칸은 비어 있고 새 머리 칸은 점유됨
+    assert not snake.occupies(tail)
+    assert snake.occupies(snake.get_head())
+
+
+def test_occupancy_after_body_assignment(snake):
+    """body 재할당 시 점유 정보 재구성"""
+    snake.body = [(5, 5), (5, 6), (5, 7)]
+    assert snake.occupies((5, 7))
+    assert not snake.occupies((15, 15))
+    assert not snake.check_self_collision()
+
+
+def test_self_collision_with_growth(snake):
+    """성장 중 꼬리 칸과의 충돌 감지"""
+    # 머리가 꼬리 칸으로 들어가는데 성장 중이라 꼬리가 남아 있음
+    snake.body = [(5, 5), (6, 5), (6, 6), (5, 6)]
+    snake.direction = DOWN
+    snake.grow()
+    snake.move()
+    assert snake.check_self_collision()
+
+
+def test_set_head(snake):
+    """머리 위치 교체 시 점유 정보 갱신"""
+    old_head = snake.get_head()
+    snake.set_head((0, 0))
+    assert snake.get_head() == (0, 0)
+    assert snake.occupies((0, 0))
+    assert not snake.occupies(old_head)
+
+
+def test_body_list_compatibility(snake):
+    """SnakeBody는 기존 리스트 사용 방식과 호환"""
+    body = snake.body
+    assert isinstance(body, SnakeBody)
+    assert body == [body[0], body[1], body[2]]
+    assert body[-1] == body[2]
+    assert body[1:] == [body[1], body[2]]
+    assert body + [(0, 0)] == [body[0], body[1], body[2], (0, 0)]
+    assert list(reversed(body)) == [body[2], body[1], body[0]]
+
+
+def test_body_index_assignment_keeps_occupancy(snake):
+    """body[0] 대입 시 점유 정보 동기화 (PortalMode 호환)"""
+    old_head = snake.body[0]
+    snake.body[0] = (1, 1)
+    assert snake.get_head() == (1, 1)
+    assert snake.occupies((1, 1))
+    assert not snake.occupies(old_head)
+
+
+def test_long_snake_move():
+    """긴 뱀에서도 이동/성장 후 길이와 점유 정보가 일치"""
+    snake = Snake()
+    snake.body = [(x, 0) for x in range(GRID_WIDTH - 1, -1, -1)]
+    snake.direction = DOWN
+    snake.grow()
+    snake.move()
+    assert len(snake.body) == GRID_WIDTH + 1
+    assert snake.occupies((GRID_WIDTH - 1, 1))
+    assert not snake.check_self_collision()
@@ -0,0 +1,64 @@
+"""스프라이트 아틀라스 테스트"""
+import pygame
+import pytest
+from ui.sprite_atlas import (
+    SpriteAtlas, pulse_index, COMBO_PULSE_STEPS, FOOD_PULSE_STEPS,
+    SLOW_MOTION_FRAMES, INVINCIBLE_FRAMES
+)
+from core.powerup import PowerUp
+from constants import *
+
+
+@pytest.fixture(scope="module")
+def atlas():
+    """테스트용 아틀라스"""
+    pygame.init()
+    return SpriteAtlas()
+
+
+@pytest.mark.parametrize("ticks,expected", [(0, 15), (150, 0), (300, 15), (75, 8), (450, 0)])
+def test_pulse_index(ticks, expected):
+    """펄스 인덱스는 왕복 펄스를 양자화 (0 = 어두움, steps-1 = 밝음)"""
+    assert pulse_index(ticks, 300, 16) == expected
+
+
+def test_segment_tiles(atlas):
+    """콤보가 아니면 기본 색, 콤보면 단계별 색"""
+    head, body = atlas.segment_tiles(False, 0)
+    assert head.get_at((0, 0))[:3] == LIGHT_GREEN
+    assert body.get_at((5, 5))[:3] == DARK_GREEN
+
+    # 펄스 최대 (밝기 1.3 + 노란색 톤)
+    head, body = atlas.segment_tiles(True, 0)
+    assert head.get_at((0, 0))[:3] == (50, 255, 0)
+    assert body.get_at((0, 0))[:3] == (30, 206, 0)
+    assert len(atlas.combo_heads) == COMBO_PULSE_STEPS
+
+
+def test_food_tiles(atlas):
+    """먹이는 펄스에 따라 80% ~ 100% 크기이며 칸 중앙에 위치"""
+    small, offset = atlas.food_tile(False, 500)
+    assert small.get_width() == int(GRID_SIZE * 0.8)
+    assert offset == (GRID_SIZE - small.get_width()) // 2
+    large, offset = atlas.food_tile(True, 0)
+    assert large.get_width() == GRID_SIZE and offset == 0
+    assert large.get_at((0, 0))[:3] == GOLD
+    assert len(atlas.food[False]) == FOOD_PULSE_STEPS
+
+
+def test_powerup_frames(atlas):
+    """파워업 회전 프레임은 주기마다 반복"""
+    assert len(atlas.powerups[POWERUP_SLOW_MOTION]) == SLOW_MOTION_FRAMES
+    assert len(atlas.powerups[POWERUP_INVINCIBLE]) == INVINCIBLE_FRAMES
+    assert atlas.powerup_tile(POWERUP_INVINCIBLE, 3) is atlas.powerup_tile(POWERUP_INVINCIBLE, 183)
+
+
+def test_powerup_draw_uses_atlas(atlas):
+    """PowerUp.draw는 아틀라스 프레임을 blit하고 영역 반환"""
+    surface = pygame.Surface((100, 100))
+    surface.fill(BLACK)
+    powerup = PowerUp(POWERUP_SPEED_BOOST, (2, 1))
+    rect = powerup.draw(surface, atlas)
+    assert rect == pygame.Rect(2 * GRID_SIZE, GRID_SIZE, GRID_SIZE, GRID_SIZE)
+    assert surface.get_at(rect.center)[:3] == POWERUP_COLORS[POWERUP_SPEED_BOOST]
+    assert powerup.animation_frame == 1
@@ -0,0 +1,66 @@
+"""뱀 스프라이트 배치 테스트"""
+import numpy as np
+import pygame
+import pytest
+from ui.sprite_batch import SnakeSpriteBatch
+from core.snake import Snake
+from constants import *
+
+
+def _tile(color):
+    tile = pygame.Surface((GRID_SIZE, GRID_SIZE))
+    tile.fill(color)
+    return tile
+
+
+def test_advance_tracks_snake_moves():
+    """advance는 이동/성장을 점진적으로 반영"""
+    snake = Snake()
+    batch = SnakeSpriteBatch()
+    batch.reset(snake.body)
+    for step in range(10):
+        if step == 4:
+            snake.grow()
+        snake.move()
+        batch.advance(snake.body)
+        assert batch.matches(snake.body)
+        assert batch.pixel_positions().tolist() == [[x * GRID_SIZE, y * GRID_SIZE] for x, y in snake.body]
+
+
+def test_advance_rebuilds_on_jump():
+    """한 칸 이동이 아닌 변화(몸통 교체)는 다시 구성"""
+    batch = SnakeSpriteBatch()
+    batch.reset([(5, 5), (4, 5)])
+    batch.advance([(10, 10), (10, 11), (10, 12)])
+    assert batch.pixel_positions(0.5).tolist() == [[200, 200], [200, 220], [200, 240]]
+
+
+def test_interpolation():
+    """보간 비율에 따라 직전 틱과 현재 위치 사이 (Portal 이동과 새 꼬리는 제외)"""
+    batch = SnakeSpriteBatch()
+    batch.reset([(GRID_WIDTH - 1, 5), (GRID_WIDTH - 2, 5)])
+    batch.advance([(0, 5), (GRID_WIDTH - 1, 5), (GRID_WIDTH - 2, 5)])  # Portal 통과 + 성장
+    positions = batch.pixel_positions(0.5).tolist()
+    assert positions[0] == [0, 5 * GRID_SIZE]  # 반대편으로 넘어감 -> 보간 없음
+    assert positions[1] == [(GRID_WIDTH - 1.5) * GRID_SIZE, 5 * GRID_SIZE]
+    assert positions[2] == [(GRID_WIDTH - 2) * GRID_SIZE, 5 * GRID_SIZE]  # 새 꼬리는 제자리
+
+
+def test_blit_sequence_and_fill_match():
+    """blits 경로와 surfarray 경로는 같은 화면"""
+    pygame.init()
+    body = [(x, 3) for x in range(20, 2, -1)] + [(3, y) for y in range(4, 15)]
+    batch = SnakeSpriteBatch()
+    batch.reset(body[1:])
+    batch.advance(body)
+    head, segment = _tile(LIGHT_GREEN), _tile(DARK_GREEN)
+
+    by_blits = pygame.Surface((600, 600))
+    by_blits.fill(BLACK)
+    rects = by_blits.blits(batch.blit_sequence(head, segment, 0.3))
+    by_fill = pygame.Surface((600, 600))
+    by_fill.fill(BLACK)
+    bounds = batch.fill(by_fill, LIGHT_GREEN, DARK_GREEN, 0.3)
+
+    assert pygame.image.tobytes(by_blits, 'RGB') == pygame.image.tobytes(by_fill, 'RGB')
+    assert bounds == rects[0].unionall(rects[1:])
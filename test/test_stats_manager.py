@@ -93,3 +93,238 @@ def test_reset_stats(temp_stats_db):
     
     score, _ = manager.get_difficulty_highscore("hard")
     assert score == 0
+
+
+def test_record_session_single_transaction(temp_stats_db):
+    """한 판의 기록을 트랜잭션 하나로 저장"""
+    manager = StatsManager(temp_stats_db)
+    conn = manager._connection()
+    commits = conn.total_changes
+    
+    records = manager.record_session(90.0, 8, 120, "hard", mode="classic",
+                                     golden_apples=1, survival_time=90.0)
+    assert records == {'difficulty_highscore': True, 'mode_highscore': True}
+    assert conn.total_changes - commits == 5  # 통계 + 난이도 + 모드 + 생존 시간 + 판 기록
+    assert not conn.in_transaction
+    
+    records = manager.record_session(30.0, 2, 20, "hard", mode="classic")
+    assert records == {'difficulty_highscore': False, 'mode_highscore': False}
+    
+    stats = manager.get_global_stats()
+    assert stats['total_games'] == 2
+    assert stats['total_food_eaten'] == 10
+    assert manager.get_difficulty_highscore("hard")[0] == 120
+    assert manager.get_mode_highscore("classic")[0] == 120
+    assert manager.get_longest_survival_time()[0] == 90.0
+
+
+def test_record_session_rolls_back_on_error(temp_stats_db):
+    """중간에 실패하면 그 판의 기록은 하나도 남지 않음"""
+    manager = StatsManager(temp_stats_db)
+    with pytest.raises(Exception):
+        manager.record_session(10.0, 1, 10, "easy", survival_time=object())
+    
+    assert manager.get_global_stats()['total_games'] == 0
+    assert manager.get_difficulty_highscore("easy")[0] == 0
+
+
+def test_persistent_wal_connection(temp_stats_db):
+    """연결을 재사용하고 WAL/synchronous=NORMAL로 설정"""
+    manager = StatsManager(temp_stats_db)
+    conn = manager._connection()
+    manager.record_game(1.0, 1)
+    manager.get_global_stats()
+    
+    assert manager._connection() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    manager.close()
+
+
+def test_connection_per_thread(temp_stats_db):
+    """다른 스레드에서는 별도 연결을 사용"""
+    import threading
+    manager = StatsManager(temp_stats_db)
+    worker = threading.Thread(target=manager.record_game, args=(5.0, 3))
+    worker.start()
+    worker.join()
+    
+    assert manager.get_global_stats()['total_food_eaten'] == 3
+    assert len(manager._connections) == 2
+    manager.close()
+
+
+def test_stats_writer_batches_and_drains(temp_stats_db):
+    """쌓인 기록을 배치로 묶어 쓰고 종료 시 남은 기록을 모두 씀"""
+    import threading
+    from managers.stats_manager import StatsWriter
+    manager = StatsManager(temp_stats_db)
+    writer = StatsWriter(manager, batch_size=8)
+    
+    # 첫 배치 쓰기를 잠시 막아 두고 기록을 쌓음
+    release = threading.Event()
+    record_sessions = manager.record_sessions
+    manager.record_sessions = lambda batch: (release.wait(), record_sessions(batch))[1]
+    for score in range(20):
+        assert writer.submit(10.0, 1, score, "normal", mode="classic")
+    release.set()
+    assert writer.close(timeout=5.0)
+    
+    counters = writer.get_counters()
+    assert counters['submitted'] == counters['written'] == 20
+    assert counters['queue_depth'] == 0
+    assert counters['max_batch_size'] == 8
+    assert counters['batches'] < 20
+    assert counters['max_write_ms'] >= counters['avg_write_ms'] > 0
+    assert manager.get_global_stats()['total_games'] == 20
+    assert manager.get_mode_highscore("classic")[0] == 19
+
+
+def test_stats_writer_never_blocks(temp_stats_db):
+    """큐가 가득 차거나 닫힌 뒤에는 기다리지 않고 버림"""
+    import threading
+    from managers.stats_manager import StatsWriter
+    manager = StatsManager(temp_stats_db)
+    writer = StatsWriter(manager, queue_size=2, batch_size=1)
+    release = threading.Event()
+    record_sessions = manager.record_sessions
+    manager.record_sessions = lambda batch: (release.wait(), record_sessions(batch))[1]
+    
+    results = [writer.submit(1.0, 0, 0, "easy") for _ in range(10)]
+    assert results.count(False) >= 7
+    release.set()
+    assert writer.close()
+    assert not writer.submit(1.0, 0, 0, "easy")
+    
+    counters = writer.get_counters()
+    assert counters['written'] == counters['submitted']
+    assert counters['dropped'] == 10 - counters['submitted'] + 1
+
+
+def test_stats_writer_keeps_submit_time(temp_stats_db):
+    """쓰기가 밀려도 각 판은 submit() 시각으로 기록됨"""
+    import threading
+    import time
+    from managers.stats_manager import StatsWriter
+    manager = StatsManager(temp_stats_db)
+    writer = StatsWriter(manager)
+    release = threading.Event()
+    record_sessions = manager.record_sessions
+    manager.record_sessions = lambda batch: (release.wait(), record_sessions(batch))[1]
+    
+    for score in range(3):
+        writer.submit(10.0, 1, score, "hard", mode="classic", survival_time=10.0)
+        time.sleep(0.01)
+    release.set()
+    assert writer.close()
+    
+    played_at = [row[0] for row in manager._connection().execute(
+        "SELECT played_at FROM sessions ORDER BY score")]
+    assert len(set(played_at)) == 3 and played_at == sorted(played_at)
+    survival = [row[0] for row in manager._connection().execute(
+        "SELECT achieved_at FROM survival_records ORDER BY id")]
+    assert survival == played_at
+    assert manager.get_mode_highscore("classic")[1] == played_at[-1]
+
+
+def test_stats_writer_survives_bad_batch(temp_stats_db):
+    """배치에 잘못된 기록이 섞여도 그 기록만 버리고 나머지는 씀"""
+    import threading
+    from managers.stats_manager import StatsWriter
+    manager = StatsManager(temp_stats_db)
+    writer = StatsWriter(manager, batch_size=8)
+    release = threading.Event()
+    record_sessions = manager.record_sessions
+    manager.record_sessions = lambda batch: (release.wait(), record_sessions(batch))[1]
+    
+    # 첫 기록을 쓰는 동안 나머지가 쌓여 한 배치로 묶임
+    assert writer.submit(1.0, 0, 1, "easy")
+    assert writer.submit(1.0, 0, 2, "easy")
+    writer._queue.put({'playtime': 1.0, 'food_eaten': 0, 'score': 99, 'difficulty': 'easy',
+                       'unknown': 1})  # record_session()에 없는 키 -> TypeError
+    assert writer.submit(1.0, 0, 3, "easy")
+    release.set()
+    assert writer.close()
+    
+    counters = writer.get_counters()
+    assert counters['max_batch_size'] >= 3  # 잘못된 기록이 정상 기록과 같은 배치
+    assert counters['errors'] == 1
+    assert isinstance(writer.last_error, TypeError)
+    assert counters['written'] == 3
+    scores = [row[0] for row in manager._connection().execute("SELECT score FROM sessions ORDER BY id")]
+    assert scores == [1, 2, 3]
+    assert manager.get_global_stats()['total_games'] == 3
+
+def _insert_sessions(manager, rows):
+    """(며칠 전, 난이도, 모드, 점수) 기록을 sessions 테이블에 직접 삽입"""
+    from datetime import datetime, timedelta
+    now = datetime.now()
+    with manager._connection() as conn:
+        conn.executemany(
+            "INSERT INTO sessions (played_at, difficulty, mode, score) VALUES (?, ?, ?, ?)",
+            [((now - timedelta(days=age)).isoformat(), difficulty, mode, score)
+             for age, difficulty, mode, score in rows])
+
+
+def test_record_session_adds_history(temp_stats_db):
+    """판이 끝날 때마다 sessions에 한 행씩 기록"""
+    manager = StatsManager(temp_stats_db)
+    manager.record_session(60.0, 5, 50, "hard", mode="classic", survival_time=60.0)
+    manager.record_sessions([dict(playtime=30.0, food_eaten=2, score=20, difficulty="hard")])
+    
+    rows = manager._connection().execute(
+        "SELECT difficulty, mode, score, playtime, survival_time FROM sessions ORDER BY id").fetchall()
+    assert rows == [("hard", "classic", 50, 60.0, 60.0), ("hard", None, 20, 30.0, None)]
+    
+    manager.reset_stats()
+    assert manager.get_score_distribution("hard") == []
+
+
+def test_score_percentiles_and_histogram(temp_stats_db):
+    """기간/모드 조건별 분위수와 히스토그램"""
+    manager = StatsManager(temp_stats_db)
+    _insert_sessions(manager, [(1, "hard", "classic", score) for score in range(1, 101)])
+    _insert_sessions(manager, [(1, "hard", "portal", 500), (60, "hard", "classic", 1000),
+                               (1, "easy", "classic", 5)])
+    
+    assert manager.get_score_percentiles("hard", (50, 95), mode="classic", days=30) == {50: 50, 95: 95}
+    assert manager.get_score_percentiles("hard", (0, 100), days=30) == {0: 1, 100: 500}
+    assert manager.get_score_percentiles("hard", (100,)) == {100: 1000}
+    assert manager.get_score_percentiles("normal", (50,)) == {50: None}
+    
+    histogram = manager.get_score_histogram("hard", bin_size=50, mode="classic", days=30)
+    assert histogram == [(0, 49), (50, 50), (100, 1)]
+
+
+def test_daily_trend(temp_stats_db):
+    """최근 기간의 일별 판 수/평균/최고 점수"""
+    manager = StatsManager(temp_stats_db)
+    _insert_sessions(manager, [(2, "hard", "classic", 10), (2, "hard", "classic", 30),
+                               (1, "easy", "classic", 5), (40, "hard", "classic", 99)])
+    
+    trend = manager.get_daily_trend(days=30)
+    assert [day['games'] for day in trend] == [2, 1]
+    assert trend[0]['average_score'] == 20
+    assert trend[0]['max_score'] == 30
+    assert trend[0]['date'] < trend[1]['date']
+    
+    hard = manager.get_daily_trend(days=30, difficulty="hard")
+    assert len(hard) == 1 and hard[0]['games'] == 2
+
+
+@pytest.mark.parametrize("sql,params", [
+    ("SELECT score, COUNT(*) FROM sessions WHERE difficulty = ? AND played_at >= ? "
+     "GROUP BY score", ("hard", "")),
+    ("SELECT score, COUNT(*) FROM sessions WHERE difficulty = ? AND mode = ? AND played_at >= ? "
+     "GROUP BY score", ("hard", "classic", "")),
+    ("SELECT substr(played_at, 1, 10) AS day, COUNT(*), MAX(score) FROM sessions "
+     "WHERE played_at >= ? GROUP BY day", ("",)),
+    ("SELECT survival_time, achieved_at FROM survival_records ORDER BY survival_time DESC LIMIT 1", ()),
+])
+def test_history_queries_use_indexes(temp_stats_db, sql, params):
+    """분위수/추세/최장 생존 조회가 테이블 전체를 훑지 않음"""
+    manager = StatsManager(temp_stats_db)
+    plan = [row[-1] for row in manager._connection().execute("EXPLAIN QUERY PLAN " + sql, params)]
+    steps = [step for step in plan if "sessions" in step or "survival_records" in step]
+    assert steps and all("INDEX" in step for step in steps)
+    assert not any("ORDER BY" in step for step in plan)  # 정렬용 임시 B-tree 없음
@@ -0,0 +1,59 @@
+"""폰트 레지스트리와 텍스트 캐시 테스트"""
+import pygame
+import pytest
+from ui.text_cache import TextCache, get_font, render_text, text_cache
+
+
+@pytest.fixture(autouse=True)
+def font_init():
+    """pygame 폰트 모듈 초기화"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def test_font_registry_shares_fonts():
+    """같은 (글꼴, 크기)는 같은 폰트 객체"""
+    assert get_font(24) is get_font(24)
+    assert get_font(24) is not get_font(32)
+
+
+def test_text_cache_hits_and_misses():
+    """같은 키는 같은 Surface를 반환하고 통계를 기록"""
+    cache = TextCache()
+    font = get_font(24)
+    first = cache.render(font, "Score: 10", (255, 255, 255))
+    assert cache.render(font, "Score: 10", (255, 255, 255)) is first
+    assert cache.render(font, "Score: 10", (255, 255, 0)) is not first
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses'], stats['size']) == (1, 2, 2)
+    assert stats['hit_rate'] == pytest.approx(1 / 3)
+
+
+def test_text_cache_lru_bound():
+    """최대 크기를 넘으면 가장 오래 안 쓴 항목부터 제거"""
+    cache = TextCache(max_entries=2)
+    font = get_font(24)
+    a = cache.render(font, "a", (255, 255, 255))
+    cache.render(font, "b", (255, 255, 255))
+    cache.render(font, "a", (255, 255, 255))  # a를 최근 사용으로
+    cache.render(font, "c", (255, 255, 255))  # b 제거
+    assert len(cache) == 2
+    assert cache.render(font, "a", (255, 255, 255)) is a
+    misses = cache.misses
+    cache.render(font, "b", (255, 255, 255))
+    assert cache.misses == misses + 1
+
+
+def test_quit_clears_registry():
+    """pygame.quit() 후에는 새 폰트를 생성 (종료된 폰트 재사용 방지)"""
+    render_text("hello", 24, (255, 255, 255))
+    font = get_font(24)
+    pygame.quit()
+    assert len(text_cache) == 0
+    pygame.init()
+    assert get_font(24) is not font
+    # 두 번째 quit에서도 다시 정리됨
+    render_text("hello", 24, (255, 255, 255))
+    pygame.quit()
+    assert len(text_cache) == 0
@@ -0,0 +1,152 @@
+"""게임 영역 배경 캐시 (그리드/장애물 레이어와 Portal 테두리 애니메이션 프레임)"""
+from typing import Iterable, List, Optional, Tuple
+import pygame
+from constants import *
+
+
+PORTAL_BORDER_FRAMES = 12  # 미리 그려 둘 테두리 밝기 단계 수
+PORTAL_BORDER_PERIOD = 1000  # 테두리 펄스 주기 (ms)
+_PORTAL_DASH_LENGTH = 15
+_PORTAL_GAP_LENGTH = 10
+_PORTAL_BORDER_WIDTH = 4
+_PORTAL_BAND = 4  # 테두리 선이 그려지는 가장자리 두께 (px)
+
+
+class BackgroundCache:
+    """
+    정적인 배경(그리드 + 장애물)을 한 번만 그려 두고 매 프레임 blit하는 캐시
+
+    장애물 목록이나 크기가 바뀔 때만 다시 그린다. Portal 테두리는 밝기별로
+    가장자리 띠 이미지를 미리 만들어 두고 시간에 맞는 프레임만 blit한다.
+    """
+
+    def __init__(self, size: Tuple[int, int] = (BOARD_WIDTH, BOARD_HEIGHT)):
+        """
+        배경 캐시 초기화
+
+        Args:
+            size: 게임 영역 크기 (픽셀)
+        """
+        self.size = size
+        self._surface: Optional[pygame.Surface] = None
+        self._obstacle_key: Optional[tuple] = None
+        self._portal_frames: Optional[List[List[Tuple[pygame.Surface, Tuple[int, int]]]]] = None
+
+    def resize(self, size: Tuple[int, int]) -> None:
+        """
+        게임 영역 크기 변경 (캐시 무효화)
+
+        Args:
+            size: 새 크기 (픽셀)
+        """
+        if size != self.size:
+            self.size = size
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """캐시된 배경과 테두리 프레임 폐기 (다음 요청 시 다시 그림)"""
+        self._surface = None
+        self._obstacle_key = None
+        self._portal_frames = None
+
+    def get(self, obstacle_positions: Iterable[Tuple[int, int]] = ()) -> pygame.Surface:
+        """
+        배경 레이어 반환 (장애물이 바뀌었으면 다시 그림)
+
+        Args:
+            obstacle_positions: 장애물 위치 목록
+
+        Returns:
+            그리드와 장애물이 그려진 Surface
+        """
+        key = tuple(obstacle_positions)
+        if self._surface is None or key != self._obstacle_key:
+            self._surface = self._render(key)
+            self._obstacle_key = key
+        return self._surface
+
+    def _render(self, obstacle_positions: tuple) -> pygame.Surface:
+        """그리드 라인과 장애물을 새 Surface에 그림"""
+        width, height = self.size
+        surface = pygame.Surface(self.size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()  # 화면 픽셀 포맷으로 맞춰 blit 비용 절감
+        surface.fill(BLACK)
+
+        # 그리드 라인
+        for x in range(0, width, GRID_SIZE):
+            pygame.draw.line(surface, GRID_COLOR, (x, 0), (x, height))
+        for y in range(0, height, GRID_SIZE):
+            pygame.draw.line(surface, GRID_COLOR, (0, y), (width, y))
+
+        # 장애물 (타일 하나를 blits 한 번으로 복사)
+        tile = pygame.Surface((GRID_SIZE, GRID_SIZE))
+        tile.fill(GRAY)
+        surface.blits([(tile, (obs_x * GRID_SIZE, obs_y * GRID_SIZE))
+                       for obs_x, obs_y in obstacle_positions], False)
+        return surface
+
+    def draw_portal_border(self, surface: pygame.Surface, ticks: int) -> List[pygame.Rect]:
+        """
+        Portal 모드 점선 테두리 그리기 (미리 만든 프레임 중 하나를 blit)
+
+        Args:
+            surface: 그릴 대상 (게임 영역)
+            ticks: 현재 시간 (pygame.time.get_ticks(), ms)
+
+        Returns:
+            그려진 영역 목록
+        """
+        if self._portal_frames is None:
+            self._portal_frames = [self._render_portal_frame(i / (PORTAL_BORDER_FRAMES - 1))
+                                   for i in range(PORTAL_BORDER_FRAMES)]
+
+        # 펄스 효과 (0.0 ~ 1.0 왕복)
+        half = PORTAL_BORDER_PERIOD // 2
+        pulse = abs(ticks % PORTAL_BORDER_PERIOD - half) / half
+        return surface.blits(self._portal_frames[round(pulse * (PORTAL_BORDER_FRAMES - 1))])
+
+    def _render_portal_frame(self, pulse: float) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """
+        한 밝기의 테두리를 그려 네 가장자리 띠로 잘라 반환
+
+        Args:
+            pulse: 펄스 값 (0.0 ~ 1.0)
+
+        Returns:
+            (띠 Surface, 위치) 목록 - 검은색은 투명 처리
+        """
+        width, height = self.size
+        brightness = 0.6 + 0.4 * pulse
+
+        # 초록색/청록색 (Portal 느낌)
+        portal_color = (
+            int(0 * brightness),
+            int(255 * brightness),
+            int(200 * brightness)
+        )
+
+        frame = pygame.Surface(self.size)
+        frame.fill(BLACK)
+        step = _PORTAL_DASH_LENGTH + _PORTAL_GAP_LENGTH
+        for x in range(0, width, step):
+            end_x = min(x + _PORTAL_DASH_LENGTH, width)
+            pygame.draw.line(frame, portal_color, (x, 0), (end_x, 0), _PORTAL_BORDER_WIDTH)
+            pygame.draw.line(frame, portal_color, (x, height - 1), (end_x, height - 1),
+                             _PORTAL_BORDER_WIDTH)
+        for y in range(0, height, step):
+            end_y = min(y + _PORTAL_DASH_LENGTH, height)
+            pygame.draw.line(frame, portal_color, (0, y), (0, end_y), _PORTAL_BORDER_WIDTH)
+            pygame.draw.line(frame, portal_color, (width - 1, y), (width - 1, end_y),
+                             _PORTAL_BORDER_WIDTH)
+
+        band = _PORTAL_BAND
+        strips = []
+        for rect in (pygame.Rect(0, 0, width, band),
+                     pygame.Rect(0, height - band, width, band),
+                     pygame.Rect(0, band, band, height - 2 * band),
+                     pygame.Rect(width - band, band, band, height - 2 * band)):
+            strip = frame.subsurface(rect).copy()
+            strip.set_colorkey(BLACK)
+            strips.append((strip, rect.topleft))
+        return strips
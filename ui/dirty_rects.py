@@ -0,0 +1,72 @@
+"""변경 영역(dirty rect) 추적 - 바뀐 부분만 다시 그리고 화면에 반영"""
+from typing import Iterable, List
+import pygame
+
+
+MAX_DIRTY_RECTS = 64  # 이보다 많으면 하나의 외접 사각형으로 합침
+
+
+class DirtyRectTracker:
+    """
+    프레임마다 그린 영역을 기록해 다음 프레임의 지울 영역/갱신 영역을 계산
+
+    움직이는 객체(뱀 마디, 먹이, 테두리, 파티클 등)는 그릴 때 add()로 영역을
+    알린다. 다음 프레임에서는 restore()로 지난 프레임 영역만 배경으로 덮고
+    새로 그린 뒤, end_frame()이 돌려주는 (지난 영역 + 새 영역)만
+    pygame.display.update()로 반영한다.
+    """
+
+    def __init__(self):
+        """변경 영역 추적기 초기화 (첫 프레임은 전체 그리기)"""
+        self._previous: List[pygame.Rect] = []
+        self._current: List[pygame.Rect] = []
+        self.full_redraw = True
+
+    def invalidate(self) -> None:
+        """다음 프레임을 전체 다시 그리도록 표시 (오버레이/배경 변경 시)"""
+        self.full_redraw = True
+
+    def add(self, rect) -> None:
+        """
+        이번 프레임에 그린 영역 추가
+
+        Args:
+            rect: 그린 영역 (pygame.Rect 또는 (x, y, w, h))
+        """
+        self._current.append(pygame.Rect(rect))
+
+    def add_all(self, rects: Iterable[pygame.Rect]) -> None:
+        """
+        여러 영역 추가 (Surface.blits()가 돌려준 Rect 목록을 그대로 사용)
+
+        Args:
+            rects: 그린 영역 목록 (pygame.Rect)
+        """
+        self._current.extend(rects)
+
+    def restore(self, surface: pygame.Surface, background: pygame.Surface) -> None:
+        """
+        지난 프레임에 그린 영역을 배경으로 덮어 지움
+
+        Args:
+            surface: 그릴 대상
+            background: 같은 좌표계의 배경 Surface
+        """
+        surface.blits([(background, rect, rect) for rect in self._previous], False)
+
+    def end_frame(self) -> List[pygame.Rect]:
+        """
+        프레임 종료 - 화면에 반영할 영역 반환
+
+        Returns:
+            지난 프레임 영역 + 이번 프레임 영역 (많으면 하나로 합친 영역)
+        """
+        current = self._current
+        if len(current) > MAX_DIRTY_RECTS:
+            # 긴 뱀: 마디별 영역 대신 외접 사각형 하나로 지우고 갱신
+            current = [current[0].unionall(current[1:])]
+        dirty = self._previous + current
+        self._previous = current
+        self._current = []
+        self.full_redraw = False
+        return dirty
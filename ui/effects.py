@@ -2,15 +2,56 @@
 import pygame
 import random
 import math
-from typing import Tuple, List
+from typing import Dict, List, Tuple
+import numpy as np
 from constants import PARTICLE_LIFETIME, PARTICLE_COUNT, GRID_SIZE
 
 
+PARTICLE_CAPACITY = 16384  # 파티클 풀 최대 크기 (넘치는 파티클은 생성하지 않음)
+PARTICLE_GRAVITY = 0.2  # 프레임당 vy 증가량
+PARTICLE_FRICTION = 0.98  # 프레임당 속도 감쇠율
+ALPHA_BUCKETS = 16  # 투명도 단계 수 (원 이미지 캐시 키)
+COLOR_QUANTUM = 16  # 원 이미지 캐시 키의 색상 양자화 간격
+DISC_CACHE_SIZE = 2048  # 캐시에 보관할 최대 원 이미지 수
+
+_disc_cache: Dict[Tuple[int, int, Tuple[int, int, int]], pygame.Surface] = {}
+
+
+def get_disc(radius: int, alpha_bucket: int, color: Tuple[int, int, int]) -> pygame.Surface:
+    """
+    반투명 원 이미지 (크기/투명도 단계/색상별로 한 번만 그림)
+
+    Args:
+        radius: 반지름 (픽셀)
+        alpha_bucket: 투명도 단계 (0 ~ ALPHA_BUCKETS - 1)
+        color: 원 색상
+
+    Returns:
+        (radius * 2) 크기의 SRCALPHA Surface (공유되므로 수정 금지)
+    """
+    key = (radius, alpha_bucket, color)
+    disc = _disc_cache.get(key)
+    if disc is None:
+        if len(_disc_cache) >= DISC_CACHE_SIZE:
+            _disc_cache.clear()
+        alpha = 255 * (alpha_bucket + 1) // ALPHA_BUCKETS
+        disc = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(disc, (*color, alpha), (radius, radius), radius)
+        _disc_cache[key] = disc
+    return disc
+
+
+def _alpha_bucket(lifetime: int, max_lifetime: int) -> int:
+    """남은 수명 비율을 투명도 단계로 변환"""
+    return min(ALPHA_BUCKETS - 1, lifetime * ALPHA_BUCKETS // max_lifetime)
+
+
 class Particle:
-    """단일 파티클 클래스"""
+    """단일 파티클 클래스 (ParticleSystem은 같은 규칙을 배열로 처리)"""
     
     def __init__(self, x: float, y: float, color: Tuple[int, int, int], 
-                 velocity: Tuple[float, float], lifetime: int = PARTICLE_LIFETIME):
+                 velocity: Tuple[float, float], lifetime: int = PARTICLE_LIFETIME,
+                 rng=None):
         """
         파티클 초기화
         
@@ -19,6 +60,7 @@ class Particle:
             color: 파티클 색상
             velocity: 속도 (vx, vy)
             lifetime: 생존 시간 (프레임)
+            rng: 난수 생성기 (random.Random, None이면 random 모듈)
         """
         self.x = x
         self.y = y
@@ -26,7 +68,7 @@ class Particle:
         self.vx, self.vy = velocity
         self.lifetime = lifetime
         self.max_lifetime = lifetime
-        self.size = random.randint(2, 5)
+        self.size = (rng if rng is not None else random).randint(2, 5)
         
     def update(self) -> bool:
         """
@@ -40,11 +82,11 @@ class Particle:
         self.lifetime -= 1
         
         # 중력 효과
-        self.vy += 0.2
+        self.vy += PARTICLE_GRAVITY
         
         # 속도 감소 (마찰)
-        self.vx *= 0.98
-        self.vy *= 0.98
+        self.vx *= PARTICLE_FRICTION
+        self.vy *= PARTICLE_FRICTION
         
         return self.lifetime > 0
         
@@ -55,30 +97,88 @@ class Particle:
         Args:
             surface: 그릴 화면
         """
-        # 생존 시간에 따라 투명도 조정
-        alpha = int(255 * (self.lifetime / self.max_lifetime))
-        color_with_alpha = (*self.color, alpha)
-        
-        # 현재 크기 (시간에 따라 감소)
+        if self.lifetime <= 0:
+            return
+        # 생존 시간에 따라 크기/투명도 감소 (화면 밖은 blit이 잘라냄)
         current_size = max(1, int(self.size * (self.lifetime / self.max_lifetime)))
-        
-        # 원 그리기
-        try:
-            temp_surface = pygame.Surface((current_size * 2, current_size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(temp_surface, color_with_alpha, 
-                             (current_size, current_size), current_size)
-            surface.blit(temp_surface, (int(self.x - current_size), int(self.y - current_size)))
-        except:
-            # 화면 밖으로 나간 경우 무시
-            pass
+        color = tuple(c // COLOR_QUANTUM * COLOR_QUANTUM for c in self.color)
+        disc = get_disc(current_size, _alpha_bucket(self.lifetime, self.max_lifetime), color)
+        surface.blit(disc, (int(self.x - current_size), int(self.y - current_size)))
 
 
 class ParticleSystem:
-    """파티클 시스템 관리 클래스"""
+    """
+    파티클 시스템 관리 클래스
+
+    파티클을 객체 대신 고정 크기 NumPy 배열(위치/속도/수명/크기/색상)에
+    저장한다. 살아있는 파티클은 항상 앞쪽 [0, count)에 모여 있고, 갱신은
+    배열 연산 한 번, 그리기는 미리 그린 원 이미지의 blits() 한 번으로 끝난다.
+    """
     
-    def __init__(self):
-        """파티클 시스템 초기화"""
-        self.particles: List[Particle] = []
+    def __init__(self, rng=None, capacity: int = PARTICLE_CAPACITY):
+        """
+        파티클 시스템 초기화
+        
+        Args:
+            rng: 난수 생성기 (random.Random, None이면 random 모듈)
+            capacity: 최대 파티클 수
+        """
+        self.rng = rng if rng is not None else random
+        # 배열용 난수 생성기 (rng에서 시드를 받아 재현 가능)
+        self._np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        self.capacity = capacity
+        self.count = 0
+        self.position = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocity = np.zeros((capacity, 2), dtype=np.float32)
+        self.lifetime = np.zeros(capacity, dtype=np.int32)
+        self.max_lifetime = np.ones(capacity, dtype=np.int32)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros((capacity, 3), dtype=np.int32)
+
+    @property
+    def particles(self) -> List[Particle]:
+        """살아있는 파티클을 Particle 객체 목록으로 복사 (디버깅/호환용, 느림)"""
+        particles = []
+        for i in range(self.count):
+            particle = Particle(float(self.position[i, 0]), float(self.position[i, 1]),
+                                tuple(int(c) for c in self.color[i]),
+                                (float(self.velocity[i, 0]), float(self.velocity[i, 1])),
+                                int(self.max_lifetime[i]))
+            particle.lifetime = int(self.lifetime[i])
+            particle.size = int(self.size[i])
+            particles.append(particle)
+        return particles
+
+    def _spawn(self, position: Tuple[int, int], velocity: np.ndarray, color,
+               lifetime: int) -> None:
+        """
+        풀에 파티클 추가 (남은 공간만큼만)
+
+        Args:
+            position: 위치 (그리드 좌표, 칸 중앙에서 생성)
+            velocity: (n, 2) 속도 배열
+            color: (3,) 또는 (n, 3) 색상
+            lifetime: 생존 시간 (프레임)
+        """
+        n = min(len(velocity), self.capacity - self.count)
+        if n <= 0:
+            return
+        start, end = self.count, self.count + n
+        x, y = position
+        self.position[start:end] = (x * GRID_SIZE + GRID_SIZE // 2, y * GRID_SIZE + GRID_SIZE // 2)
+        self.velocity[start:end] = velocity[:n]
+        self.lifetime[start:end] = lifetime
+        self.max_lifetime[start:end] = lifetime
+        self.size[start:end] = self._np_rng.integers(2, 6, n)
+        color = np.asarray(color)
+        self.color[start:end] = color[:n] if color.ndim == 2 else color
+        self.count = end
+
+    def _radial_velocity(self, count: int, min_speed: float, max_speed: float) -> np.ndarray:
+        """임의 방향, 임의 속력의 (count, 2) 속도 배열"""
+        angle = self._np_rng.uniform(0, 2 * math.pi, count)
+        speed = self._np_rng.uniform(min_speed, max_speed, count)
+        return np.column_stack((np.cos(angle) * speed, np.sin(angle) * speed))
         
     def create_explosion(self, position: Tuple[int, int], color: Tuple[int, int, int], 
                         count: int = PARTICLE_COUNT) -> None:
@@ -90,24 +190,10 @@ class ParticleSystem:
             color: 파티클 색상
             count: 파티클 수
         """
-        x, y = position
-        center_x = x * GRID_SIZE + GRID_SIZE // 2
-        center_y = y * GRID_SIZE + GRID_SIZE // 2
-        
-        for _ in range(count):
-            # 랜덤한 방향과 속도
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 4)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            
-            # 색상 변형
-            color_variation = tuple(
-                max(0, min(255, c + random.randint(-30, 30))) for c in color
-            )
-            
-            particle = Particle(center_x, center_y, color_variation, (vx, vy))
-            self.particles.append(particle)
+        # 랜덤한 방향과 속도, 색상 변형
+        velocity = self._radial_velocity(count, 1, 4)
+        colors = np.clip(np.asarray(color) + self._np_rng.integers(-30, 31, (count, 3)), 0, 255)
+        self._spawn(position, velocity, colors, PARTICLE_LIFETIME)
             
     def create_glow(self, position: Tuple[int, int], color: Tuple[int, int, int],
                     count: int = 5) -> None:
@@ -119,21 +205,13 @@ class ParticleSystem:
             color: 파티클 색상
             count: 파티클 수
         """
-        x, y = position
-        center_x = x * GRID_SIZE + GRID_SIZE // 2
-        center_y = y * GRID_SIZE + GRID_SIZE // 2
+        # 느린 속도로 위로 떠오름
+        velocity = np.column_stack((self._np_rng.uniform(-0.5, 0.5, count),
+                                    self._np_rng.uniform(-2, -0.5, count)))
         
-        for _ in range(count):
-            # 느린 속도로 위로 떠오름
-            vx = random.uniform(-0.5, 0.5)
-            vy = random.uniform(-2, -0.5)
-            
-            # 밝은 색상
-            bright_color = tuple(min(255, c + 50) for c in color)
-            
-            particle = Particle(center_x, center_y, bright_color, (vx, vy), 
-                              lifetime=PARTICLE_LIFETIME * 2)
-            self.particles.append(particle)
+        # 밝은 색상
+        bright_color = tuple(min(255, c + 50) for c in color)
+        self._spawn(position, velocity, bright_color, PARTICLE_LIFETIME * 2)
             
     def create_trail(self, position: Tuple[int, int], color: Tuple[int, int, int]) -> None:
         """
@@ -143,18 +221,9 @@ class ParticleSystem:
             position: 위치 (그리드 좌표)
             color: 파티클 색상
         """
-        x, y = position
-        center_x = x * GRID_SIZE + GRID_SIZE // 2
-        center_y = y * GRID_SIZE + GRID_SIZE // 2
-        
         # 작은 파티클 1-2개
-        for _ in range(random.randint(1, 2)):
-            vx = random.uniform(-0.5, 0.5)
-            vy = random.uniform(-0.5, 0.5)
-            
-            particle = Particle(center_x, center_y, color, (vx, vy), 
-                              lifetime=PARTICLE_LIFETIME // 2)
-            self.particles.append(particle)
+        velocity = self._np_rng.uniform(-0.5, 0.5, (int(self._np_rng.integers(1, 3)), 2))
+        self._spawn(position, velocity, color, PARTICLE_LIFETIME // 2)
             
     def create_sparkle(self, position: Tuple[int, int], color: Tuple[int, int, int]) -> None:
         """
@@ -164,28 +233,34 @@ class ParticleSystem:
             position: 위치 (그리드 좌표)
             color: 파티클 색상
         """
-        x, y = position
-        center_x = x * GRID_SIZE + GRID_SIZE // 2
-        center_y = y * GRID_SIZE + GRID_SIZE // 2
-        
-        # 작은 파티클들이 사방으로
-        for _ in range(3):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(0.5, 1.5)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            
-            # 노란색/흰색 계열
-            sparkle_color = (255, 255, random.randint(200, 255))
-            
-            particle = Particle(center_x, center_y, sparkle_color, (vx, vy),
-                              lifetime=PARTICLE_LIFETIME // 3)
-            self.particles.append(particle)
+        # 작은 파티클들이 사방으로, 노란색/흰색 계열
+        velocity = self._radial_velocity(3, 0.5, 1.5)
+        colors = np.empty((3, 3), dtype=np.int32)
+        colors[:, :2] = 255
+        colors[:, 2] = self._np_rng.integers(200, 256, 3)
+        self._spawn(position, velocity, colors, PARTICLE_LIFETIME // 3)
             
     def update(self) -> None:
-        """모든 파티클 업데이트"""
-        # 살아있는 파티클만 유지
-        self.particles = [p for p in self.particles if p.update()]
+        """모든 파티클 업데이트 (이동/중력/마찰 후 죽은 파티클을 앞으로 압축)"""
+        n = self.count
+        if n == 0:
+            return
+        position = self.position[:n]
+        velocity = self.velocity[:n]
+        position += velocity
+        self.lifetime[:n] -= 1
+        velocity[:, 1] += PARTICLE_GRAVITY
+        velocity *= PARTICLE_FRICTION
+
+        alive = self.lifetime[:n] > 0
+        if alive.all():
+            return
+        # 살아있는 파티클만 유지 (순서 보존)
+        alive_count = int(alive.sum())
+        for array in (self.position, self.velocity, self.lifetime,
+                      self.max_lifetime, self.size, self.color):
+            array[:alive_count] = array[:n][alive]
+        self.count = alive_count
         
     def draw(self, surface: pygame.Surface) -> None:
         """
@@ -194,16 +269,33 @@ class ParticleSystem:
         Args:
             surface: 그릴 화면
         """
-        for particle in self.particles:
-            particle.draw(surface)
+        n = self.count
+        if n == 0:
+            return
+        lifetime = self.lifetime[:n]
+        max_lifetime = self.max_lifetime[:n]
+        radius = np.maximum(1, self.size[:n] * lifetime // max_lifetime)
+        alpha = np.minimum(ALPHA_BUCKETS - 1, lifetime * ALPHA_BUCKETS // max_lifetime)
+        color = self.color[:n] // COLOR_QUANTUM
+
+        # (반지름, 투명도, 색상)을 정수 키 하나로 묶어 고유한 원 이미지만 조회
+        levels = 256 // COLOR_QUANTUM
+        keys = ((radius * ALPHA_BUCKETS + alpha) * levels + color[:, 0]) * levels + color[:, 1]
+        keys = keys * levels + color[:, 2]
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        discs = [get_disc(int(radius[i]), int(alpha[i]),
+                          tuple(int(c) * COLOR_QUANTUM for c in color[i])) for i in first]
+
+        topleft = (self.position[:n] - radius[:, None]).astype(np.int32).tolist()
+        surface.blits(list(zip(map(discs.__getitem__, inverse.tolist()), topleft)), False)
             
     def clear(self) -> None:
         """모든 파티클 제거"""
-        self.particles.clear()
+        self.count = 0
         
     def get_particle_count(self) -> int:
         """현재 파티클 수 반환"""
-        return len(self.particles)
+        return self.count
 
 
 class AnimationEffect:
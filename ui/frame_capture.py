@@ -0,0 +1,214 @@
+"""오프스크린 프레임 캡처 (PNG 시퀀스 / raw RGB / Y4M 파일로 내보내기)"""
+import os
+import queue
+import threading
+from typing import Optional
+import numpy as np
+import pygame
+
+
+CAPTURE_QUEUE_SIZE = 8  # 쓰기 대기 중인 최대 프레임 수
+PNG_NAME_FORMAT = 'frame_{:06d}.png'
+
+
+class PngSequenceSink:
+    """프레임을 폴더에 번호 붙은 PNG 파일로 저장"""
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: 저장할 폴더 (없으면 생성)
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.index = 0
+
+    def write(self, frame: np.ndarray) -> None:
+        """
+        프레임 한 장 저장
+
+        Args:
+            frame: (높이, 너비, 3) uint8 RGB 배열
+        """
+        surface = pygame.surfarray.make_surface(frame.transpose(1, 0, 2))
+        pygame.image.save(surface, os.path.join(self.directory, PNG_NAME_FORMAT.format(self.index)))
+        self.index += 1
+
+    def close(self) -> None:
+        pass
+
+
+class RawRGBSink:
+    """프레임을 헤더 없는 RGB24 스트림으로 저장 (ffmpeg -f rawvideo 입력용)"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 저장할 파일 경로
+        """
+        self._file = open(path, 'wb')
+
+    def write(self, frame: np.ndarray) -> None:
+        """프레임 한 장 이어 쓰기 ((높이, 너비, 3) uint8 RGB 배열)"""
+        self._file.write(frame.data)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class Y4MSink:
+    """프레임을 YUV4MPEG2 (4:4:4, BT.601 limited range) 스트림으로 저장"""
+
+    def __init__(self, path: str, fps: int):
+        """
+        Args:
+            path: 저장할 파일 경로
+            fps: 초당 프레임 수 (헤더에 기록)
+        """
+        self._file = open(path, 'wb')
+        self.fps = fps
+        self._header_written = False
+
+    def write(self, frame: np.ndarray) -> None:
+        """프레임 한 장을 YUV 평면으로 변환해 이어 쓰기 ((높이, 너비, 3) uint8 RGB 배열)"""
+        if not self._header_written:
+            height, width = frame.shape[:2]
+            self._file.write(f'YUV4MPEG2 W{width} H{height} F{self.fps}:1 Ip A1:1 C444\n'.encode())
+            self._header_written = True
+
+        rgb = frame.astype(np.float32)
+        r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+        y = 16 + (65.481 * r + 128.553 * g + 24.966 * b) / 255
+        u = 128 + (-37.797 * r - 74.203 * g + 112.0 * b) / 255
+        v = 128 + (112.0 * r - 93.786 * g - 18.214 * b) / 255
+        self._file.write(b'FRAME\n')
+        for plane in (y, u, v):
+            self._file.write(np.rint(plane).astype(np.uint8).tobytes())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def open_frame_sink(output: str, fps: int):
+    """
+    출력 경로에 맞는 저장 방식 선택
+
+    Args:
+        output: '.y4m' 파일, '.rgb'/'.raw' 파일, 그 외는 PNG를 저장할 폴더
+        fps: 초당 프레임 수
+
+    Returns:
+        write(frame)/close()를 가진 저장 객체
+    """
+    extension = os.path.splitext(output)[1].lower()
+    if extension == '.y4m':
+        return Y4MSink(output, fps)
+    if extension in ('.rgb', '.raw'):
+        return RawRGBSink(output)
+    return PngSequenceSink(output)
+
+
+class FrameCapture:
+    """
+    화면 Surface를 프레임마다 복사해 백그라운드 스레드가 파일로 쓰는 캡처기
+
+    capture()는 pixels3d 뷰(복사 없음)에서 미리 할당해 둔 프레임 버퍼로
+    한 번 복사한 뒤 큐에 넣고 바로 돌아온다. 인코딩/디스크 쓰기는 모두 쓰기
+    스레드에서 일어나므로 렌더링 루프는 파일 I/O를 기다리지 않는다. 큐가
+    가득 차면 drop_frames 설정에 따라 빈 버퍼가 생길 때까지 기다리거나
+    해당 프레임을 버린다.
+    """
+
+    def __init__(self, output: str, fps: int = 60, queue_size: int = CAPTURE_QUEUE_SIZE,
+                 drop_frames: bool = False):
+        """
+        캡처 시작 (쓰기 스레드 생성)
+
+        Args:
+            output: 출력 경로 (open_frame_sink() 참고)
+            fps: 초당 프레임 수 (Y4M 헤더용)
+            queue_size: 쓰기 대기 최대 프레임 수 (버퍼 수)
+            drop_frames: 큐가 가득 차면 기다리지 않고 프레임을 버릴지 여부
+        """
+        self.output = output
+        self.drop_frames = drop_frames
+        self.frames_captured = 0
+        self.frames_dropped = 0
+        self._sink = open_frame_sink(output, fps)
+        self._pending: queue.Queue = queue.Queue(queue_size)
+        self._free: queue.Queue = queue.Queue()
+        self._buffers_allocated = 0
+        self._queue_size = queue_size
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._write_loop, name='frame-capture', daemon=True)
+        self._thread.start()
+
+    def _acquire_buffer(self, shape) -> Optional[np.ndarray]:
+        """재사용할 프레임 버퍼 (모두 사용 중이면 정책에 따라 대기 또는 None)"""
+        try:
+            buffer = self._free.get_nowait()
+        except queue.Empty:
+            if self._buffers_allocated <= self._queue_size:
+                self._buffers_allocated += 1
+                return np.empty(shape, dtype=np.uint8)
+            if self.drop_frames:
+                return None
+            buffer = self._free.get()
+        if buffer.shape != shape:
+            buffer = np.empty(shape, dtype=np.uint8)
+        return buffer
+
+    def capture(self, surface: pygame.Surface) -> bool:
+        """
+        현재 화면을 한 프레임으로 캡처
+
+        Args:
+            surface: 캡처할 Surface (24/32비트)
+
+        Returns:
+            큐에 넣었으면 True, 버렸으면 False
+        """
+        if self._error is not None:
+            raise RuntimeError(f"frame writer failed: {self._error}") from self._error
+        width, height = surface.get_size()
+        buffer = self._acquire_buffer((height, width, 3))
+        if buffer is None:
+            self.frames_dropped += 1
+            return False
+
+        pixels = pygame.surfarray.pixels3d(surface)  # (너비, 높이, 3) 뷰
+        try:
+            np.copyto(buffer, pixels.transpose(1, 0, 2))
+        finally:
+            del pixels  # Surface 잠금 해제
+        self._pending.put(buffer)
+        self.frames_captured += 1
+        return True
+
+    def _write_loop(self) -> None:
+        """쓰기 스레드: 큐의 프레임을 순서대로 저장하고 버퍼를 돌려줌"""
+        while True:
+            buffer = self._pending.get()
+            if buffer is None:
+                break
+            if self._error is None:
+                try:
+                    self._sink.write(buffer)
+                except Exception as error:  # 오류는 다음 capture()/close()에서 알림
+                    self._error = error
+            self._free.put(buffer)
+
+    def close(self) -> None:
+        """남은 프레임을 모두 쓰고 파일을 닫음 (쓰기 오류가 있었으면 예외 발생)"""
+        if self._thread.is_alive():
+            self._pending.put(None)
+            self._thread.join()
+            self._sink.close()
+        if self._error is not None:
+            raise RuntimeError(f"frame writer failed: {self._error}") from self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
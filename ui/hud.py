@@ -1,267 +1,296 @@
 """UI 렌더링 클래스"""
+from typing import Callable, Dict, List, Optional, Tuple
 import pygame
 from constants import *
+from ui.sprite_atlas import COMBO_PULSE_PERIOD, COMBO_PULSE_STEPS, pulse_index
+from ui.text_cache import get_font, text_cache
+
+
+class InfoField:
+    """정보 패널의 텍스트 항목 하나 (값이 바뀔 때만 다시 렌더링)"""
+
+    def __init__(self, font: pygame.font.Font, position: Tuple[int, int],
+                 color: Tuple[int, int, int]):
+        """
+        항목 초기화
+
+        Args:
+            font: 폰트
+            position: 패널 안에서의 위치 (왼쪽 위)
+            color: 기본 글자 색상
+        """
+        self.font = font
+        self.position = position
+        self.color = color
+        self._value: Optional[Tuple[str, Tuple[int, int, int]]] = None
+        self.surface: Optional[pygame.Surface] = None
+
+    def set(self, text: str, color: Optional[Tuple[int, int, int]] = None) -> bool:
+        """
+        표시할 값 설정
+
+        Args:
+            text: 표시할 문자열 (빈 문자열이면 표시 안 함)
+            color: 글자 색상 (None이면 기본 색상)
+
+        Returns:
+            값이 바뀌어 다시 렌더링했으면 True
+        """
+        value = (text, color or self.color)
+        if value == self._value:
+            return False
+        self._value = value
+        self.surface = text_cache.render(self.font, text, value[1]) if text else None
+        return True
 
 
 class UI:
     def __init__(self, screen):
         """UI 초기화"""
         self.screen = screen
-        self.font_large = pygame.font.Font(None, 74)
-        self.font_medium = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 32)
+        self.font_large = get_font(74)
+        self.font_medium = get_font(48)
+        self.font_small = get_font(32)
+        # 오버레이 이름 -> (입력 키, 미리 합성한 Surface) - 입력이 바뀔 때만 다시 그림
+        self._overlays: Dict[str, Tuple[tuple, pygame.Surface]] = {}
+        # 정보 패널 항목 (점수, 최고 점수, 길이, 속도, 난이도, Portal, Sound, Music)
+        self._panel_fields = [
+            InfoField(self.font_small, (10, 5), WHITE),
+            InfoField(self.font_small, (180, 5), YELLOW),
+            InfoField(self.font_small, (340, 5), WHITE),
+            InfoField(self.font_small, (450, 5), WHITE),
+            InfoField(self.font_small, (540, 5), WHITE),
+            InfoField(self.font_small, (610, 5), GREEN),
+            InfoField(self.font_small, (650, 5), GREEN),
+            InfoField(self.font_small, (680, 5), GREEN),
+        ]
+        self._panel: Optional[pygame.Surface] = None
+        self._combo_palette: Optional[List[pygame.Surface]] = None
     
     def draw_info_panel(self, score, high_score, snake_length, speed, sound_on, music_on, combo_active, difficulty='normal', portal_mode=False):
-        """게임 정보 패널 그리기"""
-        # 패널 배경
-        panel_rect = pygame.Rect(0, 0, WINDOW_WIDTH, INFO_PANEL_HEIGHT)
-        pygame.draw.rect(self.screen, DARK_GRAY, panel_rect)
-        
-        # 경계선
-        pygame.draw.line(self.screen, WHITE, 
-                        (0, INFO_PANEL_HEIGHT), 
-                        (WINDOW_WIDTH, INFO_PANEL_HEIGHT), 2)
-        
-        # 점수 표시
-        score_text = self.font_small.render(f"Score: {score}", True, WHITE)
-        self.screen.blit(score_text, (10, 5))
-        
-        # 최고 점수 표시
-        high_score_text = self.font_small.render(f"High: {high_score}", True, YELLOW)
-        self.screen.blit(high_score_text, (180, 5))
-        
-        # 뱀 길이 표시
-        length_text = self.font_small.render(f"Len: {snake_length}", True, WHITE)
-        self.screen.blit(length_text, (340, 5))
-        
-        # 속도 표시
-        speed_text = self.font_small.render(f"Spd: {speed}", True, WHITE)
-        self.screen.blit(speed_text, (450, 5))
-        
-        # 난이도 표시
+        """
+        게임 정보 패널 그리기
+
+        값이 바뀐 항목만 다시 렌더링해 패널 이미지에 합성하고, 화면에는
+        패널 이미지 한 장(+ 콤보 표시)만 blit한다.
+        """
+        # 난이도 표시 색상
         diff_colors = {'easy': GREEN, 'normal': YELLOW, 'hard': RED}
-        diff_color = diff_colors.get(difficulty, WHITE)
-        diff_text = self.font_small.render(f"[{difficulty[0].upper()}]", True, diff_color)
-        self.screen.blit(diff_text, (540, 5))
-        
-        # 포탈 모드 표시
-        portal_status = "P" if portal_mode else ""
-        if portal_status:
-            portal_text = self.font_small.render(portal_status, True, GREEN)
-            self.screen.blit(portal_text, (610, 5))
-        
-        # Sound/Music 상태 표시
-        sound_status = "S" if sound_on else ""
-        if sound_status:
-            sound_text = self.font_small.render(sound_status, True, GREEN)
-            self.screen.blit(sound_text, (650, 5))
-        
-        music_status = "M" if music_on else ""
-        if music_status:
-            music_text = self.font_small.render(music_status, True, GREEN)
-            self.screen.blit(music_text, (680, 5))
+        values = (
+            f"Score: {score}",
+            f"High: {high_score}",
+            f"Len: {snake_length}",
+            f"Spd: {speed}",
+            (f"[{difficulty[0].upper()}]", diff_colors.get(difficulty, WHITE)),
+            "P" if portal_mode else "",
+            "S" if sound_on else "",
+            "M" if music_on else "",
+        )
+        changed = False
+        for field, value in zip(self._panel_fields, values):
+            text, color = value if isinstance(value, tuple) else (value, None)
+            changed |= field.set(text, color)
+        if changed or self._panel is None:
+            self._panel = self._render_panel()
+        self.screen.blit(self._panel, (0, 0))
         
-        # COMBO 활성화 표시 (반짝이는 효과)
+        # COMBO 활성화 표시 (반짝이는 효과 - 미리 그린 색상 단계 중 하나)
         if combo_active:
-            # 빠른 펄스로 반짝임 (0.3초 주기)
-            pulse = abs(pygame.time.get_ticks() % 300 - 150) / 150.0
-            # 주황색과 노란색 사이를 진동
-            r = int(255)
-            g = int(165 + 90 * pulse)  # 165 ~ 255
-            b = int(0)
-            combo_color = (r, g, b)
-            combo_text = self.font_medium.render("COMBO!", True, combo_color)
+            if self._combo_palette is None:
+                self._combo_palette = [self._render_combo(i / (COMBO_PULSE_STEPS - 1))
+                                       for i in range(COMBO_PULSE_STEPS)]
+            combo_text = self._combo_palette[pulse_index(pygame.time.get_ticks(), COMBO_PULSE_PERIOD,
+                                                         COMBO_PULSE_STEPS)]
             combo_rect = combo_text.get_rect(center=(WINDOW_WIDTH // 2, INFO_PANEL_HEIGHT // 2))
             self.screen.blit(combo_text, combo_rect)
+
+    def _render_panel(self) -> pygame.Surface:
+        """패널 배경 + 경계선 + 항목을 합성한 이미지"""
+        panel = pygame.Surface((WINDOW_WIDTH, INFO_PANEL_HEIGHT + 2))
+        if pygame.display.get_surface() is not None:
+            panel = panel.convert()
+        panel.fill(DARK_GRAY)
+        
+        # 경계선
+        pygame.draw.line(panel, WHITE, (0, INFO_PANEL_HEIGHT), (WINDOW_WIDTH, INFO_PANEL_HEIGHT), 2)
+        panel.blits([(field.surface, field.position) for field in self._panel_fields
+                     if field.surface is not None], False)
+        return panel
+
+    def _render_combo(self, pulse: float) -> pygame.Surface:
+        """콤보 표시 (주황색 ~ 노란색 사이 한 단계)"""
+        combo_color = (255, int(165 + 90 * pulse), 0)  # g: 165 ~ 255
+        return self.font_medium.render("COMBO!", True, combo_color)
     
+    def _overlay(self, name: str, key: tuple, alpha: int,
+                 build: Callable[[pygame.Surface], None]) -> pygame.Surface:
+        """
+        캐시된 오버레이 반환 (키가 바뀌었을 때만 다시 그림)
+
+        반투명 검은 배경 위에 글자를 합성한 결과를 premultiplied alpha로
+        보관하므로, BLEND_PREMULTIPLIED로 한 번 blit하면 배경을 어둡게 한 뒤
+        글자를 그리던 것과 같은 화면이 된다.
+
+        Args:
+            name: 오버레이 이름
+            key: 오버레이 내용을 결정하는 입력 (점수, 난이도 등)
+            alpha: 배경 어둡게 하기 정도 (0 ~ 255)
+            build: 오버레이 Surface에 글자를 그리는 함수
+
+        Returns:
+            창 크기의 SRCALPHA Surface
+        """
+        cached = self._overlays.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, alpha))
+        build(overlay)
+        if pygame.display.get_surface() is not None:
+            overlay = overlay.convert_alpha()
+        self._overlays[name] = (key, overlay)
+        return overlay
+
+    def _blit_overlay(self, overlay: pygame.Surface) -> None:
+        """캐시된 오버레이를 화면에 합성"""
+        self.screen.blit(overlay, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+
+    @staticmethod
+    def _blit_centered(surface: pygame.Surface, font: pygame.font.Font, text: str,
+                       color: Tuple[int, int, int], center_y: int) -> None:
+        """가로 중앙 정렬로 텍스트 그리기"""
+        rendered = text_cache.render(font, text, color)
+        surface.blit(rendered, rendered.get_rect(center=(WINDOW_WIDTH // 2, center_y)))
+
+    def _blit_lines(self, surface: pygame.Surface, lines, y_offset: int, line_height: int) -> None:
+        """(텍스트, 색상) 목록을 줄 간격에 맞춰 중앙 정렬로 그리기 (빈 줄은 건너뜀)"""
+        for text, color in lines:
+            if text:
+                self._blit_centered(surface, self.font_small, text, color, y_offset)
+            y_offset += line_height
+
     def draw_game_over_screen(self, score, high_score, food_eaten, play_time):
         """게임 오버 화면 그리기"""
-        # 반투명 오버레이
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        # "GAME OVER" 텍스트
-        game_over_text = self.font_large.render("GAME OVER", True, RED)
-        game_over_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, 150))
-        self.screen.blit(game_over_text, game_over_rect)
-        
-        # 최종 점수
-        score_text = self.font_medium.render(f"Final Score: {score}", True, WHITE)
-        score_rect = score_text.get_rect(center=(WINDOW_WIDTH // 2, 250))
-        self.screen.blit(score_text, score_rect)
-        
-        # 최고 점수 (0점보다 크고 최고점을 넘었을 때만 NEW HIGH SCORE 표시)
-        if score > high_score and score > 0:
-            high_text = self.font_small.render("NEW HIGH SCORE!", True, YELLOW)
-        else:
-            high_text = self.font_small.render(f"High Score: {high_score}", True, YELLOW)
-        high_rect = high_text.get_rect(center=(WINDOW_WIDTH // 2, 310))
-        self.screen.blit(high_text, high_rect)
-        
-        # 통계 정보
-        stats_y = 370
-        stats = [
-            f"Food Eaten: {food_eaten}",
-            f"Play Time: {play_time}s",
-        ]
-        
-        for stat in stats:
-            stat_text = self.font_small.render(stat, True, WHITE)
-            stat_rect = stat_text.get_rect(center=(WINDOW_WIDTH // 2, stats_y))
-            self.screen.blit(stat_text, stat_rect)
-            stats_y += 40
-        
-        # 재시작/종료 안내
-        restart_text = self.font_small.render("Press R to Restart or ESC to Quit", True, GREEN)
-        restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, 500))
-        self.screen.blit(restart_text, restart_rect)
+        def build(overlay):
+            # "GAME OVER" 텍스트
+            self._blit_centered(overlay, self.font_large, "GAME OVER", RED, 150)
+            
+            # 최종 점수
+            self._blit_centered(overlay, self.font_medium, f"Final Score: {score}", WHITE, 250)
+            
+            # 최고 점수 (0점보다 크고 최고점을 넘었을 때만 NEW HIGH SCORE 표시)
+            if score > high_score and score > 0:
+                high_text = "NEW HIGH SCORE!"
+            else:
+                high_text = f"High Score: {high_score}"
+            self._blit_centered(overlay, self.font_small, high_text, YELLOW, 310)
+            
+            # 통계 정보
+            stats = [
+                (f"Food Eaten: {food_eaten}", WHITE),
+                (f"Play Time: {play_time}s", WHITE),
+            ]
+            self._blit_lines(overlay, stats, 370, 40)
+            
+            # 재시작/종료 안내
+            self._blit_centered(overlay, self.font_small, "Press R to Restart or ESC to Quit", GREEN, 500)
+
+        key = (score, high_score, food_eaten, play_time)
+        self._blit_overlay(self._overlay('game_over', key, 200, build))
     
     def draw_pause_screen(self):
         """일시정지 화면 그리기"""
-        # 반투명 오버레이
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        # "PAUSED" 텍스트
-        paused_text = self.font_large.render("PAUSED", True, YELLOW)
-        paused_rect = paused_text.get_rect(center=(WINDOW_WIDTH // 2, 80))
-        self.screen.blit(paused_text, paused_rect)
-        
-        # 조작법
-        y_offset = 140
-        line_height = 28
-        
-        instructions = [
-            ("Controls:", WHITE),
-            ("Arrow Keys - Move Snake", GREEN),
-            ("SPACE - Pause/Resume", GREEN),
-            ("D - Change Difficulty", GREEN),
-            ("P - Toggle Portal Mode", GREEN),
-            ("S/M - Sound/Music", GREEN),
-            ("", WHITE),
-            ("Game Features:", WHITE),
-            ("Golden Apple (Gold) - 50 pts", GOLD),
-            ("Normal Food (Red) - 10 pts", RED),
-            ("Combo (10s) - +5 bonus", YELLOW),
-            ("Portal Mode - Pass walls", GREEN),
-            ("Obstacles (Gray) - Game Over", GRAY),
-        ]
-        
-        for text, color in instructions:
-            if text:
-                inst_text = self.font_small.render(text, True, color)
-                inst_rect = inst_text.get_rect(center=(WINDOW_WIDTH // 2, y_offset))
-                self.screen.blit(inst_text, inst_rect)
-            y_offset += line_height
-        
-        # 재개 안내
-        continue_text = self.font_medium.render("Press SPACE to Continue", True, WHITE)
-        continue_rect = continue_text.get_rect(center=(WINDOW_WIDTH // 2, 580))
-        self.screen.blit(continue_text, continue_rect)
+        def build(overlay):
+            # "PAUSED" 텍스트
+            self._blit_centered(overlay, self.font_large, "PAUSED", YELLOW, 80)
+            
+            # 조작법
+            instructions = [
+                ("Controls:", WHITE),
+                ("Arrow Keys - Move Snake", GREEN),
+                ("SPACE - Pause/Resume", GREEN),
+                ("D - Change Difficulty", GREEN),
+                ("P - Toggle Portal Mode", GREEN),
+                ("S/M - Sound/Music", GREEN),
+                ("", WHITE),
+                ("Game Features:", WHITE),
+                ("Golden Apple (Gold) - 50 pts", GOLD),
+                ("Normal Food (Red) - 10 pts", RED),
+                ("Combo (10s) - +5 bonus", YELLOW),
+                ("Portal Mode - Pass walls", GREEN),
+                ("Obstacles (Gray) - Game Over", GRAY),
+            ]
+            self._blit_lines(overlay, instructions, 140, 28)
+            
+            # 재개 안내
+            self._blit_centered(overlay, self.font_medium, "Press SPACE to Continue", WHITE, 580)
+
+        self._blit_overlay(self._overlay('pause', (), 200, build))
     
     def draw_countdown(self, countdown_value):
         """카운트다운 화면 그리기"""
-        # 반투명 오버레이
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(150)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        # 반투명 오버레이 (글자 없는 배경만 캐시)
+        self._blit_overlay(self._overlay('countdown', (), 150, lambda overlay: None))
         
-        # 카운트다운 숫자 (매우 크게)
+        # 카운트다운 숫자 (매우 크게) - 크기 펄스는 매 프레임 계산
         if countdown_value > 0:
-            # 숫자 크기를 더 크게
-            countdown_font = pygame.font.Font(None, 200)
-            
             # 펄스 효과 (반짝임)
             pulse = abs(pygame.time.get_ticks() % 500 - 250) / 250.0
             scale = 1.0 + 0.2 * pulse
-            font_size = int(200 * scale)
-            countdown_font = pygame.font.Font(None, font_size)
+            countdown_font = get_font(int(200 * scale))
             
             # 색상 바뀌어가며 표시 (3=초록, 2=노랑, 1=빨강)
             colors = {3: GREEN, 2: YELLOW, 1: RED}
             color = colors.get(countdown_value, WHITE)
             
-            countdown_text = countdown_font.render(str(countdown_value), True, color)
+            countdown_text = text_cache.render(countdown_font, str(countdown_value), color)
             countdown_rect = countdown_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
             self.screen.blit(countdown_text, countdown_rect)
         else:
             # "GO!" 표시
-            go_font = pygame.font.Font(None, 150)
-            go_text = go_font.render("GO!", True, GREEN)
-            go_rect = go_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
-            self.screen.blit(go_text, go_rect)
+            self._blit_centered(self.screen, get_font(150), "GO!", GREEN, WINDOW_HEIGHT // 2)
     
     def draw_start_screen(self, difficulty, portal_mode):
         """게임 시작 대기 화면 그리기"""
-        # 반투명 오버레이
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(220)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        # "SNAKE GAME" 타이틀
-        title_text = self.font_large.render("SNAKE GAME", True, GREEN)
-        title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 60))
-        self.screen.blit(title_text, title_rect)
-        
-        # 버전 정보
-        version_text = self.font_small.render("Version 3.0", True, YELLOW)
-        version_rect = version_text.get_rect(center=(WINDOW_WIDTH // 2, 110))
-        self.screen.blit(version_text, version_rect)
-        
-        # 현재 설정
-        y_offset = 160
-        line_height = 30
-        
-        diff_colors = {'easy': GREEN, 'normal': YELLOW, 'hard': RED}
-        diff_color = diff_colors.get(difficulty, WHITE)
-        settings = [
-            (f"Difficulty: {difficulty.upper()}", diff_color),
-            (f"Portal Mode: {'ON' if portal_mode else 'OFF'}", GREEN if portal_mode else RED),
-        ]
-        
-        for text, color in settings:
-            setting_text = self.font_small.render(text, True, color)
-            setting_rect = setting_text.get_rect(center=(WINDOW_WIDTH // 2, y_offset))
-            self.screen.blit(setting_text, setting_rect)
-            y_offset += line_height
-        
-        # 조작법 및 게임 설명
-        y_offset = 240
-        line_height = 28
-        
-        instructions = [
-            ("== Controls ==", WHITE),
-            ("Arrow Keys - Move Snake", GREEN),
-            ("SPACE - Start/Pause", GREEN),
-            ("D - Change Difficulty", GREEN),
-            ("P - Toggle Portal Mode", GREEN),
-            ("S/M - Sound/Music Toggle", GREEN),
-            ("", WHITE),
-            ("== Game Rules ==", WHITE),
-            ("Golden Apple (Gold) - 50 pts", GOLD),
-            ("Normal Food (Red) - 10 pts", RED),
-            ("Combo (10s) - +5 bonus", YELLOW),
-            ("Portal: Pass walls safely", GREEN),
-            ("Gray Obstacles (Hard) - Avoid!", GRAY),
-        ]
-        
-        for text, color in instructions:
-            if text:
-                inst_text = self.font_small.render(text, True, color)
-                inst_rect = inst_text.get_rect(center=(WINDOW_WIDTH // 2, y_offset))
-                self.screen.blit(inst_text, inst_rect)
-            y_offset += line_height
+        def build(overlay):
+            # "SNAKE GAME" 타이틀
+            self._blit_centered(overlay, self.font_large, "SNAKE GAME", GREEN, 60)
+            
+            # 버전 정보
+            self._blit_centered(overlay, self.font_small, "Version 3.0", YELLOW, 110)
+            
+            # 현재 설정
+            diff_colors = {'easy': GREEN, 'normal': YELLOW, 'hard': RED}
+            diff_color = diff_colors.get(difficulty, WHITE)
+            settings = [
+                (f"Difficulty: {difficulty.upper()}", diff_color),
+                (f"Portal Mode: {'ON' if portal_mode else 'OFF'}", GREEN if portal_mode else RED),
+            ]
+            self._blit_lines(overlay, settings, 160, 30)
+            
+            # 조작법 및 게임 설명
+            instructions = [
+                ("== Controls ==", WHITE),
+                ("Arrow Keys - Move Snake", GREEN),
+                ("SPACE - Start/Pause", GREEN),
+                ("D - Change Difficulty", GREEN),
+                ("P - Toggle Portal Mode", GREEN),
+                ("S/M - Sound/Music Toggle", GREEN),
+                ("", WHITE),
+                ("== Game Rules ==", WHITE),
+                ("Golden Apple (Gold) - 50 pts", GOLD),
+                ("Normal Food (Red) - 10 pts", RED),
+                ("Combo (10s) - +5 bonus", YELLOW),
+                ("Portal: Pass walls safely", GREEN),
+                ("Gray Obstacles (Hard) - Avoid!", GRAY),
+            ]
+            self._blit_lines(overlay, instructions, 240, 28)
+
+        self._blit_overlay(self._overlay('start', (difficulty, portal_mode), 220, build))
         
-        # 시작 안내 (반짝임 효과)
+        # 시작 안내 (반짝임 효과 - 매 프레임 그림)
         pulse = abs(pygame.time.get_ticks() % 1000 - 500) / 500.0
         alpha = int(150 + 105 * pulse)
         start_color = (alpha, alpha, alpha)
-        start_text = self.font_medium.render("Press SPACE to Start!", True, start_color)
-        start_rect = start_text.get_rect(center=(WINDOW_WIDTH // 2, 590))
-        self.screen.blit(start_text, start_rect)
+        self._blit_centered(self.screen, self.font_medium, "Press SPACE to Start!", start_color, 590)
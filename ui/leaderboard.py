@@ -8,6 +8,7 @@ from constants import (
     WINDOW_WIDTH, WINDOW_HEIGHT, WHITE, BLACK, 
     YELLOW, GREEN, GRAY, DARK_GRAY
 )
+from ui.text_cache import get_font, text_cache
 
 
 class LeaderboardEntry:
@@ -205,15 +206,15 @@ class LeaderboardUI:
         surface.fill(BLACK)
         
         # 타이틀
-        title_font = pygame.font.Font(None, 56)
-        title_text = title_font.render("HIGH SCORES", True, YELLOW)
+        title_font = get_font(56)
+        title_text = text_cache.render(title_font, "HIGH SCORES", YELLOW)
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 50))
         surface.blit(title_text, title_rect)
         
         # 필터 정보
-        filter_font = pygame.font.Font(None, 28)
+        filter_font = get_font(28)
         filter_text = f"Difficulty: {self.filter_difficulty or 'All'}  |  Mode: {self.filter_mode or 'All'}"
-        filter_render = filter_font.render(filter_text, True, GRAY)
+        filter_render = text_cache.render(filter_font, filter_text, GRAY)
         filter_rect = filter_render.get_rect(center=(WINDOW_WIDTH // 2, 100))
         surface.blit(filter_render, filter_rect)
         
@@ -224,13 +225,13 @@ class LeaderboardUI:
         
         if not top_scores:
             # 점수 없음
-            no_scores_font = pygame.font.Font(None, 36)
-            no_scores_text = no_scores_font.render("No scores yet!", True, GRAY)
+            no_scores_font = get_font(36)
+            no_scores_text = text_cache.render(no_scores_font, "No scores yet!", GRAY)
             no_scores_rect = no_scores_text.get_rect(center=(WINDOW_WIDTH // 2, 300))
             surface.blit(no_scores_text, no_scores_rect)
         else:
             # 테이블 헤더
-            header_font = pygame.font.Font(None, 28)
+            header_font = get_font(28)
             header_y = 150
             
             rank_x = 80
@@ -249,7 +250,7 @@ class LeaderboardUI:
             ]
             
             for header, x in headers:
-                header_text = header_font.render(header, True, YELLOW)
+                header_text = text_cache.render(header_font, header, YELLOW)
                 surface.blit(header_text, (x, header_y))
                 
             # 구분선
@@ -258,7 +259,7 @@ class LeaderboardUI:
                            (WINDOW_WIDTH - 50, header_y + 30), 2)
             
             # 항목들
-            item_font = pygame.font.Font(None, 24)
+            item_font = get_font(24)
             start_y = header_y + 50
             item_spacing = 40
             
@@ -276,29 +277,29 @@ class LeaderboardUI:
                     pygame.draw.rect(surface, GREEN, box_rect, 2)
                 
                 # 순위
-                rank_text = item_font.render(f"#{i + 1}", True, color)
+                rank_text = text_cache.render(item_font, f"#{i + 1}", color)
                 surface.blit(rank_text, (rank_x, y))
                 
                 # 이름
-                name_text = item_font.render(entry.name[:10], True, color)
+                name_text = text_cache.render(item_font, entry.name[:10], color)
                 surface.blit(name_text, (name_x, y))
                 
                 # 점수
-                score_text = item_font.render(str(entry.score), True, color)
+                score_text = text_cache.render(item_font, str(entry.score), color)
                 surface.blit(score_text, (score_x, y))
                 
                 # 난이도
-                diff_text = item_font.render(entry.difficulty[:6], True, color)
+                diff_text = text_cache.render(item_font, entry.difficulty[:6], color)
                 surface.blit(diff_text, (diff_x, y))
                 
                 # 모드
-                mode_text = item_font.render(entry.mode[:8], True, color)
+                mode_text = text_cache.render(item_font, entry.mode[:8], color)
                 surface.blit(mode_text, (mode_x, y))
         
         # 하단 안내
-        hint_font = pygame.font.Font(None, 24)
+        hint_font = get_font(24)
         hint_text = "Press ESC to return"
-        hint_render = hint_font.render(hint_text, True, GRAY)
+        hint_render = text_cache.render(hint_font, hint_text, GRAY)
         hint_rect = hint_render.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 40))
         surface.blit(hint_render, hint_rect)
         
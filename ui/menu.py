@@ -5,6 +5,7 @@ from constants import (
     WINDOW_WIDTH, WINDOW_HEIGHT, WHITE, BLACK, GREEN, 
     YELLOW, RED, GRAY, DARK_GRAY
 )
+from ui.text_cache import get_font, text_cache
 
 
 class MenuItem:
@@ -133,13 +134,13 @@ class Menu:
         surface.fill(BLACK)
         
         # 타이틀
-        title_font = pygame.font.Font(None, 64)
-        title_text = title_font.render(self.title, True, GREEN)
+        title_font = get_font(64)
+        title_text = text_cache.render(title_font, self.title, GREEN)
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 100))
         surface.blit(title_text, title_rect)
         
         # 메뉴 항목들
-        item_font = pygame.font.Font(None, 36)
+        item_font = get_font(36)
         start_y = 250
         item_spacing = 60
         
@@ -158,7 +159,7 @@ class Menu:
                 
                 # 선택 표시
                 marker = "► "
-                marker_text = item_font.render(marker, True, color)
+                marker_text = text_cache.render(item_font, marker, color)
                 marker_rect = marker_text.get_rect(right=WINDOW_WIDTH // 2 - 20, centery=y)
                 surface.blit(marker_text, marker_rect)
                 
@@ -176,14 +177,14 @@ class Menu:
                 color = WHITE
                 
             # 텍스트
-            text = item_font.render(item.text, True, color)
+            text = text_cache.render(item_font, item.text, color)
             text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, y))
             surface.blit(text, text_rect)
             
         # 하단 안내
-        hint_font = pygame.font.Font(None, 24)
+        hint_font = get_font(24)
         hint_text = "↑↓: Move  Enter: Select  ESC: Back"
-        hint_render = hint_font.render(hint_text, True, GRAY)
+        hint_render = text_cache.render(hint_font, hint_text, GRAY)
         hint_rect = hint_render.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 40))
         surface.blit(hint_render, hint_rect)
 
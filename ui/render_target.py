@@ -0,0 +1,121 @@
+"""해상도 독립 렌더 타깃 (논리 해상도로 그린 화면을 창 크기에 맞춰 확대)"""
+from typing import List, Optional, Sequence, Tuple
+import pygame
+from constants import WINDOW_WIDTH, WINDOW_HEIGHT, BLACK
+
+
+class RenderTarget:
+    """
+    논리 해상도 Surface와 실제 창 사이의 배율 변환
+
+    게임/UI는 항상 surface(보드 설정 크기)에 그리고, present()가 창에 옮긴다.
+    배율과 창 안의 위치(남는 부분은 검은 여백)는 창 크기가 바뀔 때만
+    계산한다. 정수 배율(기본)은 바뀐 영역만 확대해 부분 갱신할 수 있고,
+    smooth=True는 창에 꽉 차게 smoothscale하므로 매 프레임 전체를 옮긴다.
+    """
+
+    def __init__(self, window: pygame.Surface,
+                 logical_size: Tuple[int, int] = (WINDOW_WIDTH, WINDOW_HEIGHT),
+                 smooth: bool = False):
+        """
+        렌더 타깃 초기화
+
+        Args:
+            window: 실제 창 Surface (pygame.display.set_mode() 반환값)
+            logical_size: 논리 해상도 (게임이 그리는 크기)
+            smooth: True면 비율 유지 최대 크기로 smoothscale, False면 정수 배율 scale
+        """
+        self.logical_size = logical_size
+        self.smooth = smooth
+        self.surface = pygame.Surface(logical_size)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()  # 창 픽셀 포맷으로 맞춰 복사 비용 절감
+        self.window = window
+        self.scale = 1.0
+        self.rect = pygame.Rect((0, 0), logical_size)  # 창 안에서 화면이 차지하는 영역
+        self.resize(window)
+
+    def resize(self, window: pygame.Surface) -> None:
+        """
+        창 크기 변경 반영 (배율/위치 재계산, 여백을 검게 칠함)
+
+        Args:
+            window: 새 창 Surface
+        """
+        self.window = window
+        logical_width, logical_height = self.logical_size
+        window_width, window_height = window.get_size()
+        scale = min(window_width / logical_width, window_height / logical_height)
+        if not self.smooth:
+            scale = max(1, int(scale))  # 창이 논리 해상도보다 작으면 잘림
+        self.scale = scale
+        size = (round(logical_width * scale), round(logical_height * scale))
+        self.rect = pygame.Rect(((window_width - size[0]) // 2, (window_height - size[1]) // 2), size)
+        window.fill(BLACK)
+
+    @property
+    def is_identity(self) -> bool:
+        """배율 1 (확대 없이 복사만 하면 됨) 여부"""
+        return self.rect.size == tuple(self.logical_size)
+
+    def to_window(self, rect) -> pygame.Rect:
+        """
+        논리 좌표 영역을 창 좌표로 변환
+
+        Args:
+            rect: 논리 해상도 기준 영역
+
+        Returns:
+            창 기준 영역
+        """
+        rect = pygame.Rect(rect)
+        scale = self.scale
+        return pygame.Rect(self.rect.x + round(rect.x * scale), self.rect.y + round(rect.y * scale),
+                           round(rect.w * scale), round(rect.h * scale))
+
+    def to_logical(self, position: Tuple[int, int]) -> Tuple[int, int]:
+        """창 좌표(마우스 위치 등)를 논리 좌표로 변환"""
+        return (int((position[0] - self.rect.x) / self.scale),
+                int((position[1] - self.rect.y) / self.scale))
+
+    def present(self, dirty: Optional[Sequence[pygame.Rect]] = None) -> List[pygame.Rect]:
+        """
+        논리 화면을 창에 옮기고 디스플레이 갱신
+
+        Args:
+            dirty: 바뀐 영역 (논리 좌표, None이면 전체)
+
+        Returns:
+            갱신한 창 영역 목록
+        """
+        if dirty is None or self.smooth:
+            self._copy_full()
+            pygame.display.flip()
+            return [self.rect]
+
+        bounds = self.surface.get_rect()
+        areas = [rect.clip(bounds) for rect in dirty]
+        areas = [area for area in areas if area.w and area.h]
+        if self.is_identity:
+            self.window.blits([(self.surface, area.move(self.rect.topleft), area) for area in areas], False)
+            updated = [area.move(self.rect.topleft) for area in areas]
+        else:
+            updated = []
+            for area in areas:
+                target = self.to_window(area)
+                pygame.transform.scale(self.surface.subsurface(area), target.size,
+                                       self.window.subsurface(target))
+                updated.append(target)
+        pygame.display.update(updated)
+        return updated
+
+    def _copy_full(self) -> None:
+        """논리 화면 전체를 창 영역 크기로 옮김"""
+        if self.is_identity:
+            self.window.blit(self.surface, self.rect)
+            return
+        destination = self.window.subsurface(self.rect)
+        if self.smooth:
+            pygame.transform.smoothscale(self.surface, self.rect.size, destination)
+        else:
+            pygame.transform.scale(self.surface, self.rect.size, destination)
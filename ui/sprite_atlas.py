@@ -0,0 +1,178 @@
+"""스프라이트 아틀라스 (뱀 마디/먹이/파워업 이미지를 시작 시 한 번만 그려 둠)"""
+import math
+from typing import Dict, List, Optional, Tuple
+import pygame
+from constants import *
+
+
+COMBO_PULSE_STEPS = 16  # 콤보 반짝임 색상 단계 수
+COMBO_PULSE_PERIOD = 300  # 콤보 반짝임 주기 (ms)
+FOOD_PULSE_STEPS = 16  # 먹이 크기 펄스 단계 수
+FOOD_PULSE_PERIOD = 1000  # 먹이 펄스 주기 (ms)
+SLOW_MOTION_FRAMES = 60  # 시계 바늘 회전 프레임 수 (6도씩)
+INVINCIBLE_FRAMES = 180  # 별 회전 프레임 수 (2도씩)
+
+
+def pulse_index(ticks: int, period: int, steps: int) -> int:
+    """
+    시간에 따른 왕복 펄스(0.0 ~ 1.0)를 steps 단계로 양자화한 인덱스
+
+    Args:
+        ticks: 현재 시간 (ms)
+        period: 펄스 주기 (ms)
+        steps: 단계 수
+
+    Returns:
+        0 ~ steps - 1
+    """
+    half = period // 2
+    return (abs(ticks % period - half) * (steps - 1) + half // 2) // half
+
+
+def _combo_tint(base_color: Tuple[int, int, int], pulse: float, glow: int) -> Tuple[int, int, int]:
+    """콤보 반짝임 색상 (밝기 0.5 ~ 1.3 + 노란색 톤)"""
+    brightness = 0.5 + 0.8 * pulse
+    return (min(255, int(base_color[0] * brightness + glow * pulse)),
+            min(255, int(base_color[1] * brightness + glow * pulse)),
+            int(base_color[2] * brightness))
+
+
+def _rotate(angle: float) -> Tuple[float, float]:
+    """단위 벡터 (1, 0)을 angle도 회전한 (x, y)"""
+    radians = math.radians(angle)
+    return math.cos(radians), math.sin(radians)
+
+
+class SpriteAtlas:
+    """
+    게임 화면에 반복해서 그리는 타일 모음
+
+    뱀 머리/몸통(콤보 반짝임 단계별 색상 포함), 먹이 펄스 크기별 타일,
+    파워업 회전 프레임을 미리 만들어 두므로 그리기는 blit만 하면 된다.
+    """
+
+    def __init__(self, cell_size: int = GRID_SIZE):
+        """
+        아틀라스 생성 (pygame 초기화 이후 호출)
+
+        Args:
+            cell_size: 한 칸 크기 (픽셀)
+        """
+        self.cell_size = cell_size
+
+        # 뱀 마디: [콤보 아님] + [콤보 단계별]
+        self.head = self._solid_tile(LIGHT_GREEN)
+        self.body = self._solid_tile(DARK_GREEN)
+        self.combo_heads = [self._solid_tile(_combo_tint(LIGHT_GREEN, i / (COMBO_PULSE_STEPS - 1), 50))
+                            for i in range(COMBO_PULSE_STEPS)]
+        self.combo_bodies = [self._solid_tile(_combo_tint(DARK_GREEN, i / (COMBO_PULSE_STEPS - 1), 30))
+                             for i in range(COMBO_PULSE_STEPS)]
+
+        # 먹이: 펄스 단계별 (타일, 칸 안에서의 오프셋) - 같은 크기는 타일 공유
+        self.food: Dict[bool, List[Tuple[pygame.Surface, int]]] = {}
+        for golden, color in ((False, RED), (True, GOLD)):
+            tiles: Dict[int, pygame.Surface] = {}
+            frames = []
+            for i in range(FOOD_PULSE_STEPS):
+                size = int(cell_size * (0.8 + 0.2 * i / (FOOD_PULSE_STEPS - 1)))  # 80% ~ 100%
+                if size not in tiles:
+                    tiles[size] = self._solid_tile(color, size)
+                frames.append((tiles[size], (cell_size - size) // 2))
+            self.food[golden] = frames
+
+        # 파워업 회전 프레임
+        self.powerups: Dict[str, List[pygame.Surface]] = {
+            POWERUP_SPEED_BOOST: [self._render_speed_boost()],
+            POWERUP_SLOW_MOTION: [self._render_slow_motion(frame) for frame in range(SLOW_MOTION_FRAMES)],
+            POWERUP_INVINCIBLE: [self._render_invincible(frame) for frame in range(INVINCIBLE_FRAMES)],
+        }
+
+    def _solid_tile(self, color: Tuple[int, int, int], size: Optional[int] = None) -> pygame.Surface:
+        """단색 정사각형 타일"""
+        size = self.cell_size if size is None else size
+        tile = pygame.Surface((size, size))
+        tile.fill(color)
+        return self._optimize(tile)
+
+    def _shape_tile(self) -> pygame.Surface:
+        """투명 배경 타일 (파워업 모양용)"""
+        return pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
+
+    @staticmethod
+    def _optimize(tile: pygame.Surface) -> pygame.Surface:
+        """화면 픽셀 포맷으로 변환 (디스플레이가 있을 때만)"""
+        if pygame.display.get_surface() is None:
+            return tile
+        return tile.convert_alpha() if tile.get_flags() & pygame.SRCALPHA else tile.convert()
+
+    def _render_speed_boost(self) -> pygame.Surface:
+        """번개 모양 (마름모)"""
+        tile = self._shape_tile()
+        c = self.cell_size // 2
+        points = [
+            (c, c - self.cell_size // 2 + 2),
+            (c + self.cell_size // 4, c),
+            (c, c + self.cell_size // 2 - 2),
+            (c - self.cell_size // 4, c)
+        ]
+        pygame.draw.polygon(tile, POWERUP_COLORS[POWERUP_SPEED_BOOST], points)
+        return self._optimize(tile)
+
+    def _render_slow_motion(self, frame: int) -> pygame.Surface:
+        """시계 모양 (원 + 회전하는 바늘)"""
+        tile = self._shape_tile()
+        c = self.cell_size // 2
+        pygame.draw.circle(tile, POWERUP_COLORS[POWERUP_SLOW_MOTION], (c, c), self.cell_size // 3)
+        dx, dy = _rotate((frame * 6) % 360)
+        end = (c + int((self.cell_size // 4) * dx), c + int((self.cell_size // 4) * dy))
+        pygame.draw.line(tile, (255, 255, 255), (c, c), end, 2)
+        return self._optimize(tile)
+
+    def _render_invincible(self, frame: int) -> pygame.Surface:
+        """회전하는 별 모양"""
+        tile = self._shape_tile()
+        c = self.cell_size // 2
+        radius = self.cell_size // 2 - 2
+        points = []
+        for i in range(5):
+            dx, dy = _rotate(i * 144 - 90 + (frame * 2) % 360)
+            points.append((c + int(radius * dx), c + int(radius * dy)))
+        pygame.draw.polygon(tile, POWERUP_COLORS[POWERUP_INVINCIBLE], points)
+        return self._optimize(tile)
+
+    def segment_tiles(self, combo_active: bool, ticks: int) -> Tuple[pygame.Surface, pygame.Surface]:
+        """
+        이번 프레임의 (머리, 몸통) 타일
+
+        Args:
+            combo_active: 콤보 반짝임 여부
+            ticks: 현재 시간 (ms)
+        """
+        if not combo_active:
+            return self.head, self.body
+        index = pulse_index(ticks, COMBO_PULSE_PERIOD, COMBO_PULSE_STEPS)
+        return self.combo_heads[index], self.combo_bodies[index]
+
+    def food_tile(self, golden: bool, ticks: int) -> Tuple[pygame.Surface, int]:
+        """
+        이번 프레임의 먹이 타일
+
+        Args:
+            golden: Golden Apple 여부
+            ticks: 현재 시간 (ms)
+
+        Returns:
+            (타일, 칸 안에서의 오프셋)
+        """
+        return self.food[golden][pulse_index(ticks, FOOD_PULSE_PERIOD, FOOD_PULSE_STEPS)]
+
+    def powerup_tile(self, powerup_type: str, animation_frame: int) -> pygame.Surface:
+        """
+        파워업 회전 프레임
+
+        Args:
+            powerup_type: 파워업 종류
+            animation_frame: 애니메이션 프레임 번호
+        """
+        frames = self.powerups[powerup_type]
+        return frames[animation_frame % len(frames)]
@@ -0,0 +1,149 @@
+"""뱀 몸통 일괄 렌더링 (Surface.blits 시퀀스 / surfarray 채우기)"""
+from itertools import chain, repeat
+from typing import Iterable, List, Optional, Tuple
+import numpy as np
+import pygame
+from constants import GRID_SIZE
+
+
+SURFARRAY_MIN_SEGMENTS = 2048  # 이 길이 이상이면 surfarray 채우기 경로 사용
+
+
+class SnakeSpriteBatch:
+    """
+    뱀 마디 좌표를 NumPy 배열로 보관하며 이동에 맞춰 점진적으로 갱신
+
+    틱마다 advance()가 배열을 한 칸 밀고 새 머리를 넣으므로 몸통 전체를
+    다시 만들지 않는다. 프레임마다 보간 좌표는 벡터 연산으로 계산하고,
+    그리기는 Surface.blits() 한 번 또는 surfarray 블록 채우기 한 번으로 끝난다.
+    """
+
+    def __init__(self, cell_size: int = GRID_SIZE):
+        """
+        스프라이트 배치 초기화
+
+        Args:
+            cell_size: 한 칸 크기 (픽셀)
+        """
+        self.cell_size = cell_size
+        self._cells = np.empty((0, 2), dtype=np.int32)  # 현재 틱 칸 좌표 (머리부터)
+        self._previous = self._cells  # 직전 틱 칸 좌표 (보간용, 같은 길이)
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def reset(self, body: Iterable[Tuple[int, int]]) -> None:
+        """
+        몸통 전체로 다시 구성 (보간 없음)
+
+        Args:
+            body: 뱀 몸통 좌표 (머리부터)
+        """
+        self._cells = np.array(list(body), dtype=np.int32).reshape(-1, 2)
+        self._previous = self._cells
+
+    def matches(self, body) -> bool:
+        """배치가 몸통과 일치하는지 확인 (길이/머리/꼬리 비교, O(1))"""
+        n = len(self._cells)
+        return n == len(body) and n > 0 and \
+            tuple(self._cells[0]) == body[0] and tuple(self._cells[-1]) == body[-1]
+
+    def advance(self, body) -> None:
+        """
+        한 틱 이동 반영 (머리 추가, 성장하지 않았으면 꼬리 제거)
+
+        직전 상태에서 한 칸 이동한 모양이 아니면 reset()으로 다시 구성한다.
+
+        Args:
+            body: 이동 후 뱀 몸통 좌표 (머리부터)
+        """
+        cells = self._cells
+        n, m = len(cells), len(body)
+        if n == 0 or m not in (n, n + 1) or tuple(cells[0]) != body[1]:
+            self.reset(body)
+            return
+
+        moved = np.empty((m, 2), dtype=np.int32)
+        moved[0] = body[0]
+        moved[1:] = cells[:m - 1]
+        if tuple(moved[-1]) != body[-1]:
+            self.reset(body)
+            return
+
+        # 성장으로 새로 생긴 꼬리는 제자리 (직전 꼬리 위치 반복)
+        self._previous = cells if m == n else np.vstack((cells, cells[-1:]))
+        self._cells = moved
+
+    def pixel_positions(self, interpolation: float = 1.0) -> np.ndarray:
+        """
+        마디별 픽셀 좌표 (직전 틱 -> 현재 틱 보간)
+
+        Args:
+            interpolation: 보간 비율 (1.0이면 현재 칸 위치)
+
+        Returns:
+            (N, 2) 정수 배열
+        """
+        cells = self._cells
+        if interpolation >= 1.0:
+            return cells * self.cell_size
+        delta = cells - self._previous
+        # Portal로 반대편에 넘어간 마디는 보간하지 않음
+        moving = (np.abs(delta).max(axis=1) <= 1)[:, None]
+        back = (1.0 - interpolation) * self.cell_size
+        return np.rint(cells * self.cell_size - delta * moving * back).astype(np.int32)
+
+    def blit_sequence(self, head_tile: pygame.Surface, body_tile: pygame.Surface,
+                      interpolation: float = 1.0) -> List[tuple]:
+        """
+        Surface.blits()에 넘길 (타일, 위치) 시퀀스
+
+        Args:
+            head_tile: 머리 타일
+            body_tile: 몸통 타일
+            interpolation: 보간 비율
+        """
+        n = len(self._cells)
+        if n == 0:
+            return []
+        tiles = chain((head_tile,), repeat(body_tile, n - 1))
+        return list(zip(tiles, map(tuple, self.pixel_positions(interpolation).tolist())))
+
+    def fill(self, surface: pygame.Surface, head_color: Tuple[int, int, int],
+             body_color: Tuple[int, int, int], interpolation: float = 1.0) -> Optional[pygame.Rect]:
+        """
+        surfarray로 모든 마디를 한 번에 칠하기 (아주 긴 뱀/큰 보드용)
+
+        Args:
+            surface: 그릴 대상 (8비트 이상, 24비트 제외 - pixels2d 요구사항)
+            head_color: 머리 색상
+            body_color: 몸통 색상
+            interpolation: 보간 비율
+
+        Returns:
+            칠한 영역의 외접 사각형 (마디가 없으면 None)
+        """
+        if len(self._cells) == 0:
+            return None
+        size = self.cell_size
+        width, height = surface.get_size()
+        positions = self.pixel_positions(interpolation)
+        offsets = np.arange(size, dtype=np.int32)
+        xs = np.clip(positions[:, 0, None] + offsets, 0, width - 1)  # (N, size)
+        ys = np.clip(positions[:, 1, None] + offsets, 0, height - 1)
+
+        # 픽셀 포맷으로 변환한 색상 값을 한 번에 써서 채널별 쓰기를 피함
+        colors = np.full(len(positions), surface.map_rgb(body_color), dtype=np.uint32)
+        colors[0] = surface.map_rgb(head_color)
+
+        pixels = pygame.surfarray.pixels2d(surface)
+        try:
+            # 꼬리부터 칠해 머리가 위에 오도록 (blits 순서와 같은 결과)
+            pixels[xs[::-1, :, None], ys[::-1, None, :]] = colors[::-1, None, None]
+        finally:
+            del pixels  # Surface 잠금 해제
+
+        left, top = positions.min(axis=0)
+        right, bottom = positions.max(axis=0) + size
+        return pygame.Rect(int(left), int(top), int(right - left), int(bottom - top)).clip(
+            surface.get_rect())
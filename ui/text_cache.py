@@ -0,0 +1,130 @@
+"""폰트 레지스트리와 렌더링된 텍스트 Surface 캐시 (UI/메뉴/모드/리더보드 공용)"""
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import pygame
+
+
+TEXT_CACHE_SIZE = 512  # 캐시에 보관할 최대 텍스트 Surface 수
+
+_fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+_quit_hook_registered = False
+
+
+def get_font(size: int, face: Optional[str] = None) -> pygame.font.Font:
+    """
+    (글꼴, 크기)별로 한 번만 생성한 폰트 반환
+
+    Args:
+        size: 글자 크기
+        face: 글꼴 파일 경로 (None이면 pygame 기본 글꼴)
+
+    Returns:
+        공유 폰트 객체
+    """
+    global _quit_hook_registered
+    key = (face, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(face, size)
+        _fonts[key] = font
+        if not _quit_hook_registered:
+            # pygame.quit()은 등록된 함수를 한 번 호출한 뒤 목록을 비우므로 매번 다시 등록
+            pygame.register_quit(_clear_on_quit)
+            _quit_hook_registered = True
+    return font
+
+
+class TextCache:
+    """
+    렌더링된 텍스트 Surface의 LRU 캐시
+
+    (폰트, 텍스트, 색상, 안티앨리어싱)이 같으면 다시 렌더링하지 않고 같은
+    Surface를 돌려준다. 반환된 Surface는 공유되므로 수정하지 말고 blit만 한다.
+    """
+
+    def __init__(self, max_entries: int = TEXT_CACHE_SIZE):
+        """
+        텍스트 캐시 초기화
+
+        Args:
+            max_entries: 보관할 최대 Surface 수 (넘으면 가장 오래 안 쓴 것부터 제거)
+        """
+        self.max_entries = max_entries
+        self._surfaces: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def render(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int],
+               antialias: bool = True) -> pygame.Surface:
+        """
+        텍스트 Surface 반환 (캐시에 없으면 렌더링 후 저장)
+
+        Args:
+            font: 폰트 (get_font()로 얻은 공유 폰트 권장)
+            text: 표시할 문자열
+            color: 글자 색상
+            antialias: 안티앨리어싱 여부
+
+        Returns:
+            렌더링된 Surface
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def get_stats(self) -> Dict[str, float]:
+        """캐시 통계 반환 (hits, misses, size, hit_rate)"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._surfaces),
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+    def clear(self) -> None:
+        """캐시 비우기 (통계는 유지)"""
+        self._surfaces.clear()
+
+
+# 프로세스 공용 텍스트 캐시
+text_cache = TextCache()
+
+
+def render_text(text: str, size: int, color: Tuple[int, int, int], antialias: bool = True,
+                face: Optional[str] = None) -> pygame.Surface:
+    """
+    공용 폰트/텍스트 캐시를 사용해 텍스트 렌더링
+
+    Args:
+        text: 표시할 문자열
+        size: 글자 크기
+        color: 글자 색상
+        antialias: 안티앨리어싱 여부
+        face: 글꼴 파일 경로 (None이면 기본 글꼴)
+
+    Returns:
+        렌더링된 Surface (공유되므로 수정 금지)
+    """
+    return text_cache.render(get_font(size, face), text, color, antialias)
+
+
+def _clear_on_quit() -> None:
+    """pygame.quit() 시 폰트/텍스트 캐시 폐기 (종료된 폰트 재사용 방지)"""
+    global _quit_hook_registered
+    _quit_hook_registered = False
+    _fonts.clear()
+    text_cache.clear()